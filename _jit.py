@@ -0,0 +1,30 @@
+"""
+Optional Numba JIT support.
+
+Numba is not a hard dependency: when it is not installed, `njit` becomes a
+no-op decorator and `prange` falls back to `range`, so the plain Python
+path runs unchanged.
+
+Set ESTOL_DISABLE_JIT=1 to take the plain Python path even when Numba is
+installed. Short-lived processes (one sizing run, a CLI call) then skip the
+Numba import and the kernel cache loads, which cost more than they save there.
+"""
+import os
+
+try:
+    if os.environ.get('ESTOL_DISABLE_JIT', '0') not in ('', '0'):
+        raise ImportError("JIT disabled by ESTOL_DISABLE_JIT")
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -1,28 +1,143 @@
-from typing import Dict, List, Tuple, Optional
+import copy
+from typing import Callable, Dict, List, Tuple, Optional, Union
 import numpy as np
 
 from config_loader import load_config, ConfigLoader
 from powertrain import (
     TechnologySpec,
     PowertrainBase,
-    ConventionalPowertrain,
-    ParallelHybridPowertrain,
-    SerialHybridPowertrain,
-    FullyElectricPowertrain,
-    MultiEnginePowertrain,
+    POWERTRAIN_REGISTRY,
+    make_powertrain,
 )
 from dual_motor_powertrain import DualMotorDEPPowertrain
-from mission import MissionSegment, simulate_mission
-from constraints import perform_constraint_analysis
+from mission import (MissionSegment, SegmentBatch, create_mission, create_mission_soa,
+                     simulate_mission, simulate_mission_batch, _prefill_mission_rho,
+                     _profile_to_array)
+from constraints import (ConstraintInputs, make_constraint_fn, perform_constraint_analysis,
+                         perform_constraint_analysis_batch)
+from units import FUEL_ENERGY_WH_PER_LB, KG_TO_LB, LB_TO_N, NM_TO_M
+from _jit import njit
 
 # Global default config (for backward compatibility)
 _default_config = load_config()
 
+# Warm-start table key: (config file, architecture, AR, cruise altitude, Hp profile,
+# payload, range, Hp_design); the first five must match exactly for a blend
+_WarmStartKey = Tuple[str, str, float, float, Tuple[float, ...], float, float, float]
+
+
+def _anderson_TOGW_step(w0, g0, w1, g1, W_min_lb, damping: float = 0.3):
+    """
+    Anderson(m=1) TOGW update from two (guess, g(guess)) pairs, elementwise.
+
+    The weights alpha0 + alpha1 = 1 minimize |alpha0*F0 + alpha1*F1| with residuals
+    F = g(w) - w, which for a scalar TOGW has the closed form alpha0 = F1 / (F1 - F0).
+
+    Falls back to the damped fixed-point step (1-damping)*w1 + damping*g1 where the
+    residuals are (nearly) equal or the accelerated step leaves physical bounds.
+    Works on floats or on NumPy arrays of designs.
+    """
+    damped = (1 - damping) * w1 + damping * g1
+    F0 = g0 - w0
+    F1 = g1 - w1
+    dF = F1 - F0
+    degenerate = np.abs(dF) < 1e-9 * np.abs(w1)
+    alpha0 = F1 / np.where(degenerate, 1.0, dF)
+    TOGW_accel = alpha0 * g0 + (1 - alpha0) * g1
+
+    # Safeguard: must carry at least the payload and stay within 2x of the latest estimate
+    valid = (~degenerate & (TOGW_accel > W_min_lb) &
+             (TOGW_accel > 0.5 * g1) & (TOGW_accel < 2.0 * g1))
+    return np.where(valid, TOGW_accel, damped)
+
+
+def _accelerated_TOGW_update(history: List[Tuple[float, float]], W_min_lb: float,
+                             damping: float = 0.3) -> float:
+    """
+    Next TOGW guess from the (guess, g(guess)) history of the weight iteration.
+
+    Takes the damped fixed-point step on the first iteration, then Anderson
+    mixing of the last two iterates (see _anderson_TOGW_step).
+    """
+    w1, g1 = history[-1]
+    if len(history) < 2:
+        return (1 - damping) * w1 + damping * g1
+    w0, g0 = history[-2]
+    return float(_anderson_TOGW_step(w0, g0, w1, g1, W_min_lb, damping))
+
+
+def _battery_weight_batch(total_battery_Wh: np.ndarray, peak_power_W: np.ndarray,
+                          tech: TechnologySpec) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Battery weight for M designs, sized by the larger of energy and power (C-rate) limits.
+
+    Returns:
+        (W_battery_lb, W_battery_Wh) arrays of length M
+    """
+    if not (tech.battery_specific_energy_Wh_kg > 0 and tech.battery_DOD > 0):
+        zeros = np.zeros_like(total_battery_Wh)
+        return zeros, zeros.copy()
+
+    W_battery_Wh = total_battery_Wh / tech.battery_DOD
+    m_battery_energy_kg = (W_battery_Wh / 1000.0) / (tech.battery_specific_energy_Wh_kg / 1000.0)
+    if tech.battery_specific_power_kW_kg > 0:
+        m_battery_power_kg = (peak_power_W / 1000.0) / tech.battery_specific_power_kW_kg
+    else:
+        m_battery_power_kg = np.zeros_like(peak_power_W)
+    W_battery_lb = np.maximum(m_battery_energy_kg, m_battery_power_kg) * KG_TO_LB
+    return W_battery_lb, W_battery_Wh
+
+
+@njit(cache=True, fastmath=True)
+def _OEW_kernel(TOGW_lb, S_wing_ft2, wing_weight_K, fuselage_weight_K, W_propulsion_lb):
+    """Component empty weights (lb): wing, fuselage, empennage, gear, propulsion, systems."""
+    W_wing_lb = wing_weight_K * (TOGW_lb**0.397) * (S_wing_ft2**0.360)
+    W_fuselage_lb = fuselage_weight_K * TOGW_lb**0.5
+    W_empennage_lb = 0.04 * TOGW_lb
+    W_gear_lb = 0.02 * TOGW_lb
+    W_systems_lb = 0.2 * TOGW_lb
+    return W_wing_lb, W_fuselage_lb, W_empennage_lb, W_gear_lb, W_propulsion_lb, W_systems_lb
+
 class HybridElectricAircraft:
     """
     Complete hybrid-electric aircraft sizing with validated methodology.
     """
 
+    # Every instance attribute must be declared here (no per-instance __dict__)
+    __slots__ = (
+        'name', 'config',
+        # Requirements
+        'W_payload_lb', 'range_nm', 'cruise_speed_kts', 'cruise_alt_ft',
+        # Aerodynamics and weight regression constants
+        'AR', 'e', 'CD0', 'K1', '_N_ult', '_wing_weight_K', '_fuselage_weight_K',
+        'CLmax_clean', 'CLmax_TO', 'CLmax_land',
+        # Distributed electric propulsion
+        'dep_enabled', 'dep_lift_aug_max', 'dep_blown_span_fraction', 'dep_num_motors',
+        'dep_motor_power_kW', '_dep_power_total_kW',
+        'dep_use_for_wing_sizing',
+        # Performance
+        'V_stall_kts', 'BFL_ft', 'LFL_ft', 'ROC_fpm',
+        # Technology and design variables
+        'tech', 'TOGW_lb', 'OEW_lb', 'W_fuel_lb', 'W_battery_lb', 'S_wing_ft2', 'WS_psf',
+        'PW_hp_lb', 'weight_breakdown',
+        # Powertrain and sizing state
+        'powertrain', 'Hp_design', 'hybridization_profile', '_Hp_profile',
+        '_P_shaft_cached_kW', 'iteration_log', '_constraint_inputs', '_constraint_fn',
+        '_constraint_cache', '_atm_cache', '_cruise_cache',
+    )
+
+    # Final evaluated TOGW guess of earlier converged sizings, keyed by _warm_start_key
+    # (config file, architecture, AR, cruise altitude, Hp profile, payload, range,
+    # Hp_design); shared across instances so opted-in sweeps seed each new design from its
+    # neighbours, and an exact repeat re-evaluates the same point
+    _TOGW_WARMSTART: Dict[_WarmStartKey, float] = {}
+    _TOGW_COLD_START_LB = 15000.0
+
+    @classmethod
+    def clear_warm_start(cls):
+        """Drop all recorded warm-start TOGW values (later sizings start cold)."""
+        cls._TOGW_WARMSTART.clear()
+
     def __init__(self, name: str = "eSTOL-19", config_path: str = None):
         self.name = name
 
@@ -45,6 +160,9 @@ class HybridElectricAircraft:
         self.e = config.get('aerodynamics', 'oswald_efficiency')
         self.CD0 = config.get('aerodynamics', 'zero_lift_drag_coefficient')
         self.K1 = 1 / (np.pi * self.AR * self.e)
+        # Weight regression constants, folded once here (refreshed again per sizing)
+        self._N_ult = 3.75
+        self._refresh_weight_coefficients()
         self.CLmax_clean = config.get('aerodynamics', 'CLmax_clean')
         self.CLmax_TO = config.get('aerodynamics', 'CLmax_takeoff')
         self.CLmax_land = config.get('aerodynamics', 'CLmax_landing')
@@ -53,6 +171,9 @@ class HybridElectricAircraft:
         self.dep_lift_aug_max = config.get('dep_system', 'lift_augmentation_factor_max')
         self.dep_blown_span_fraction = config.get('dep_system', 'blown_span_fraction')
         self.dep_num_motors = config.get('dep_system', 'number_of_highlift_motors')
+        self.dep_motor_power_kW = config.get('dep_system', 'motor_power_kW')
+        # High-lift motor draw when blown lift is active (read per segment by the mission sim)
+        self._dep_power_total_kW = self.dep_num_motors * self.dep_motor_power_kW
         self.dep_use_for_wing_sizing = config.get('dep_system', 'use_for_wing_sizing')
         # ===== PERFORMANCE =====
         self.V_stall_kts = config.get('performance_requirements', 'stall_speed_requirement_kts')
@@ -74,9 +195,42 @@ class HybridElectricAircraft:
         self.powertrain: Optional[PowertrainBase] = None
         self.Hp_design = 0.0
         self.hybridization_profile: Optional[Dict[str, float]] = None
+        self._Hp_profile: Optional[np.ndarray] = None  # hybridization_profile ordered by SEGMENT_NAMES
+        # Shaft power the powertrain components were last sized for
+        self._P_shaft_cached_kW: Optional[float] = None
+        # Per-iteration diagnostics from the last size_aircraft call
+        self.iteration_log: List[Dict] = []
+        # Fixed constraint-analysis inputs, rebuilt once per sizing run
+        self._constraint_inputs = self._build_constraint_inputs()
+        # constraint_fn(TOGW) specialized on _constraint_inputs, built on first use
+        self._constraint_fn: Optional[Callable[[float], Tuple[float, float]]] = None
+        # (TOGW, WS_psf, P_shaft_kW) of the last constraint solve
+        self._constraint_cache: Optional[Tuple[float, float, float]] = None
+        # Segment altitude (ft) -> density (slug/ft³), filled by the mission simulators
+        self._atm_cache: Dict[float, float] = {}
+        # Cruise (altitude, speed, range, prop efficiency) -> _cruise_constants tuple
+        self._cruise_cache: Dict[Tuple[float, ...], Tuple[float, float, float, float]] = {}
+
+    def _build_constraint_inputs(self) -> ConstraintInputs:
+        """Snapshot the iteration-invariant inputs to perform_constraint_analysis"""
+        return ConstraintInputs.from_config(
+            self.config,
+            V_stall_kts=self.V_stall_kts,
+            BFL_ft=self.BFL_ft,
+            LFL_ft=self.LFL_ft,
+            CLmax_clean=self.CLmax_clean,
+            CLmax_TO=self.CLmax_TO,
+            CLmax_land=self.CLmax_land,
+            CD0=self.CD0,
+            K1=self.K1,
+            cruise_speed_kts=self.cruise_speed_kts,
+            cruise_alt_ft=self.cruise_alt_ft,
+            prop_efficiency=self.tech.prop_efficiency,
+        )
 
     def set_powertrain(self, architecture: str, Hp_design: float = 0.0,
-                      hybridization_profile: Optional[Dict[str, float]] = None):
+                      hybridization_profile: Optional[Dict[str, float]] = None,
+                      verbose: bool = True):
         """
         Set powertrain architecture and hybridization strategy.
 
@@ -86,44 +240,43 @@ class HybridElectricAircraft:
             Hp_design: Single hybridization ratio for all high-power segments (backward compatible)
             hybridization_profile: Per-segment hybridization ratios (overrides Hp_design if provided)
                                   Example: {'takeoff': 0.7, 'climb': 0.4, 'cruise': 0.0, 'landing': 0.5}
+            verbose: Print the selected powertrain and hybridization profile
 
         Note: For component sizing, the maximum Hp across all segments is used.
         """
-        arch_map = {
-            'conventional': ConventionalPowertrain,
-            'parallel': ParallelHybridPowertrain,
-            'serial': SerialHybridPowertrain,
-            'electric': FullyElectricPowertrain,
-            'dual_motor_dep': DualMotorDEPPowertrain,
-            'multi_engine': MultiEnginePowertrain,
-        }
-        if architecture.lower() not in arch_map:
+        arch = architecture.lower()
+        if arch != 'dual_motor_dep' and arch not in POWERTRAIN_REGISTRY:
             raise ValueError(f"Unknown architecture: {architecture}")
 
         # Special handling for architectures requiring extra config parameters
-        if architecture.lower() == 'dual_motor_dep':
+        if arch == 'dual_motor_dep':
             self.powertrain = DualMotorDEPPowertrain(self.tech, self.config.config)
-        elif architecture.lower() == 'multi_engine':
+        elif arch == 'multi_engine':
             num_engines = self.config.get('propulsion', 'number_of_engines')
-            self.powertrain = MultiEnginePowertrain(self.tech, num_engines)
+            self.powertrain = make_powertrain(arch, self.tech, num_engines=num_engines)
         else:
-            self.powertrain = arch_map[architecture.lower()](self.tech)
+            self.powertrain = make_powertrain(arch, self.tech)
+        self._P_shaft_cached_kW = None
 
         # Store hybridization profile if provided, otherwise use simple Hp_design
         if hybridization_profile is not None:
             self.hybridization_profile = hybridization_profile
+            self._Hp_profile = _profile_to_array(hybridization_profile)
             # For component sizing, use maximum Hp across all segments
             max_Hp = max(hybridization_profile.values())
             self.Hp_design = max_Hp
-            print(f"✓ Powertrain set: {self.powertrain.name}")
-            print(f"  Hybridization profile:")
-            for segment, hp in sorted(hybridization_profile.items()):
-                print(f"    {segment:10s}: Hp = {hp:.2f}")
-            print(f"  Component sizing based on max Hp = {max_Hp:.2f}")
+            if verbose:
+                print(f"✓ Powertrain set: {self.powertrain.name}")
+                print(f"  Hybridization profile:")
+                for segment, hp in sorted(hybridization_profile.items()):
+                    print(f"    {segment:10s}: Hp = {hp:.2f}")
+                print(f"  Component sizing based on max Hp = {max_Hp:.2f}")
         else:
             self.Hp_design = Hp_design
             self.hybridization_profile = None
-            print(f"✓ Powertrain set: {self.powertrain.name} (Hp = {Hp_design:.2f})")
+            self._Hp_profile = None
+            if verbose:
+                print(f"✓ Powertrain set: {self.powertrain.name} (Hp = {Hp_design:.2f})")
 
     def get_lift_augmentation_factor(self, blown_lift_active: bool) -> float:
         """
@@ -154,87 +307,79 @@ class HybridElectricAircraft:
 
         return augmentation_factor
 
-    def create_mission(self, hybridization_profile: Dict[str, float],
-                      blown_lift_profile: Dict[str, bool] = None) -> List[MissionSegment]:
+    def create_mission(self, hybridization_profile: Union[Dict[str, float], np.ndarray],
+                      blown_lift_profile: Union[Dict[str, bool], np.ndarray] = None) -> np.ndarray:
         """
         Create mission profile with segment-specific hybridization and blown lift control
 
         Args:
-            hybridization_profile: Dict mapping segment names to hybridization ratios (0.0-1.0)
-            blown_lift_profile: Dict mapping segment names to blown lift active status (True/False)
+            hybridization_profile: Dict mapping segment names to hybridization ratios (0.0-1.0),
+                                   or an array ordered by SEGMENT_NAMES
+            blown_lift_profile: Dict mapping segment names to blown lift active status (True/False),
+                               or a bool array ordered by SEGMENT_NAMES
                                If None, defaults to True for takeoff/landing, False for cruise
         """
-        if blown_lift_profile is None:
-            # Default: blown lift active for low-speed segments, off for cruise
-            blown_lift_profile = {
-                'takeoff': True,
-                'climb': True,
-                'cruise': False,
-                'descent': False,
-                'loiter': False,
-                'landing': True,
-            }
-
-        segments = [
-            MissionSegment('takeoff', 0, 35,
-                          hybridization_profile.get('takeoff', 0.0),
-                          blown_lift_profile.get('takeoff', False)),
-            MissionSegment('climb', 35, self.cruise_alt_ft,
-                          hybridization_profile.get('climb', 0.0),
-                          blown_lift_profile.get('climb', False)),
-            MissionSegment('cruise', self.cruise_alt_ft, self.cruise_alt_ft,
-                          hybridization_profile.get('cruise', 0.0),
-                          blown_lift_profile.get('cruise', False)),
-            MissionSegment('descent', self.cruise_alt_ft, 450,
-                          hybridization_profile.get('descent', 0.0),
-                          blown_lift_profile.get('descent', False)),
-            MissionSegment('loiter', 450, 450,
-                          hybridization_profile.get('loiter', 0.0),
-                          blown_lift_profile.get('loiter', False)),
-            MissionSegment('landing', 450, 0,
-                          hybridization_profile.get('landing', 0.0),
-                          blown_lift_profile.get('landing', False)),
-        ]
-        return segments
-
-    def simulate_mission(self, segments: List[MissionSegment], TOGW_lb: float,
+        return create_mission(self, hybridization_profile, blown_lift_profile)
+
+    def create_mission_soa(self, hybridization_profile: Union[Dict[str, float], np.ndarray],
+                           blown_lift_profile: Union[Dict[str, bool], np.ndarray] = None) -> SegmentBatch:
+        return create_mission_soa(self, hybridization_profile, blown_lift_profile)
+
+    def simulate_mission(self, segments: Union[np.ndarray, List[MissionSegment]], TOGW_lb: float,
                          S_wing_ft2: float) -> Dict:
         return simulate_mission(self, segments, TOGW_lb, S_wing_ft2)
 
-    def constraint_analysis(self, TOGW_lb: float) -> Tuple[float, float]:
-        # Calculate blown lift augmentation factor if wing sizing uses it
-        blown_lift_aug = 1.0
-        use_blown_sizing = False
+    def simulate_mission_batch(self, segments: Union[SegmentBatch, np.ndarray, List[MissionSegment]],
+                               TOGW_lb: np.ndarray, S_wing_ft2: np.ndarray,
+                               dtype=np.float64) -> Dict:
+        return simulate_mission_batch(self, segments, TOGW_lb, S_wing_ft2, dtype)
+
+    def _blown_lift_sizing(self) -> Tuple[float, bool]:
+        """Blown lift augmentation factor for wing sizing, and whether it applies"""
         if self.dep_enabled and self.dep_use_for_wing_sizing:
-            blown_lift_aug = self.get_lift_augmentation_factor(blown_lift_active=True)
-            use_blown_sizing = True
+            return self.get_lift_augmentation_factor(blown_lift_active=True), True
+        return 1.0, False
 
-        return perform_constraint_analysis(
-            TOGW_lb=TOGW_lb,
-            V_stall_kts=self.V_stall_kts,
-            BFL_ft=self.BFL_ft,
-            LFL_ft=self.LFL_ft,
-            CLmax_clean=self.CLmax_clean,
-            CLmax_TO=self.CLmax_TO,
-            CLmax_land=self.CLmax_land,
-            CD0=self.CD0,
-            K1=self.K1,
-            cruise_speed_kts=self.cruise_speed_kts,
-            cruise_alt_ft=self.cruise_alt_ft,
-            prop_efficiency=self.tech.prop_efficiency,
-            config=self.config,
-            blown_lift_augmentation=blown_lift_aug,
-            use_blown_lift_sizing=use_blown_sizing,
-        )
+    def constraint_analysis(self, TOGW_lb: float, verbose: bool = False) -> Tuple[float, float]:
+        blown_lift_aug, use_blown_sizing = self._blown_lift_sizing()
+        return perform_constraint_analysis(TOGW_lb, blown_lift_aug, use_blown_sizing,
+                                           self._constraint_inputs, verbose)
+
+    def _constraints_at(self, TOGW_lb: float, reuse: bool = True) -> Tuple[float, float, bool]:
+        """
+        Constraint analysis result for TOGW_lb, reusing the last solve when TOGW has moved
+        less than 1% since then.
+
+        Design wing loading does not depend on TOGW and every T/W requirement is a fixed
+        ratio, so the cached shaft power is scaled linearly to the new TOGW.
+
+        Returns:
+            WS_psf, P_shaft_kW, and whether the cached solve was reused
+        """
+        cache = self._constraint_cache
+        if reuse and cache is not None and abs(TOGW_lb - cache[0]) / cache[0] < 0.01:
+            TOGW_prev_lb, WS_psf, P_shaft_kW = cache
+            return WS_psf, P_shaft_kW * (TOGW_lb / TOGW_prev_lb), True
+
+        if self._constraint_fn is None:
+            self._constraint_fn = make_constraint_fn(self._constraint_inputs,
+                                                     *self._blown_lift_sizing())
+        WS_psf, P_shaft_kW = self._constraint_fn(TOGW_lb)
+        self._constraint_cache = (TOGW_lb, WS_psf, P_shaft_kW)
+        return WS_psf, P_shaft_kW, False
+
+    def _refresh_weight_coefficients(self):
+        """Fold the constant factors of the wing and fuselage weight regressions (AR, N_ult)"""
+        self._wing_weight_K = 0.04674 * (self._N_ult**0.397) * (self.AR**1.712)
+        self._fuselage_weight_K = 0.23 * 100
 
     def calculate_OEW(self, TOGW_lb: float, S_wing_ft2: float) -> float:
-        N_ult = 3.75
-        W_wing_lb = 0.04674 * (TOGW_lb**0.397) * (S_wing_ft2**0.360) * (N_ult**0.397) * (self.AR**1.712)
-        W_fuselage_lb = 0.23 * TOGW_lb**0.5 * 100
-        W_empennage_lb = 0.04 * TOGW_lb
-        W_gear_lb = 0.02 * TOGW_lb
-        W_propulsion_lb = self.powertrain.get_total_propulsion_weight()
-        W_systems_lb = 0.2 * TOGW_lb
+        (W_wing_lb, W_fuselage_lb, W_empennage_lb,
+         W_gear_lb, W_propulsion_lb, W_systems_lb) = _OEW_kernel(
+            float(TOGW_lb), float(S_wing_ft2), self._wing_weight_K, self._fuselage_weight_K,
+            float(self.powertrain.get_total_propulsion_weight()))
+        OEW_lb = (W_wing_lb + W_fuselage_lb + W_empennage_lb
+                  + W_gear_lb + W_propulsion_lb + W_systems_lb)
 
         breakdown = {
             'wing': W_wing_lb,
@@ -245,118 +390,282 @@ class HybridElectricAircraft:
             'systems': W_systems_lb,
         }
         self.weight_breakdown = breakdown
-        OEW_lb = sum(breakdown.values())
         return OEW_lb
 
+    def evaluate_sizing_point(self, TOGW_guess_lb: float,
+                              hybridization_profile: Union[Dict[str, float], np.ndarray],
+                              reuse_constraints: bool = True,
+                              reuse_components: bool = True) -> Dict:
+        """
+        One pass of the weight iteration: the fixed-point map TOGW -> TOGW_new.
+
+        Runs constraint analysis, component sizing, OEW estimation, mission
+        simulation and battery sizing for the guessed TOGW.
+
+        With reuse_components, component sizing is skipped while P_shaft stays within
+        0.5% of the power the components were last sized for; this relies on
+        powertrain.size_components being idempotent for a given (P_shaft, Hp_design).
+        With reuse_constraints, the constraint analysis itself is skipped while TOGW
+        stays within 1% of the last solve (see _constraints_at). The returned
+        'components_reused' / 'constraints_reused' flags say whether either shortcut
+        was taken, so a converged result can be re-evaluated without them.
+
+        Returns:
+            Dict with the new TOGW estimate and all intermediate sizing quantities
+        """
+        WS_psf, P_shaft_kW, constraints_reused = self._constraints_at(TOGW_guess_lb,
+                                                                      reuse_constraints)
+        S_wing_ft2 = TOGW_guess_lb / WS_psf
+
+        if (not reuse_components or self._P_shaft_cached_kW is None or
+                abs(P_shaft_kW - self._P_shaft_cached_kW) / max(P_shaft_kW, 1e-9) > 5e-3):
+            self.powertrain.size_components(P_shaft_kW, self.Hp_design)
+            self._P_shaft_cached_kW = P_shaft_kW
+        components_reused = P_shaft_kW != self._P_shaft_cached_kW
+
+        OEW_lb = self.calculate_OEW(TOGW_guess_lb, S_wing_ft2)
+        segments = self.create_mission(hybridization_profile)
+        mission_results = self.simulate_mission(segments, TOGW_guess_lb, S_wing_ft2)
+
+        W_fuel_lb = mission_results['total_fuel_lb'] * 1.06
+
+        # ===== BATTERY SIZING WITH C-RATE CONSTRAINT =====
+        # Size battery for both ENERGY and POWER requirements (take max)
+        # Skip if no battery system (battery_specific_energy == 0)
+
+        if self.tech.battery_specific_energy_Wh_kg > 0 and self.tech.battery_DOD > 0:
+            # Energy requirement (existing calculation)
+            W_battery_Wh = mission_results['total_battery_Wh'] / self.tech.battery_DOD
+            W_battery_kWh = W_battery_Wh / 1000.0
+            m_battery_energy_kg = W_battery_kWh / (self.tech.battery_specific_energy_Wh_kg / 1000.0)
+
+            # Power requirement (NEW: c-rate constraint)
+            # Calculate peak battery power across all segments
+            # Average power during each segment (zero for segments with no duration)
+            time_sec_arr = mission_results['time_sec_arr']
+            seg_power_W = np.divide(mission_results['battery_Wh_arr'], time_sec_arr / 3600,
+                                    out=np.zeros_like(time_sec_arr), where=time_sec_arr > 0)
+            idx = int(np.argmax(seg_power_W))
+            max_battery_power_W = max(float(seg_power_W[idx]), 0.0)
+            max_power_segment = str(mission_results['name_arr'][idx]) if max_battery_power_W > 0 else ""
+
+            max_battery_power_kW = max_battery_power_W / 1000.0
+
+            if self.tech.battery_specific_power_kW_kg > 0:
+                m_battery_power_kg = max_battery_power_kW / self.tech.battery_specific_power_kW_kg
+            else:
+                m_battery_power_kg = 0.0
+
+            # Take the larger of energy-limited or power-limited sizing
+            m_battery_kg = max(m_battery_energy_kg, m_battery_power_kg)
+            W_battery_lb = m_battery_kg * KG_TO_LB
+
+            # Calculate actual c-rate for reporting
+            c_rate_actual = max_battery_power_kW / W_battery_kWh if W_battery_kWh > 0 else 0.0
+            c_rate_max = self.tech.battery_specific_power_kW_kg / (self.tech.battery_specific_energy_Wh_kg / 1000.0) if self.tech.battery_specific_energy_Wh_kg > 0 else 0.0
+
+            # Determine which constraint is active
+            sizing_constraint = "POWER" if m_battery_power_kg > m_battery_energy_kg else "energy"
+        else:
+            # No battery system
+            W_battery_lb = 0.0
+            W_battery_Wh = 0.0
+            W_battery_kWh = 0.0
+            max_battery_power_kW = 0.0
+            max_power_segment = "N/A"
+            c_rate_actual = 0.0
+            c_rate_max = 0.0
+            sizing_constraint = "N/A"
+
+        TOGW_new_lb = OEW_lb + self.W_payload_lb + W_fuel_lb + W_battery_lb
+
+        return {
+            'TOGW_new_lb': TOGW_new_lb,
+            'OEW_lb': OEW_lb,
+            'W_fuel_lb': W_fuel_lb,
+            'W_battery_lb': W_battery_lb,
+            'W_battery_Wh': W_battery_Wh,
+            'W_battery_kWh': W_battery_kWh,
+            'S_wing_ft2': S_wing_ft2,
+            'mission_results': mission_results,
+            'max_battery_power_kW': max_battery_power_kW,
+            'max_power_segment': max_power_segment,
+            'c_rate_actual': c_rate_actual,
+            'c_rate_max': c_rate_max,
+            'sizing_constraint': sizing_constraint,
+            'WS_design_psf': WS_psf,
+            'P_shaft_kW': P_shaft_kW,
+            'constraints_reused': constraints_reused,
+            'components_reused': components_reused,
+        }
+
+    def _resolve_hybridization_profile(self, hybridization_profile: Optional[Dict]) -> Dict:
+        """Use profile from parameter, else from set_powertrain, else the default profile"""
+        if hybridization_profile is not None:
+            return hybridization_profile
+        if self.hybridization_profile is not None:
+            # Use profile set in set_powertrain()
+            return self.hybridization_profile
+        # Default hybridization profile optimized for power-assist hybrid
+        # Cruise Hp = 0.0 for optimal efficiency (all fuel, no battery draw)
+        # High-power phases use Hp_design for battery assist
+        return {
+            'takeoff': self.Hp_design,
+            'climb': self.Hp_design,
+            'cruise': 0.0,  # CRITICAL: Cruise on fuel only for optimal efficiency
+            'descent': 0.0,
+            'loiter': 0.0,
+            'landing': self.Hp_design,
+        }
+
+    def _warm_start_key(self, Hp_profile: np.ndarray) -> _WarmStartKey:
+        return (self.config.config_path, self.powertrain.name, round(self.AR, 3),
+                round(self.cruise_alt_ft, 0), tuple(np.round(Hp_profile, 3).tolist()),
+                round(self.W_payload_lb, -1), round(self.range_nm, -1), round(self.Hp_design, 2))
+
+    def _warm_start_TOGW(self, key: _WarmStartKey) -> float:
+        """
+        Initial TOGW guess from previously converged designs.
+
+        Uses the stored guess on an exact key match, otherwise an inverse-distance weighted
+        blend of designs with the same config, architecture, AR, cruise altitude and Hp
+        profile within ±10% payload and range (and ±0.1 Hp).
+        Falls back to the cold-start guess when nothing is close.
+        """
+        table = self._TOGW_WARMSTART
+        if key in table:
+            return table[key]
+
+        design, (payload, range_nm, Hp) = key[:5], key[5:]
+        weights = []
+        values = []
+        for k, TOGW in table.items():
+            if k[:5] != design:
+                continue
+            k_payload, k_range, k_Hp = k[5:]
+            d_payload = abs(k_payload - payload) / max(payload, 1.0)
+            d_range = abs(k_range - range_nm) / max(range_nm, 1.0)
+            d_Hp = abs(k_Hp - Hp)
+            if d_payload <= 0.1 and d_range <= 0.1 and d_Hp <= 0.1:
+                weights.append(1.0 / (d_payload + d_range + d_Hp))
+                values.append(TOGW)
+        if not weights:
+            return self._TOGW_COLD_START_LB
+        return float(np.dot(weights, values) / np.sum(weights))
+
     def size_aircraft(self, max_iterations: int = 100, tolerance: float = 0.01,
-                      hybridization_profile: Optional[Dict] = None) -> Dict:
+                      hybridization_profile: Optional[Dict] = None,
+                      verbose: bool = True, warm_start: bool = False) -> Dict:
+        """
+        Size the aircraft by iterating TOGW to convergence.
+
+        Args:
+            verbose: Print the sizing header, per-iteration progress and final summary.
+                     Per-iteration diagnostics are always collected in self.iteration_log
+                     and returned as results['iteration_log'].
+            warm_start: Seed the iteration from earlier converged designs of the same
+                        config, architecture, AR, cruise altitude and Hp profile (see
+                        _warm_start_TOGW) instead of the fixed 15000 lb guess. Off by
+                        default: a loosely converged answer then depends on what was sized
+                        before it. Converged results are recorded either way.
+        """
         if self.powertrain is None:
             raise ValueError("Must set powertrain before sizing")
 
-        # Use profile from set_powertrain if available, otherwise use parameter or create default
-        if hybridization_profile is None:
-            if self.hybridization_profile is not None:
-                # Use profile set in set_powertrain()
-                hybridization_profile = self.hybridization_profile
-            else:
-                # Default hybridization profile optimized for power-assist hybrid
-                # Cruise Hp = 0.0 for optimal efficiency (all fuel, no battery draw)
-                # High-power phases use Hp_design for battery assist
-                hybridization_profile = {
-                    'takeoff': self.Hp_design,
-                    'climb': self.Hp_design,
-                    'cruise': 0.0,  # CRITICAL: Cruise on fuel only for optimal efficiency
-                    'descent': 0.0,
-                    'loiter': 0.0,
-                    'landing': self.Hp_design,
-                }
-
-        print(f"\n{'='*70}")
-        print(f"SIZING: {self.name} - {self.powertrain.name}")
-        print(f"{'='*70}")
-        print(f"Payload:    {self.W_payload_lb:.0f} lb")
-        print(f"Range:      {self.range_nm:.0f} nm")
-        print(f"Cruise:     {self.cruise_speed_kts:.0f} kts at {self.cruise_alt_ft:.0f} ft")
-
-        TOGW_guess_lb = 15000
+        hybridization_profile = self._resolve_hybridization_profile(hybridization_profile)
+        # Per-segment Hp in SEGMENT_NAMES order, built once rather than looked up every iteration
+        if hybridization_profile is self.hybridization_profile:
+            Hp_profile = self._Hp_profile
+        else:
+            Hp_profile = _profile_to_array(hybridization_profile)
+
+        if verbose:
+            print(f"\n{'='*70}")
+            print(f"SIZING: {self.name} - {self.powertrain.name}")
+            print(f"{'='*70}")
+            print(f"Payload:    {self.W_payload_lb:.0f} lb")
+            print(f"Range:      {self.range_nm:.0f} nm")
+            print(f"Cruise:     {self.cruise_speed_kts:.0f} kts at {self.cruise_alt_ft:.0f} ft")
+
+        warm_start_key = self._warm_start_key(Hp_profile)
+        if warm_start:
+            TOGW_guess_lb = self._warm_start_TOGW(warm_start_key)
+        else:
+            TOGW_guess_lb = self._TOGW_COLD_START_LB
+        self._P_shaft_cached_kW = None  # Hp_design may have changed since the last sizing
+        # Picks up any aircraft attributes edited since construction
+        self._refresh_weight_coefficients()
+        self._dep_power_total_kW = self.dep_num_motors * self.dep_motor_power_kW
+        self._constraint_inputs = self._build_constraint_inputs()
+        self._constraint_fn = None
+        self._constraint_cache = None
+        _prefill_mission_rho(self, [self.cruise_alt_ft])
+        # (guess, g(guess)) pairs of the fixed-point map, used for Anderson acceleration
+        TOGW_history: List[Tuple[float, float]] = []
+        self.iteration_log = []
 
         for iteration in range(max_iterations):
-            WS_psf, P_shaft_kW = self.constraint_analysis(TOGW_guess_lb)
-            S_wing_ft2 = TOGW_guess_lb / WS_psf
-
-            self.powertrain.size_components(P_shaft_kW, self.Hp_design)
-
-            OEW_lb = self.calculate_OEW(TOGW_guess_lb, S_wing_ft2)
-            segments = self.create_mission(hybridization_profile)
-            mission_results = self.simulate_mission(segments, TOGW_guess_lb, S_wing_ft2)
-
-            W_fuel_lb = mission_results['total_fuel_lb'] * 1.06
-
-            # ===== BATTERY SIZING WITH C-RATE CONSTRAINT =====
-            # Size battery for both ENERGY and POWER requirements (take max)
-            # Skip if no battery system (battery_specific_energy == 0)
-
-            if self.tech.battery_specific_energy_Wh_kg > 0 and self.tech.battery_DOD > 0:
-                # Energy requirement (existing calculation)
-                W_battery_Wh = mission_results['total_battery_Wh'] / self.tech.battery_DOD
-                W_battery_kWh = W_battery_Wh / 1000.0
-                m_battery_energy_kg = W_battery_kWh / (self.tech.battery_specific_energy_Wh_kg / 1000.0)
-
-                # Power requirement (NEW: c-rate constraint)
-                # Calculate peak battery power across all segments
-                max_battery_power_W = 0.0
-                max_power_segment = ""
-                for seg in mission_results['segments']:
-                    if seg.time_sec > 0:
-                        # Average power during segment
-                        seg_power_W = (seg.battery_Wh / (seg.time_sec / 3600))
-                        if seg_power_W > max_battery_power_W:
-                            max_battery_power_W = seg_power_W
-                            max_power_segment = seg.name
-
-                max_battery_power_kW = max_battery_power_W / 1000.0
-
-                if self.tech.battery_specific_power_kW_kg > 0:
-                    m_battery_power_kg = max_battery_power_kW / self.tech.battery_specific_power_kW_kg
-                else:
-                    m_battery_power_kg = 0.0
-
-                # Take the larger of energy-limited or power-limited sizing
-                m_battery_kg = max(m_battery_energy_kg, m_battery_power_kg)
-                W_battery_lb = m_battery_kg * 2.20462
-
-                # Calculate actual c-rate for reporting
-                c_rate_actual = max_battery_power_kW / W_battery_kWh if W_battery_kWh > 0 else 0.0
-                c_rate_max = self.tech.battery_specific_power_kW_kg / (self.tech.battery_specific_energy_Wh_kg / 1000.0) if self.tech.battery_specific_energy_Wh_kg > 0 else 0.0
-
-                # Determine which constraint is active
-                sizing_constraint = "POWER" if m_battery_power_kg > m_battery_energy_kg else "energy"
-            else:
-                # No battery system
-                W_battery_lb = 0.0
-                W_battery_Wh = 0.0
-                W_battery_kWh = 0.0
-                max_battery_power_kW = 0.0
-                max_power_segment = "N/A"
-                c_rate_actual = 0.0
-                c_rate_max = 0.0
-                sizing_constraint = "N/A"
-
-            TOGW_new_lb = OEW_lb + self.W_payload_lb + W_fuel_lb + W_battery_lb
+            point = self.evaluate_sizing_point(TOGW_guess_lb, Hp_profile)
+            TOGW_new_lb = point['TOGW_new_lb']
             error = abs(TOGW_new_lb - TOGW_guess_lb) / TOGW_guess_lb
 
-            print(f"  Iter {iteration+1:2d}: TOGW = {TOGW_new_lb:7.0f} lb, "
-                  f"OEW = {OEW_lb:7.0f} lb, Fuel = {W_fuel_lb:6.0f} lb, "
-                  f"Battery = {W_battery_lb:6.0f} lb ({sizing_constraint}), "
-                  f"C-rate = {c_rate_actual:.2f}C, Error = {error:.4f}")
+            if error < tolerance and (point['constraints_reused'] or
+                                      point['components_reused']):
+                # The reported design must come from a fresh constraint solve and from
+                # components sized at the converged P_shaft; re-evaluate without the
+                # shortcuts unless a fresh solve confirms both
+                constraints_fresh = not point['constraints_reused']
+                if not constraints_fresh:
+                    WS_fresh, P_fresh, _ = self._constraints_at(TOGW_guess_lb, reuse=False)
+                    constraints_fresh = (
+                        np.isclose(WS_fresh, point['WS_design_psf'], rtol=1e-9) and
+                        np.isclose(P_fresh, point['P_shaft_kW'], rtol=1e-9))
+                if not constraints_fresh or point['components_reused']:
+                    point = self.evaluate_sizing_point(TOGW_guess_lb, Hp_profile,
+                                                       reuse_constraints=constraints_fresh,
+                                                       reuse_components=False)
+                    TOGW_new_lb = point['TOGW_new_lb']
+                    error = abs(TOGW_new_lb - TOGW_guess_lb) / TOGW_guess_lb
+
+            self.iteration_log.append({
+                'iter': iteration + 1,
+                'TOGW': TOGW_new_lb,
+                'OEW': point['OEW_lb'],
+                'fuel': point['W_fuel_lb'],
+                'battery': point['W_battery_lb'],
+                'c_rate': point['c_rate_actual'],
+                'error': error,
+            })
+            if verbose:
+                print(f"  Iter {iteration+1:2d}: TOGW = {TOGW_new_lb:7.0f} lb, "
+                      f"OEW = {point['OEW_lb']:7.0f} lb, Fuel = {point['W_fuel_lb']:6.0f} lb, "
+                      f"Battery = {point['W_battery_lb']:6.0f} lb ({point['sizing_constraint']}), "
+                      f"C-rate = {point['c_rate_actual']:.2f}C, Error = {error:.4f}")
 
             if error < tolerance:
-                print(f"  ✓ Converged in {iteration+1} iterations!")
+                if verbose:
+                    print(f"  ✓ Converged in {iteration+1} iterations!")
+                self._TOGW_WARMSTART[warm_start_key] = TOGW_guess_lb
                 break
 
-            TOGW_guess_lb = 0.7 * TOGW_guess_lb + 0.3 * TOGW_new_lb
+            TOGW_history.append((TOGW_guess_lb, TOGW_new_lb))
+            TOGW_guess_lb = _accelerated_TOGW_update(TOGW_history, self.W_payload_lb)
         else:
-            print(f"  ⚠ Did not converge in {max_iterations} iterations")
+            if verbose:
+                print(f"  ⚠ Did not converge in {max_iterations} iterations")
+
+        OEW_lb = point['OEW_lb']
+        W_fuel_lb = point['W_fuel_lb']
+        W_battery_lb = point['W_battery_lb']
+        W_battery_Wh = point['W_battery_Wh']
+        W_battery_kWh = point['W_battery_kWh']
+        S_wing_ft2 = point['S_wing_ft2']
+        mission_results = point['mission_results']
+        max_battery_power_kW = point['max_battery_power_kW']
+        max_power_segment = point['max_power_segment']
+        c_rate_actual = point['c_rate_actual']
+        c_rate_max = point['c_rate_max']
+        sizing_constraint = point['sizing_constraint']
 
         self.TOGW_lb = TOGW_new_lb
         self.OEW_lb = OEW_lb
@@ -369,10 +678,10 @@ class HybridElectricAircraft:
         battery_fraction = W_battery_lb / TOGW_new_lb
         payload_fraction = self.W_payload_lb / TOGW_new_lb
 
-        E_fuel_Wh = W_fuel_lb * 0.453592 * 43000 / 3.6
+        E_fuel_Wh = W_fuel_lb * FUEL_ENERGY_WH_PER_LB
         E_battery_Wh = W_battery_Wh
         E_total_Wh = E_fuel_Wh + E_battery_Wh
-        PREE = (self.W_payload_lb * 4.44822) * (self.range_nm * 1852) / E_total_Wh
+        PREE = (self.W_payload_lb * LB_TO_N) * (self.range_nm * NM_TO_M) / E_total_Wh
 
         results = {
             'TOGW_lb': TOGW_new_lb,
@@ -393,32 +702,197 @@ class HybridElectricAircraft:
             'battery_sizing_constraint': sizing_constraint,
             'battery_peak_power_kW': max_battery_power_kW,
             'battery_peak_segment': max_power_segment,
+            'iteration_log': self.iteration_log,
         }
 
-        print(f"\n{'='*70}")
-        print(f"FINAL SIZING RESULTS")
-        print(f"{'='*70}")
-        print(f"TOGW:           {TOGW_new_lb:8.0f} lb")
-        print(f"OEW:            {OEW_lb:8.0f} lb ({OEW_lb/TOGW_new_lb*100:.1f}%)")
-        print(f"Payload:        {self.W_payload_lb:8.0f} lb ({payload_fraction*100:.1f}%)")
-        print(f"Fuel:           {W_fuel_lb:8.0f} lb ({fuel_fraction*100:.1f}%)")
-        print(f"Battery:        {W_battery_lb:8.0f} lb ({battery_fraction*100:.1f}%)")
-        print(f"")
-        print(f"Wing Area:      {S_wing_ft2:8.1f} ft²")
-        print(f"Wing Loading:   {self.WS_psf:8.1f} lb/ft²")
-        print(f"")
-        print(f"GT Power:       {self.powertrain.P_GT_kW:8.1f} kW ({self.powertrain.m_GT_lb:.0f} lb)")
-        print(f"EM Power:       {self.powertrain.P_EM_kW:8.1f} kW ({self.powertrain.m_EM_lb:.0f} lb)")
-        if self.powertrain.P_GEN_kW > 0:
-            print(f"GEN Power:      {self.powertrain.P_GEN_kW:8.1f} kW ({self.powertrain.m_GEN_lb:.0f} lb)")
-        print(f"")
-        print(f"Battery Energy: {W_battery_kWh:8.1f} kWh")
-        print(f"Battery Power:  {max_battery_power_kW:8.1f} kW (peak in {max_power_segment})")
-        print(f"Battery C-rate: {c_rate_actual:8.2f}C (max: {c_rate_max:.2f}C)")
-        print(f"Sizing Driver:  {sizing_constraint.upper()}")
-        print(f"")
-        print(f"PREE:           {PREE:8.3f}")
-        print(f"Mission Time:   {results['mission_time_min']:8.1f} min")
-        print(f"{'='*70}\n")
+        if verbose:
+            # Constraint breakdown at the final evaluated point
+            self.constraint_analysis(TOGW_guess_lb, verbose=True)
+            print(f"\n{'='*70}")
+            print(f"FINAL SIZING RESULTS")
+            print(f"{'='*70}")
+            print(f"TOGW:           {TOGW_new_lb:8.0f} lb")
+            print(f"OEW:            {OEW_lb:8.0f} lb ({OEW_lb/TOGW_new_lb*100:.1f}%)")
+            print(f"Payload:        {self.W_payload_lb:8.0f} lb ({payload_fraction*100:.1f}%)")
+            print(f"Fuel:           {W_fuel_lb:8.0f} lb ({fuel_fraction*100:.1f}%)")
+            print(f"Battery:        {W_battery_lb:8.0f} lb ({battery_fraction*100:.1f}%)")
+            print(f"")
+            print(f"Wing Area:      {S_wing_ft2:8.1f} ft²")
+            print(f"Wing Loading:   {self.WS_psf:8.1f} lb/ft²")
+            print(f"")
+            print(f"GT Power:       {self.powertrain.P_GT_kW:8.1f} kW ({self.powertrain.m_GT_lb:.0f} lb)")
+            print(f"EM Power:       {self.powertrain.P_EM_kW:8.1f} kW ({self.powertrain.m_EM_lb:.0f} lb)")
+            if self.powertrain.P_GEN_kW > 0:
+                print(f"GEN Power:      {self.powertrain.P_GEN_kW:8.1f} kW ({self.powertrain.m_GEN_lb:.0f} lb)")
+            print(f"")
+            print(f"Battery Energy: {W_battery_kWh:8.1f} kWh")
+            print(f"Battery Power:  {max_battery_power_kW:8.1f} kW (peak in {max_power_segment})")
+            print(f"Battery C-rate: {c_rate_actual:8.2f}C (max: {c_rate_max:.2f}C)")
+            print(f"Sizing Driver:  {sizing_constraint.upper()}")
+            print(f"")
+            print(f"PREE:           {PREE:8.3f}")
+            print(f"Mission Time:   {results['mission_time_min']:8.1f} min")
+            print(f"{'='*70}\n")
 
         return results
+
+    def _design_variant(self, AR: float, Hp_design: float,
+                        cruise_alt_ft: float) -> 'HybridElectricAircraft':
+        """Shallow copy of this aircraft with its own powertrain and swept design variables"""
+        variant = copy.copy(self)
+        variant.powertrain = copy.deepcopy(self.powertrain)
+        variant.AR = AR
+        variant.K1 = 1 / (np.pi * AR * self.e)
+        variant._refresh_weight_coefficients()
+        variant.Hp_design = Hp_design
+        variant.cruise_alt_ft = cruise_alt_ft
+        variant._P_shaft_cached_kW = None
+        variant._constraint_inputs = variant._build_constraint_inputs()
+        variant._constraint_fn = None
+        variant._constraint_cache = None
+        return variant
+
+    def size_aircraft_batch(self, AR=None, Hp_design=None, cruise_alt_ft=None,
+                            max_iterations: int = 100, tolerance: float = 0.01,
+                            hybridization_profile: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+        """
+        Size a sweep of M candidate designs at once.
+
+        Args:
+            AR, Hp_design, cruise_alt_ft: Swept design variables (scalars or length-M arrays,
+                                          broadcast together; None keeps this aircraft's value)
+            max_iterations, tolerance: As for size_aircraft, applied per design
+            hybridization_profile: As for size_aircraft (default profile follows each Hp_design)
+
+        The weight iteration runs array-valued over all designs, with per-design convergence
+        masks; only unconverged designs are re-evaluated. Component sizing and mission
+        simulation still run per design, while the constraint analysis and the OEW, battery
+        and TOGW update arithmetic are vectorized over the sweep.
+
+        Returns:
+            Dict of length-M arrays (TOGW_lb, OEW_lb, W_fuel_lb, W_battery_lb, S_wing_ft2,
+            WS_psf, fuel/battery/payload fractions, PREE, converged, iterations)
+        """
+        if self.powertrain is None:
+            raise ValueError("Must set powertrain before sizing")
+
+        AR_arr, Hp_arr, alt_arr = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(self.AR if AR is None else AR, dtype=float)),
+            np.atleast_1d(np.asarray(self.Hp_design if Hp_design is None else Hp_design, dtype=float)),
+            np.atleast_1d(np.asarray(self.cruise_alt_ft if cruise_alt_ft is None else cruise_alt_ft,
+                                     dtype=float)),
+        )
+        M = AR_arr.size
+        designs = [self._design_variant(float(AR_arr[i]), float(Hp_arr[i]), float(alt_arr[i]))
+                   for i in range(M)]
+        # (M, 6) per-design Hp profiles in SEGMENT_NAMES order
+        Hp_profiles = np.array([_profile_to_array(d._resolve_hybridization_profile(hybridization_profile))
+                                for d in designs])
+        wing_weight_K = np.array([d._wing_weight_K for d in designs])
+        K1_arr = np.array([d.K1 for d in designs])
+        blown_lift_aug, use_blown_sizing = self._blown_lift_sizing()
+        constraint_inputs = self._build_constraint_inputs()
+        # The variants share this aircraft's density cache: fill it for the whole sweep at once
+        _prefill_mission_rho(self, alt_arr.tolist())
+
+        TOGW_guess_lb = np.full(M, self._TOGW_COLD_START_LB)
+        TOGW_new_lb = np.zeros(M)
+        OEW_lb = np.zeros(M)
+        W_battery_lb = np.zeros(M)
+        W_battery_Wh = np.zeros(M)
+        TOGW_prev_lb = np.zeros(M)
+        TOGW_prev_new_lb = np.zeros(M)
+        S_wing_ft2 = np.zeros(M)
+        W_propulsion_lb = np.zeros(M)
+        total_fuel_lb = np.zeros(M)
+        total_battery_Wh = np.zeros(M)
+        peak_power_W = np.zeros(M)
+        mission_time_sec = np.zeros(M)
+        error = np.full(M, np.inf)
+        iterations = np.zeros(M, dtype=int)
+        not_converged = np.ones(M, dtype=bool)
+        # Designs whose components were last sized for a different P_shaft (the 0.5% skip)
+        components_reused = np.zeros(M, dtype=bool)
+        force_resize = np.zeros(M, dtype=bool)
+
+        for iteration in range(max_iterations):
+            active = np.flatnonzero(not_converged)
+            WS_active, P_shaft_active = perform_constraint_analysis_batch(
+                TOGW_guess_lb[active], blown_lift_aug, use_blown_sizing, constraint_inputs,
+                K1=K1_arr[active], cruise_alt_ft=alt_arr[active])
+            S_wing_ft2[active] = TOGW_guess_lb[active] / WS_active
+
+            # Per-design disciplines: component sizing, mission
+            for i, P_shaft_kW in zip(active, P_shaft_active.tolist()):
+                d = designs[i]
+                if (force_resize[i] or d._P_shaft_cached_kW is None or
+                        abs(P_shaft_kW - d._P_shaft_cached_kW) / max(P_shaft_kW, 1e-9) > 5e-3):
+                    d.powertrain.size_components(P_shaft_kW, d.Hp_design)
+                    d._P_shaft_cached_kW = P_shaft_kW
+                components_reused[i] = P_shaft_kW != d._P_shaft_cached_kW
+                W_propulsion_lb[i] = d.powertrain.get_total_propulsion_weight()
+
+                mission_results = d.simulate_mission(d.create_mission(Hp_profiles[i]),
+                                                     TOGW_guess_lb[i], S_wing_ft2[i])
+                total_fuel_lb[i] = mission_results['total_fuel_lb']
+                total_battery_Wh[i] = mission_results['total_battery_Wh']
+                mission_time_sec[i] = mission_results['total_time_sec']
+                time_sec_arr = mission_results['time_sec_arr']
+                seg_power_W = np.divide(mission_results['battery_Wh_arr'], time_sec_arr / 3600,
+                                        out=np.zeros_like(time_sec_arr), where=time_sec_arr > 0)
+                peak_power_W[i] = max(seg_power_W.max(), 0.0)
+
+            # Vectorized weight arithmetic over the active designs
+            weights = _OEW_kernel(TOGW_guess_lb[active], S_wing_ft2[active], wing_weight_K[active],
+                                  self._fuselage_weight_K, W_propulsion_lb[active])
+            OEW_lb[active] = sum(weights)
+            W_battery_lb[active], W_battery_Wh[active] = _battery_weight_batch(
+                total_battery_Wh[active], peak_power_W[active], self.tech)
+            TOGW_new_lb[active] = (OEW_lb[active] + self.W_payload_lb +
+                                   total_fuel_lb[active] * 1.06 + W_battery_lb[active])
+            error[active] = np.abs(TOGW_new_lb[active] - TOGW_guess_lb[active]) / TOGW_guess_lb[active]
+            iterations[active] = iteration + 1
+
+            not_converged = error >= tolerance
+            # Designs that converged on stale components get one more evaluation at the
+            # same TOGW with components sized at their final P_shaft
+            force_resize = ~not_converged & components_reused
+            if not (not_converged | force_resize).any():
+                break
+
+            # TOGW update: damped step on the first pass, Anderson mixing afterwards
+            update = not_converged.copy()
+            not_converged |= force_resize
+            if iteration == 0:
+                TOGW_next_lb = 0.7 * TOGW_guess_lb + 0.3 * TOGW_new_lb
+            else:
+                TOGW_next_lb = _anderson_TOGW_step(TOGW_prev_lb, TOGW_prev_new_lb,
+                                                   TOGW_guess_lb, TOGW_new_lb, self.W_payload_lb)
+            TOGW_prev_lb[update] = TOGW_guess_lb[update]
+            TOGW_prev_new_lb[update] = TOGW_new_lb[update]
+            TOGW_guess_lb[update] = TOGW_next_lb[update]
+
+        # Final quantities at each design's last evaluated point
+        W_fuel_lb = total_fuel_lb * 1.06
+        E_fuel_Wh = W_fuel_lb * FUEL_ENERGY_WH_PER_LB
+        E_total_Wh = E_fuel_Wh + W_battery_Wh
+        PREE = (self.W_payload_lb * LB_TO_N) * (self.range_nm * NM_TO_M) / E_total_Wh
+
+        return {
+            'AR': AR_arr.copy(),
+            'Hp_design': Hp_arr.copy(),
+            'cruise_alt_ft': alt_arr.copy(),
+            'TOGW_lb': TOGW_new_lb,
+            'OEW_lb': OEW_lb,
+            'W_fuel_lb': W_fuel_lb,
+            'W_battery_lb': W_battery_lb,
+            'S_wing_ft2': S_wing_ft2,
+            'WS_psf': TOGW_new_lb / S_wing_ft2,
+            'fuel_fraction': W_fuel_lb / TOGW_new_lb,
+            'battery_fraction': W_battery_lb / TOGW_new_lb,
+            'payload_fraction': self.W_payload_lb / TOGW_new_lb,
+            'PREE': PREE,
+            'mission_time_min': mission_time_sec / 60,
+            'converged': error < tolerance,
+            'iterations': iterations,
+        }
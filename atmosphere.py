@@ -1,20 +1,73 @@
-from typing import Tuple
+import math
+from functools import lru_cache
+from typing import Tuple, Union
 import numpy as np
 
-def atmosisa(altitude_m: float) -> Tuple[float, float, float, float]:
-    """
-    International Standard Atmosphere (ISA) model.
-    Returns (T [K], P [Pa], rho [kg/m³], a [m/s]).
-    """
-    T0, P0, g, R = 288.15, 101325, 9.80665, 287.05
+ArrayLike = Union[float, np.ndarray]
+
+# ISA constants
+T0, P0, g, R = 288.15, 101325, 9.80665, 287.05
+L = -0.0065
+T11, P11 = 216.65, 22632.1
+
+@lru_cache(maxsize=256)
+def _atmosisa_scalar(altitude_m: float) -> Tuple[float, float, float, float]:
+    """Single-altitude ISA using math (no ufunc dispatch); mission altitudes repeat, so cache"""
     if altitude_m <= 11000:
-        L = -0.0065
         T = T0 + L * altitude_m
         P = P0 * (T / T0) ** (-g / (L * R))
     else:
-        T11, P11 = 216.65, 22632.1
         T = T11
-        P = P11 * np.exp(-g * (altitude_m - 11000) / (R * T))
+        P = P11 * math.exp(-g * (altitude_m - 11000) / (R * T))
+    rho = P / (R * T)
+    a = math.sqrt(1.4 * R * T)
+    return T, P, rho, a
+
+def atmosisa(altitude_m: ArrayLike) -> Tuple[ArrayLike, ArrayLike, ArrayLike, ArrayLike]:
+    """
+    International Standard Atmosphere (ISA) model.
+    Returns (T [K], P [Pa], rho [kg/m³], a [m/s]).
+
+    Accepts a scalar altitude (returns Python floats) or an array of altitudes
+    (returns arrays of the same shape, both layers evaluated in one pass).
+    """
+    if np.isscalar(altitude_m):
+        return _atmosisa_scalar(float(altitude_m))
+
+    h = np.asarray(altitude_m, dtype=float)
+    troposphere = h <= 11000
+    T = np.where(troposphere, T0 + L * h, T11)
+    P = np.where(troposphere,
+                 P0 * (T / T0) ** (-g / (L * R)),
+                 P11 * np.exp(-g * (h - 11000) / (R * T11)))
     rho = P / (R * T)
     a = np.sqrt(1.4 * R * T)
     return T, P, rho, a
+
+# ISA density table, 0-20 km at 2 m spacing, built once at import (kg/m³); the mission
+# and constraint density lookups both interpolate in it
+_H_TABLE_M = np.linspace(0.0, 20000.0, 10001)
+_DH_M = _H_TABLE_M[1] - _H_TABLE_M[0]
+_RHO_TABLE = atmosisa(_H_TABLE_M)[2]
+_RHO_TABLE_LIST = _RHO_TABLE.tolist()  # plain floats for scalar indexing
+
+def isa_density(altitude_m: float) -> float:
+    """ISA density (kg/m³) by linear interpolation in the density table (exact ISA outside it)"""
+    x = altitude_m / _DH_M
+    if not 0.0 <= x < len(_RHO_TABLE_LIST) - 1:  # also catches NaN
+        return _atmosisa_scalar(float(altitude_m))[2]
+    i = int(x)
+    rho_0 = _RHO_TABLE_LIST[i]
+    return rho_0 + (_RHO_TABLE_LIST[i + 1] - rho_0) * (x - i)
+
+def isa_density_vec(altitude_m: np.ndarray) -> np.ndarray:
+    """isa_density over an array of altitudes (same arithmetic, so bit-identical per element)"""
+    h = np.asarray(altitude_m, dtype=float)
+    x = h / _DH_M
+    outside = ~((x >= 0.0) & (x < len(_RHO_TABLE) - 1))  # also catches NaN
+    i = np.where(outside, 0, x).astype(np.intp)
+    rho_0 = _RHO_TABLE[i]
+    rho = np.asarray(rho_0 + (_RHO_TABLE[i + 1] - rho_0) * (x - i))
+    for k in np.flatnonzero(outside):
+        rho.flat[k] = isa_density(float(h.flat[k]))
+    return rho
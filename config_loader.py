@@ -5,14 +5,40 @@ This module provides utilities to load and access configuration parameters
 from the config.json file, providing a clean interface for all Python scripts.
 """
 
-import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from dataclasses import dataclass
 
+# orjson parses several times faster; fall back to the stdlib when it is not installed
+try:
+    import orjson as _json
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json as _json
+    ORJSON_AVAILABLE = False
+
+# Parsed config files keyed by (absolute path, mtime_ns). Private: every loader gets its
+# own copy, so edits through .config or get_section() never leak into other loaders.
+_PARSE_CACHE: Dict[Tuple[str, int], Dict] = {}
+
+
+def _copy_json(value: Any) -> Any:
+    """Deep copy of parsed JSON (dicts, lists, scalars); ~3x faster than copy.deepcopy"""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
 
 class ConfigLoader:
-    """Load and access configuration parameters from config.json"""
+    """
+    Load and access configuration parameters from config.json
+
+    get() reads values live from .config through an index of its sections, so in-place
+    edits of .config / get_section() dicts are seen. Replacing or adding a whole section
+    dict is not tracked by the index: do that through update().
+    """
 
     def __init__(self, config_path: str = None):
         """
@@ -30,19 +56,48 @@ class ConfigLoader:
 
         self.config_path = config_path
         self.config = self._load_config()
+        self._sections = self._index_sections(self.config)
+        # Bumped on every in-memory change so derived caches can detect staleness
+        self.version = 0
 
     def _load_config(self) -> Dict:
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file (parsed once per file version, copied per loader)"""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            path = os.path.abspath(self.config_path)
+            key = (path, os.stat(path).st_mtime_ns)
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                return _copy_json(cached)
+            with open(path, 'rb') as f:
+                config = _json.loads(f.read())
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_path}\n"
                 "Please ensure config.json exists in the same directory."
             )
-        except json.JSONDecodeError as e:
+        except _json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
+        _PARSE_CACHE[key] = _copy_json(config)
+        return config
+
+    @staticmethod
+    def _index_sections(config: Dict) -> Dict[Tuple[str, ...], Dict]:
+        """
+        Index every (sub)section dict of the nested config by its key path
+
+        Only the section dicts are indexed, never leaf values, so get() always
+        reads the current value from its section.
+        """
+        sections: Dict[Tuple[str, ...], Dict] = {(): config}
+        stack = [((), config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                if isinstance(value, dict):
+                    path = prefix + (key,)
+                    sections[path] = value
+                    stack.append((path, value))
+        return sections
 
     def get(self, *keys, default=None) -> Any:
         """
@@ -65,13 +120,12 @@ class ConfigLoader:
         >>> AR = config.get('aerodynamics', 'aspect_ratio')
         >>> battery_energy = config.get('hybrid_system', 'battery', 'specific_energy_Wh_kg')
         """
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        if not keys:
+            return self.config
+        section = self._sections.get(keys[:-1])
+        if section is None:
+            return default
+        return section.get(keys[-1], default)
 
     def get_section(self, section: str) -> Dict:
         """
@@ -91,6 +145,8 @@ class ConfigLoader:
     def reload(self):
         """Reload configuration from file"""
         self.config = self._load_config()
+        self._sections = self._index_sections(self.config)
+        self.version += 1
 
     def save(self, config_path: str = None):
         """
@@ -102,8 +158,12 @@ class ConfigLoader:
             Path to save config. If None, uses original path.
         """
         save_path = config_path or self.config_path
-        with open(save_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(save_path, 'wb') as f:
+                f.write(_json.dumps(self.config, option=_json.OPT_INDENT_2))
+        else:
+            with open(save_path, 'w') as f:
+                _json.dump(self.config, f, indent=2)
 
     def update(self, *keys, value):
         """
@@ -124,9 +184,11 @@ class ConfigLoader:
         for key in keys[:-1]:
             d = d.setdefault(key, {})
         d[keys[-1]] = value
+        self._sections = self._index_sections(self.config)
+        self.version += 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TechnologySpec:
     """
     Component technology specifications
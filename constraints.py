@@ -1,36 +1,254 @@
-from typing import Tuple
+import math
+from dataclasses import dataclass
+from typing import Callable, Tuple
 import numpy as np
 
-from atmosphere import atmosisa
+from atmosphere import isa_density, isa_density_vec
+from _jit import njit
 
-def perform_constraint_analysis(
-    TOGW_lb: float,
-    V_stall_kts: float,
-    BFL_ft: float,
-    LFL_ft: float,
-    CLmax_clean: float,
-    CLmax_TO: float,
-    CLmax_land: float,
-    CD0: float,
-    K1: float,
-    cruise_speed_kts: float,
-    cruise_alt_ft: float,
-    prop_efficiency: float,
-    config,
+# Unit conversions
+_FT_TO_M = 0.3048
+_KTS_TO_FPS = 1.688
+_KG_M3_PER_SLUG_FT3 = 515.379
+_HP_TO_KW = 0.7457
+_FTLB_S_PER_HP = 550.0
+_S_PER_MIN = 60.0
+
+# Constraint model constants (folded into the njit kernel as compile-time globals)
+_RHO_SL_SLUG_FT3 = 0.002377     # sea-level density
+_SIGMA_SL = 1.0                 # density ratio for takeoff / landing
+_LAND_TO_TO_WEIGHT_RATIO = 0.95
+_LFL_OBSTACLE_FT = 600.0        # landing field length: LFL = 80 * WS / (sigma * CLmax) + 600
+_LFL_SLOPE = 80.0
+_TOP_PER_BFL_FT = 1.0 / 37.5    # takeoff parameter per ft of balanced field length
+_KS_CLIMB = 1.2                 # climb speed / stall speed
+_GAMMA_CLIMB_OEI = 0.024
+_GAMMA_CLIMB_AEO = 0.05
+_CEILING_WS_PSF = 60.0          # wing loading used for the ceiling climb speed
+_ALPHA_CEILING = 0.50           # thrust lapse at the service ceiling
+_ALPHA_CRUISE = 0.75            # thrust lapse at cruise
+_BETA_CRUISE = 1.0              # cruise weight fraction
+_TO_POWER_MARGIN = 1.15         # takeoff speed / stall speed for the takeoff power
+
+# Constraint order shared by the T/W and power arrays in _constraint_core
+_CONSTRAINT_NAMES = ('Takeoff', 'OEI Climb', 'AEO Climb', 'Service Ceiling', 'Cruise')
+
+@dataclass(frozen=True, slots=True)
+class ConstraintInputs:
+    """Aircraft and requirement values that stay fixed across sizing iterations"""
+    V_stall_kts: float
+    BFL_ft: float
+    LFL_ft: float
+    CLmax_clean: float
+    CLmax_TO: float
+    CLmax_land: float
+    CD0: float
+    K1: float
+    cruise_speed_kts: float
+    cruise_alt_ft: float
+    prop_efficiency: float
+    # Read from config once rather than on every call
+    N_engines: int
+    ROC_ceiling_fpm: float
+    service_ceiling_ft: float
+
+    @classmethod
+    def from_config(cls, config, **aircraft_values) -> 'ConstraintInputs':
+        """
+        Fill the config-derived fields; aircraft values are passed as keywords.
+
+        Everything is converted to plain int/float once here (JSON integers such as
+        V_stall_kts = 74 would otherwise reach the kernel as ints on every call).
+        """
+        return cls(
+            N_engines=int(config.get('propulsion', 'number_of_engines')),
+            ROC_ceiling_fpm=float(config.get('performance_requirements', 'rate_of_climb_ceiling_fpm')),
+            service_ceiling_ft=float(config.get('mission_requirements', 'service_ceiling_ft')),
+            **{key: float(value) for key, value in aircraft_values.items()},
+        )
+
+@njit(cache=True)
+def _constraint_core(TOGW_lb, V_stall_kts, BFL_ft, LFL_ft, CLmax_clean_eff, CLmax_TO_eff,
+                     CLmax_land_eff, CD0, K1, V_cruise_fps, rho_cruise_slug, rho_ceiling_slug,
+                     ROC_ceiling_fps, N_engines, prop_efficiency):
+    """
+    Numerical core of the constraint analysis (floats in, floats out).
+
+    Returns:
+        (WS_stall_max, WS_landing_max_TO, WS_design,
+         TW_takeoff, TW_climb_OEI, TW_climb_AEO, TW_ceiling, TW_cruise, TW_required, L_D_cruise,
+         P_takeoff_HP, P_climb_OEI_HP, P_climb_AEO_HP, P_ceiling_HP, P_cruise_HP, P_shaft_HP,
+         tw_idx, power_idx), where tw_idx and power_idx index _CONSTRAINT_NAMES
+    """
+    V_stall_fps = V_stall_kts * _KTS_TO_FPS
+    V_stall_fps_sq = V_stall_fps * V_stall_fps
+
+    # 1. Stall speed constraint
+    WS_stall_max = 0.5 * _RHO_SL_SLUG_FT3 * V_stall_fps_sq * CLmax_clean_eff
+
+    # 2. Landing constraint
+    WS_landing_max = (LFL_ft - _LFL_OBSTACLE_FT) * _SIGMA_SL * CLmax_land_eff / _LFL_SLOPE
+    WS_landing_max_TO = WS_landing_max / _LAND_TO_TO_WEIGHT_RATIO
+
+    # 3. Takeoff constraint
+    TOP = BFL_ft * _TOP_PER_BFL_FT
+
+    # 4. Climb constraints
+    ks_climb_sq = _KS_CLIMB * _KS_CLIMB
+    CL_climb = CLmax_clean_eff / ks_climb_sq
+    CD_climb = CD0 + K1 * CL_climb * CL_climb
+    # Drag-to-weight in the climb, shared by the OEI and AEO requirements
+    D_W_climb = (ks_climb_sq / CLmax_clean_eff) * CD_climb
+
+    T_W_climb_OEI_req = D_W_climb + _GAMMA_CLIMB_OEI
+    OEI_factor = N_engines / (N_engines - 1)
+    TW_climb_OEI = OEI_factor * T_W_climb_OEI_req
+
+    TW_climb_AEO = D_W_climb + _GAMMA_CLIMB_AEO
+
+    # 5. Service ceiling constraint
+    V_climb_ceiling = math.sqrt(2 * _CEILING_WS_PSF / (rho_ceiling_slug * CLmax_clean_eff))
+    T_W_ceiling_req = ROC_ceiling_fps / V_climb_ceiling + 2 * math.sqrt(CD0 * K1)
+    TW_ceiling = T_W_ceiling_req / _ALPHA_CEILING
+
+    # 6. Cruise constraint
+    q_cruise = 0.5 * rho_cruise_slug * V_cruise_fps * V_cruise_fps
+
+    # Design WS from stall and landing
+    WS_design = min(WS_stall_max, WS_landing_max_TO)
+
+    TW_takeoff = WS_design / (_SIGMA_SL * CLmax_TO_eff * TOP)
+
+    # Cruise lift coefficient: W / (q·S) with S = W / WS_design reduces to WS_design / q
+    CL_cruise = WS_design / q_cruise
+    CD_cruise = CD0 + K1 * CL_cruise * CL_cruise
+    L_D_cruise = CL_cruise / CD_cruise
+    TW_cruise = (_BETA_CRUISE / _ALPHA_CRUISE) * (1.0 / L_D_cruise)
+
+    TW_arr = np.array([TW_takeoff, TW_climb_OEI, TW_climb_AEO, TW_ceiling, TW_cruise])
+    tw_idx = np.argmax(TW_arr)
+    TW_required = TW_arr[tw_idx]
+
+    # Convert T/W to power
+    V_climb_fps = _KS_CLIMB * V_stall_fps
+
+    hp_denom = _FTLB_S_PER_HP * prop_efficiency
+    P_takeoff_HP = (TW_takeoff * TOGW_lb) * _TO_POWER_MARGIN * V_stall_fps / hp_denom
+    P_climb_OEI_HP = (TW_climb_OEI * TOGW_lb) * V_climb_fps / hp_denom
+    P_climb_AEO_HP = (TW_climb_AEO * TOGW_lb) * V_climb_fps / hp_denom
+    P_ceiling_HP = (TW_ceiling * TOGW_lb) * V_climb_ceiling / hp_denom
+    P_cruise_HP = (TW_cruise * TOGW_lb) * V_cruise_fps / hp_denom
+
+    # Single pass gives both the sizing power and which constraint set it
+    P_arr = np.array([P_takeoff_HP, P_climb_OEI_HP, P_climb_AEO_HP, P_ceiling_HP, P_cruise_HP])
+    power_idx = np.argmax(P_arr)
+    P_shaft_HP = P_arr[power_idx]
+
+    return (WS_stall_max, WS_landing_max_TO, WS_design,
+            TW_takeoff, TW_climb_OEI, TW_climb_AEO, TW_ceiling, TW_cruise, TW_required, L_D_cruise,
+            P_takeoff_HP, P_climb_OEI_HP, P_climb_AEO_HP, P_ceiling_HP, P_cruise_HP, P_shaft_HP,
+            tw_idx, power_idx)
+
+@njit(cache=True)
+def _constraint_core_batch(TOGW_lb, V_stall_kts, BFL_ft, LFL_ft, CLmax_clean_eff, CLmax_TO_eff,
+                           CLmax_land_eff, CD0, K1, V_cruise_fps, rho_cruise_slug, rho_ceiling_slug,
+                           ROC_ceiling_fps, N_engines, prop_efficiency):
+    """_constraint_core over equal-length 1-D arrays; returns (WS_design, P_shaft_HP) arrays"""
+    n = TOGW_lb.shape[0]
+    WS_design = np.empty(n)
+    P_shaft_HP = np.empty(n)
+    for i in range(n):
+        result = _constraint_core(TOGW_lb[i], V_stall_kts[i], BFL_ft[i], LFL_ft[i],
+                                  CLmax_clean_eff[i], CLmax_TO_eff[i], CLmax_land_eff[i],
+                                  CD0[i], K1[i], V_cruise_fps[i], rho_cruise_slug[i],
+                                  rho_ceiling_slug[i], ROC_ceiling_fps[i], N_engines[i],
+                                  prop_efficiency[i])
+        WS_design[i] = result[2]
+        P_shaft_HP[i] = result[15]
+    return WS_design, P_shaft_HP
+
+def make_constraint_fn(
+    inputs: ConstraintInputs,
     blown_lift_augmentation: float = 1.0,
     use_blown_lift_sizing: bool = False,
+) -> Callable[[float], Tuple[float, float]]:
+    """
+    Specialize the constraint analysis on everything except TOGW.
+
+    The blown-lift CLmax values, the ceiling and cruise densities, and the unit
+    conversions are evaluated once here, so each call of the returned function
+    goes straight to _constraint_core.
+
+    Args:
+        inputs: Fixed aircraft/requirement values
+        blown_lift_augmentation: Lift augmentation factor from blown lift (1.0 = no augmentation)
+        use_blown_lift_sizing: If True, apply blown lift augmentation to CLmax for wing sizing
+
+    Returns:
+        constraint_fn(TOGW_lb) -> (WS_design, P_shaft_kW), same values as
+        perform_constraint_analysis for the same arguments.
+    """
+    if use_blown_lift_sizing:
+        CLmax_clean_eff = inputs.CLmax_clean * blown_lift_augmentation
+        CLmax_TO_eff = inputs.CLmax_TO * blown_lift_augmentation
+        CLmax_land_eff = inputs.CLmax_land * blown_lift_augmentation
+    else:
+        CLmax_clean_eff = inputs.CLmax_clean
+        CLmax_TO_eff = inputs.CLmax_TO
+        CLmax_land_eff = inputs.CLmax_land
+
+    rho_ceiling_slug = (isa_density(inputs.service_ceiling_ft * _FT_TO_M)
+                        / _KG_M3_PER_SLUG_FT3)
+    rho_cruise_slug = (isa_density(inputs.cruise_alt_ft * _FT_TO_M)
+                       / _KG_M3_PER_SLUG_FT3)
+    fixed_args = (inputs.V_stall_kts, inputs.BFL_ft, inputs.LFL_ft,
+                  CLmax_clean_eff, CLmax_TO_eff, CLmax_land_eff, inputs.CD0, inputs.K1,
+                  inputs.cruise_speed_kts * _KTS_TO_FPS, rho_cruise_slug, rho_ceiling_slug,
+                  inputs.ROC_ceiling_fpm / _S_PER_MIN, float(inputs.N_engines),
+                  inputs.prop_efficiency)
+
+    def constraint_fn(TOGW_lb: float) -> Tuple[float, float]:
+        result = _constraint_core(float(TOGW_lb), *fixed_args)
+        return result[2], result[15] * _HP_TO_KW
+
+    return constraint_fn
+
+def perform_constraint_analysis(
+    TOGW_lb: float,
+    blown_lift_augmentation: float,
+    use_blown_lift_sizing: bool,
+    inputs: ConstraintInputs,
+    verbose: bool = False,
 ) -> Tuple[float, float]:
     """
     Standalone constraint analysis with optional blown lift wing sizing.
 
     Args:
+        TOGW_lb: Current takeoff gross weight estimate
         blown_lift_augmentation: Lift augmentation factor from blown lift (1.0 = no augmentation)
         use_blown_lift_sizing: If True, apply blown lift augmentation to CLmax for wing sizing
                                This enables smaller wing area optimized for cruise
+        inputs: Fixed aircraft/requirement values (built once per aircraft)
+        verbose: Print the wing loading, T/W and power breakdown
 
     Returns:
         WS_design (lb/ft²), P_shaft_kW (total for all engines).
     """
+    V_stall_kts = inputs.V_stall_kts
+    BFL_ft = inputs.BFL_ft
+    LFL_ft = inputs.LFL_ft
+    CLmax_clean = inputs.CLmax_clean
+    CLmax_TO = inputs.CLmax_TO
+    CLmax_land = inputs.CLmax_land
+    CD0 = inputs.CD0
+    K1 = inputs.K1
+    prop_efficiency = inputs.prop_efficiency
+    N_engines = inputs.N_engines
+    ROC_ceiling_fpm = inputs.ROC_ceiling_fpm
+    service_ceiling_ft = inputs.service_ceiling_ft
+    cruise_alt_ft = inputs.cruise_alt_ft
+    cruise_speed_kts = inputs.cruise_speed_kts
+
     # Apply blown lift augmentation to CLmax values if enabled
     if use_blown_lift_sizing:
         CLmax_clean_eff = CLmax_clean * blown_lift_augmentation
@@ -40,135 +258,114 @@ def perform_constraint_analysis(
         CLmax_clean_eff = CLmax_clean
         CLmax_TO_eff = CLmax_TO
         CLmax_land_eff = CLmax_land
-    rho_SL = 0.002377  # slug/ft³ at sea level
-    V_stall_fps = V_stall_kts * 1.688
-    N_engines = config.get('propulsion', 'number_of_engines')
 
-    # 1. Stall speed constraint
-    WS_stall_max = 0.5 * rho_SL * V_stall_fps**2 * CLmax_clean_eff
+    # Atmosphere at the ceiling and cruise altitudes (table lookups, outside the kernel)
+    h_ceiling_m = service_ceiling_ft * _FT_TO_M
+    rho_ceiling_slug = isa_density(h_ceiling_m) / _KG_M3_PER_SLUG_FT3
+    h_cruise_m = cruise_alt_ft * _FT_TO_M
+    rho_cruise_slug = isa_density(h_cruise_m) / _KG_M3_PER_SLUG_FT3
+    V_cruise_fps = cruise_speed_kts * _KTS_TO_FPS
 
-    # 2. Landing constraint
-    W_land_ratio = 0.95
-    sigma_SL = 1.0
-    WS_landing_max = (LFL_ft - 600) * sigma_SL * CLmax_land_eff / 80
-    WS_landing_max_TO = WS_landing_max / W_land_ratio
+    (WS_stall_max, WS_landing_max_TO, WS_design,
+     TW_takeoff, TW_climb_OEI, TW_climb_AEO, TW_ceiling, TW_cruise, TW_required, L_D_cruise,
+     P_takeoff_HP, P_climb_OEI_HP, P_climb_AEO_HP, P_ceiling_HP, P_cruise_HP,
+     P_shaft_HP, tw_idx, power_idx) = _constraint_core(
+        float(TOGW_lb), V_stall_kts, BFL_ft, LFL_ft, CLmax_clean_eff, CLmax_TO_eff, CLmax_land_eff,
+        CD0, K1, V_cruise_fps, rho_cruise_slug, rho_ceiling_slug, ROC_ceiling_fpm / _S_PER_MIN,
+        float(N_engines), prop_efficiency)
 
-    # 3. Takeoff constraint
-    TOP = BFL_ft / 37.5
+    P_shaft_kW = P_shaft_HP * _HP_TO_KW
 
-    # 4. Climb constraints
-    ks_climb = 1.2
-    CL_climb = CLmax_clean_eff / ks_climb**2
-    CD_climb = CD0 + K1 * CL_climb**2
+    if verbose:
+        # Sizing constraints (for printing only)
+        sizing_constraint = _CONSTRAINT_NAMES[int(tw_idx)]
+        sizing_constraint_power = _CONSTRAINT_NAMES[int(power_idx)]
 
-    gamma_climb_OEI = 0.024
-    T_W_climb_OEI_req = (ks_climb**2 / CLmax_clean_eff) * CD_climb + gamma_climb_OEI
-    OEI_factor = N_engines / (N_engines - 1)
-    TW_climb_OEI = OEI_factor * T_W_climb_OEI_req
-
-    gamma_climb_AEO = 0.05
-    T_W_climb_AEO_req = (ks_climb**2 / CLmax_clean_eff) * CD_climb + gamma_climb_AEO
-    TW_climb_AEO = T_W_climb_AEO_req
-
-    # 5. Service ceiling constraint
-    ROC_ceiling_fpm = config.get('performance_requirements', 'rate_of_climb_ceiling_fpm')
-    ROC_ceiling_fps = ROC_ceiling_fpm / 60
-
-    h_ceiling_m = config.get('mission_requirements', 'service_ceiling_ft') * 0.3048
-    _, _, rho_ceiling_kg_m3, _ = atmosisa(h_ceiling_m)
-    rho_ceiling_slug = rho_ceiling_kg_m3 / 515.379
-
-    alpha_ceiling = 0.50
-    V_climb_ceiling = np.sqrt(2 * 60 / (rho_ceiling_slug * CLmax_clean_eff))
-    T_W_ceiling_req = ROC_ceiling_fps / V_climb_ceiling + 2 * np.sqrt(CD0 * K1)
-    TW_ceiling = (1.0 / alpha_ceiling) * T_W_ceiling_req
+        T_total_lb = TW_required * TOGW_lb
 
-    # 6. Cruise constraint
-    h_cruise_m = cruise_alt_ft * 0.3048
-    _, _, rho_cruise_kg_m3, _ = atmosisa(h_cruise_m)
-    rho_cruise_slug = rho_cruise_kg_m3 / 515.379
-    V_cruise_fps = cruise_speed_kts * 1.688
-
-    alpha_cruise = 0.75
-    beta_cruise = 1.0
-    q_cruise = 0.5 * rho_cruise_slug * V_cruise_fps**2
-
-    # Design WS from stall and landing
-    WS_design = min(WS_stall_max, WS_landing_max_TO)
+        rule = '=' * 70
+        lines = ["", rule, "CONSTRAINT ANALYSIS RESULTS"]
+        if use_blown_lift_sizing:
+            lines.append(f"  (Using Blown Lift Wing Sizing - Augmentation: {blown_lift_augmentation:.3f}x)")
+        lines.append(rule)
+        if use_blown_lift_sizing:
+            lines += [
+                "Effective CLmax (with blown lift):",
+                f"  CLmax_clean:   {CLmax_clean:.2f} → {CLmax_clean_eff:.2f}",
+                f"  CLmax_takeoff: {CLmax_TO:.2f} → {CLmax_TO_eff:.2f}",
+                f"  CLmax_landing: {CLmax_land:.2f} → {CLmax_land_eff:.2f}",
+                "",
+            ]
+        lines += [
+            "Wing Loading Limits:",
+            f"  Stall speed (V_stall = {V_stall_kts:g} kts):  {WS_stall_max:6.1f} lb/ft²",
+            f"  Landing (LFL = {LFL_ft:g} ft):       {WS_landing_max_TO:6.1f} lb/ft²",
+            f"  Design WS:                           {WS_design:6.1f} lb/ft² ← SELECTED",
+            "",
+            "Thrust-to-Weight Requirements:",
+            f"  Takeoff (BFL = {BFL_ft:g} ft):         {TW_takeoff:6.3f}",
+            f"  OEI Climb (2.4% gradient):           {TW_climb_OEI:6.3f}",
+            f"  AEO Climb (5.0% gradient):           {TW_climb_AEO:6.3f}",
+            f"  Service Ceiling ({ROC_ceiling_fpm:g} fpm):       {TW_ceiling:6.3f}",
+            f"  Cruise (L/D = {L_D_cruise:.1f}):                {TW_cruise:6.3f}",
+            f"  Required T/W:                        {TW_required:6.3f} ← {sizing_constraint}",
+            "",
+            "Power Requirements:",
+            f"  Total Thrust:    {T_total_lb:7.0f} lb",
+            f"  Total Power:     {P_shaft_kW:7.0f} kW ({P_shaft_HP:7.0f} HP)",
+            f"  Power per Engine:{P_shaft_kW/N_engines:7.0f} kW ({P_shaft_HP/N_engines:7.0f} HP)",
+            f"  Specific Power:  {P_shaft_HP/TOGW_lb:7.3f} HP/lb",
+            rule,
+            "",
+            f"Sizing Constraint for Power: {sizing_constraint_power}",
+            "",
+        ]
+        print("\n".join(lines))
 
-    TW_takeoff = WS_design / (sigma_SL * CLmax_TO_eff * TOP)
+    return WS_design, P_shaft_kW
 
-    CL_cruise = TOGW_lb / (q_cruise * (TOGW_lb / WS_design))
-    CD_cruise = CD0 + K1 * CL_cruise**2
-    L_D_cruise = CL_cruise / CD_cruise
-    TW_cruise = (beta_cruise / alpha_cruise) * (1.0 / L_D_cruise)
-
-    TW_required = max(TW_takeoff, TW_climb_OEI, TW_climb_AEO, TW_ceiling, TW_cruise)
-
-    # Identify sizing constraint (for printing only)
-    sizing_constraint = "Unknown"
-    if TW_required == TW_takeoff:
-        sizing_constraint = "Takeoff"
-    elif TW_required == TW_climb_OEI:
-        sizing_constraint = "OEI Climb"
-    elif TW_required == TW_climb_AEO:
-        sizing_constraint = "AEO Climb"
-    elif TW_required == TW_ceiling:
-        sizing_constraint = "Service Ceiling"
-    elif TW_required == TW_cruise:
-        sizing_constraint = "Cruise"
+def perform_constraint_analysis_batch(
+    TOGW_lb,
+    blown_lift_augmentation: float,
+    use_blown_lift_sizing: bool,
+    inputs: ConstraintInputs,
+    **overrides,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Constraint analysis for N designs in one call (no console output).
 
-    # Convert T/W to power
-    V_climb_fps = ks_climb * V_stall_fps
-    T_total_lb = TW_required * TOGW_lb
+    Args:
+        TOGW_lb: Scalar or length-N array of takeoff gross weights
+        blown_lift_augmentation, use_blown_lift_sizing: As for perform_constraint_analysis
+        inputs: Baseline fixed values shared by all designs
+        **overrides: Any ConstraintInputs field as a scalar or length-N array
+                     (e.g. K1=..., cruise_alt_ft=..., V_stall_kts=...) to sweep it
 
-    P_takeoff_HP = (TW_takeoff * TOGW_lb) * 1.15 * V_stall_fps / (550 * prop_efficiency)
-    P_climb_OEI_HP = (TW_climb_OEI * TOGW_lb) * V_climb_fps / (550 * prop_efficiency)
-    P_climb_AEO_HP = (TW_climb_AEO * TOGW_lb) * V_climb_fps / (550 * prop_efficiency)
-    P_ceiling_HP = (TW_ceiling * TOGW_lb) * V_climb_ceiling / (550 * prop_efficiency)
-    P_cruise_HP = (TW_cruise * TOGW_lb) * V_cruise_fps / (550 * prop_efficiency)
+    Returns:
+        WS_design (lb/ft²) and P_shaft_kW arrays of length N, matching
+        perform_constraint_analysis design by design.
+    """
+    unknown = set(overrides) - set(ConstraintInputs.__dataclass_fields__)
+    if unknown:
+        raise TypeError(f"Unknown constraint input(s): {', '.join(sorted(unknown))}")
 
-    P_shaft_HP = max(P_takeoff_HP, P_climb_OEI_HP, P_climb_AEO_HP, P_ceiling_HP, P_cruise_HP)
-    P_shaft_kW = P_shaft_HP * 0.7457
+    fields = ('V_stall_kts', 'BFL_ft', 'LFL_ft', 'CLmax_clean', 'CLmax_TO', 'CLmax_land', 'CD0',
+              'K1', 'cruise_speed_kts', 'cruise_alt_ft', 'prop_efficiency', 'N_engines',
+              'ROC_ceiling_fpm', 'service_ceiling_ft')
+    arrays = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(TOGW_lb, dtype=float)),
+        *[np.atleast_1d(np.asarray(overrides.get(name, getattr(inputs, name)), dtype=float))
+          for name in fields])
+    (TOGW, V_stall_kts, BFL_ft, LFL_ft, CLmax_clean, CLmax_TO, CLmax_land, CD0, K1,
+     cruise_speed_kts, cruise_alt_ft, prop_efficiency, N_engines, ROC_ceiling_fpm,
+     service_ceiling_ft) = [np.ascontiguousarray(a) for a in arrays]
 
-    # Console output kept here so behavior matches original
-    print(f"\n{'='*70}")
-    print(f"CONSTRAINT ANALYSIS RESULTS")
-    if use_blown_lift_sizing:
-        print(f"  (Using Blown Lift Wing Sizing - Augmentation: {blown_lift_augmentation:.3f}x)")
-    print(f"{'='*70}")
-    if use_blown_lift_sizing:
-        print(f"Effective CLmax (with blown lift):")
-        print(f"  CLmax_clean:   {CLmax_clean:.2f} → {CLmax_clean_eff:.2f}")
-        print(f"  CLmax_takeoff: {CLmax_TO:.2f} → {CLmax_TO_eff:.2f}")
-        print(f"  CLmax_landing: {CLmax_land:.2f} → {CLmax_land_eff:.2f}")
-        print(f"")
-    print(f"Wing Loading Limits:")
-    print(f"  Stall speed (V_stall = {V_stall_kts} kts):  {WS_stall_max:6.1f} lb/ft²")
-    print(f"  Landing (LFL = {LFL_ft} ft):       {WS_landing_max_TO:6.1f} lb/ft²")
-    print(f"  Design WS:                           {WS_design:6.1f} lb/ft² ← SELECTED")
-    print(f"\nThrust-to-Weight Requirements:")
-    print(f"  Takeoff (BFL = {BFL_ft} ft):         {TW_takeoff:6.3f}")
-    print(f"  OEI Climb (2.4% gradient):           {TW_climb_OEI:6.3f}")
-    print(f"  AEO Climb (5.0% gradient):           {TW_climb_AEO:6.3f}")
-    print(f"  Service Ceiling ({ROC_ceiling_fpm} fpm):       {TW_ceiling:6.3f}")
-    print(f"  Cruise (L/D = {L_D_cruise:.1f}):                {TW_cruise:6.3f}")
-    print(f"  Required T/W:                        {TW_required:6.3f} ← {sizing_constraint}")
-    print(f"\nPower Requirements:")
-    print(f"  Total Thrust:    {T_total_lb:7.0f} lb")
-    print(f"  Total Power:     {P_shaft_kW:7.0f} kW ({P_shaft_HP:7.0f} HP)")
-    print(f"  Power per Engine:{P_shaft_kW/N_engines:7.0f} kW ({P_shaft_HP/N_engines:7.0f} HP)")
-    print(f"  Specific Power:  {P_shaft_HP/TOGW_lb:7.3f} HP/lb")
-    print(f"{'='*70}\n")
-
-    power_constraints = {
-        'Takeoff': P_takeoff_HP,
-        'OEI Climb': P_climb_OEI_HP,
-        'AEO Climb': P_climb_AEO_HP,
-        'Service Ceiling': P_ceiling_HP,
-        'Cruise': P_cruise_HP
-    }
-    sizing_constraint_power = max(power_constraints, key=power_constraints.get)
-    print(f"Sizing Constraint for Power: {sizing_constraint_power}\n")
+    aug = blown_lift_augmentation if use_blown_lift_sizing else 1.0
+    rho_ceiling_slug = isa_density_vec(service_ceiling_ft * _FT_TO_M) / _KG_M3_PER_SLUG_FT3
+    rho_cruise_slug = isa_density_vec(cruise_alt_ft * _FT_TO_M) / _KG_M3_PER_SLUG_FT3
 
-    return WS_design, P_shaft_kW
+    WS_design, P_shaft_HP = _constraint_core_batch(
+        TOGW, V_stall_kts, BFL_ft, LFL_ft, CLmax_clean * aug, CLmax_TO * aug, CLmax_land * aug,
+        CD0, K1, cruise_speed_kts * _KTS_TO_FPS, rho_cruise_slug, rho_ceiling_slug,
+        ROC_ceiling_fpm / _S_PER_MIN, N_engines, prop_efficiency)
+    return WS_design, P_shaft_HP * _HP_TO_KW
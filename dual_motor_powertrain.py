@@ -7,11 +7,39 @@ This module implements a powertrain with:
   - Power management for switching between motor sets
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, List, Tuple, Union
 import numpy as np
 
-@dataclass
+from _jit import njit
+from powertrain import _split_arrays
+from units import KG_TO_LB
+
+
+@njit(cache=True)
+def _hybrid_split(P_required_kW, Hp, bsfc_per_s, inv_eff_x1000):
+    """Parallel-hybrid shaft split -> (P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W)"""
+    P_EM_shaft_kW = P_required_kW * Hp
+    P_GT_shaft_kW = P_required_kW * (1 - Hp)
+    return (P_GT_shaft_kW, P_EM_shaft_kW,
+            P_GT_shaft_kW * bsfc_per_s, P_EM_shaft_kW * inv_eff_x1000)
+
+
+class Phase(IntEnum):
+    """Flight phases, in mission.SEGMENT_NAMES order; used as bit positions in MotorSet"""
+    TAKEOFF = 0
+    CLIMB = 1
+    CRUISE = 2
+    DESCENT = 3
+    LOITER = 4
+    LANDING = 5
+
+
+_ALL_PHASES_MASK = (1 << len(Phase)) - 1
+
+
+@dataclass(slots=True)
 class MotorSet:
     """Represents a set of identical motors"""
     name: str
@@ -23,17 +51,39 @@ class MotorSet:
     can_fold: bool = False
     folded_drag_cd: float = 0.001
 
-    @property
-    def total_power_kW(self) -> float:
-        return self.num_motors * self.power_per_motor_kW
+    # Derived once in __post_init__
+    total_power_kW: float = field(init=False, repr=False)
+    total_weight_lb: float = field(init=False, repr=False)
+    _active_mask: int = field(init=False, repr=False)  # bit (1 << Phase) set when active
 
-    @property
-    def total_weight_lb(self) -> float:
-        return self.num_motors * self.weight_per_motor_lb
-
-    def is_active(self, flight_phase: str) -> bool:
-        """Check if this motor set is active during given flight phase"""
-        return 'all' in self.active_phases or flight_phase in self.active_phases
+    def __post_init__(self):
+        self._refresh()
+        if 'all' in self.active_phases:
+            self._active_mask = _ALL_PHASES_MASK
+        else:
+            mask = 0
+            for phase in self.active_phases:
+                try:
+                    mask |= 1 << Phase[phase.upper()]
+                except KeyError:
+                    raise ValueError(f"{self.name}: unknown flight phase '{phase}' in active_phases, "
+                                     f"expected 'all' or one of {[p.name.lower() for p in Phase]}") from None
+            self._active_mask = mask
+
+    def _refresh(self):
+        """Recompute totals after num_motors / per-motor values are updated in place"""
+        self.total_power_kW = self.num_motors * self.power_per_motor_kW
+        self.total_weight_lb = self.num_motors * self.weight_per_motor_lb
+
+    def is_active(self, flight_phase: Union[Phase, str]) -> bool:
+        """Check if this motor set is active during given flight phase (Phase or segment name)"""
+        if isinstance(flight_phase, str):
+            phase = Phase.__members__.get(flight_phase.upper())
+            if phase is None:
+                # Not a mission phase: only an 'all' motor set counts as active
+                return self._active_mask == _ALL_PHASES_MASK
+            flight_phase = phase
+        return bool(self._active_mask & (1 << flight_phase))
 
 
 class DualMotorDEPPowertrain:
@@ -44,6 +94,18 @@ class DualMotorDEPPowertrain:
     and cruise motor sets.
     """
 
+    __slots__ = (
+        'tech', 'config', 'highlift_motors', 'cruise_motors', 'num_cruise_motors',
+        'cruise_architecture', 'name', 'power_architecture',
+        'battery_specific_energy_Wh_kg', 'battery_DOD',
+        # Component weights
+        'm_battery_lb', 'm_highlift_lb', 'm_cruise_motors_lb', 'm_wiring_lb', 'm_controllers_lb',
+        # Compatibility properties for the sizing loop
+        'P_GT_kW', 'P_EM_kW', 'P_GEN_kW', 'm_GT_lb', 'm_EM_lb', 'm_GEN_lb',
+        # Per-call power split factors, set in size_cruise_motors
+        '_bsfc_per_s', '_inv_cr_eff_x1000',
+    )
+
     def __init__(self, tech_spec, config: Dict):
         """
         Initialize dual motor DEP powertrain
@@ -102,6 +164,10 @@ class DualMotorDEPPowertrain:
         self.m_EM_lb = 0.0
         self.m_GEN_lb = 0.0
 
+        # Fuel rate per kW of GT shaft power (kg/s) and battery W per kW of cruise EM shaft power
+        self._bsfc_per_s = tech_spec.GT_BSFC_kg_kWh / 3600.0
+        self._inv_cr_eff_x1000 = 0.0
+
     def size_cruise_motors(self, P_cruise_kW: float, Hp: float = 0.0):
         """
         Size the cruise motors based on cruise power requirement
@@ -120,37 +186,28 @@ class DualMotorDEPPowertrain:
             # Parallel hybrid: GT + EM on same shaft
             # Size components for peak power (using Hp as electric fraction)
 
-            # Electric motor power per cruise motor (for boost)
-            P_EM_per_motor = power_per_motor * Hp
-            P_EM_total = P_EM_per_motor * num_motors
+            # Electric motor power (for boost), total and per cruise motor
+            P_EM_total = P_cruise_kW * Hp
+            P_EM_per_motor = P_EM_total / num_motors
 
-            # Gas turbine power per cruise motor (for sustained cruise)
-            P_GT_per_motor = power_per_motor * (1 - Hp)
-            P_GT_total = P_GT_per_motor * num_motors
+            # Gas turbine power (for sustained cruise), total and per cruise motor
+            P_GT_total = P_cruise_kW * (1 - Hp)
+            P_GT_per_motor = P_GT_total / num_motors
 
             # Size electric motors (cruise)
             EM_specific_power = cr_config['specific_power_kW_kg']
-            m_EM_per_motor_kg = P_EM_per_motor / EM_specific_power
-            m_EM_per_motor_lb = m_EM_per_motor_kg * 2.20462
+            m_EM_per_motor_lb = P_EM_per_motor * (KG_TO_LB / EM_specific_power)
 
             # Size gas turbines (one per cruise motor)
             GT_specific_power = self.tech.GT_specific_power_kW_kg
-            m_GT_per_motor_kg = P_GT_per_motor / GT_specific_power
-            m_GT_per_motor_lb = m_GT_per_motor_kg * 2.20462
+            m_GT_per_motor_lb = P_GT_per_motor * (KG_TO_LB / GT_specific_power)
 
             # Total cruise motor weight (GT + EM per motor)
             weight_per_motor_lb = m_GT_per_motor_lb + m_EM_per_motor_lb
 
-            # Create cruise motor set
-            self.cruise_motors = MotorSet(
-                name="Cruise Motors (Parallel Hybrid)",
-                num_motors=num_motors,
-                power_per_motor_kW=power_per_motor,
-                weight_per_motor_lb=weight_per_motor_lb,
-                efficiency=cr_config['efficiency'],
-                active_phases=['all'],
-                can_fold=False
-            )
+            # Create (or update) cruise motor set
+            self._set_cruise_motors("Cruise Motors (Parallel Hybrid)", num_motors,
+                                    power_per_motor, weight_per_motor_lb, cr_config['efficiency'])
 
             # Update compatibility properties
             self.P_GT_kW = P_GT_total
@@ -164,19 +221,11 @@ class DualMotorDEPPowertrain:
 
             # Weight per motor (using specific power)
             specific_power_kW_kg = cr_config['specific_power_kW_kg']
-            weight_per_motor_kg = power_per_motor / specific_power_kW_kg
-            weight_per_motor_lb = weight_per_motor_kg * 2.20462
+            weight_per_motor_lb = power_per_motor * (KG_TO_LB / specific_power_kW_kg)
 
-            # Create cruise motor set
-            self.cruise_motors = MotorSet(
-                name="Cruise Motors (Pure Electric)",
-                num_motors=num_motors,
-                power_per_motor_kW=power_per_motor,
-                weight_per_motor_lb=weight_per_motor_lb,
-                efficiency=cr_config['efficiency'],
-                active_phases=['all'],
-                can_fold=False
-            )
+            # Create (or update) cruise motor set
+            self._set_cruise_motors("Cruise Motors (Pure Electric)", num_motors,
+                                    power_per_motor, weight_per_motor_lb, cr_config['efficiency'])
 
             self.m_cruise_motors_lb = self.cruise_motors.total_weight_lb
 
@@ -186,6 +235,10 @@ class DualMotorDEPPowertrain:
             self.m_GT_lb = 0.0
             self.m_EM_lb = self.m_cruise_motors_lb
 
+        # Power split factors for the sized cruise motors (kW -> W folded in)
+        self._inv_cr_eff_x1000 = 1000.0 / self.cruise_motors.efficiency
+        self._bsfc_per_s = self.tech.GT_BSFC_kg_kWh / 3600.0
+
         # Size wiring and controllers
         total_power_kW = P_cruise_kW + self.highlift_motors.total_power_kW
         self.m_wiring_lb = total_power_kW * self.config['dep_system']['wiring_and_controls']['wiring_weight_factor']
@@ -202,6 +255,29 @@ class DualMotorDEPPowertrain:
         # Size cruise motors for cruise power
         self.size_cruise_motors(P_shaft_kW, Hp)
 
+    def _set_cruise_motors(self, name: str, num_motors: int, power_per_motor_kW: float,
+                           weight_per_motor_lb: float, efficiency: float):
+        """Create the cruise MotorSet on first sizing, then update it in place"""
+        motors = self.cruise_motors
+        if motors is None:
+            self.cruise_motors = MotorSet(
+                name=name,
+                num_motors=num_motors,
+                power_per_motor_kW=power_per_motor_kW,
+                weight_per_motor_lb=weight_per_motor_lb,
+                efficiency=efficiency,
+                active_phases=['all'],
+                can_fold=False
+            )
+            return
+
+        motors.name = name
+        motors.num_motors = num_motors
+        motors.power_per_motor_kW = power_per_motor_kW
+        motors.weight_per_motor_lb = weight_per_motor_lb
+        motors.efficiency = efficiency
+        motors._refresh()
+
     def get_power_split(self, P_required_kW: float, Hp: float) -> Dict:
         """
         Calculate power distribution for dual motor DEP system.
@@ -232,21 +308,11 @@ class DualMotorDEPPowertrain:
 
         if self.cruise_architecture == 'parallel_hybrid':
             # Parallel hybrid: GT + EM on same shaft
-            # Power split based on Hp (electric fraction)
-            P_EM_shaft_kW = P_cruise_shaft_kW * Hp
-            P_GT_shaft_kW = P_cruise_shaft_kW * (1 - Hp)
-
-            # Electrical power required from battery (accounting for motor efficiency)
-            cr_efficiency = self.cruise_motors.efficiency
-            P_elec_cruise_kW = P_EM_shaft_kW / cr_efficiency
-
-            # Fuel consumption from gas turbines
-            # BSFC is already kg/kWh of output power, so no efficiency division needed
-            BSFC = self.tech.GT_BSFC_kg_kWh  # kg/kWh
-            fuel_rate_kg_s = (P_GT_shaft_kW * BSFC) / 3600.0
-
-            # Battery power draw (in Watts)
-            battery_power_W = P_elec_cruise_kW * 1000.0
+            # Power split based on Hp (electric fraction). BSFC is already
+            # kg/kWh of output power, so no efficiency division on the GT side;
+            # battery draw (W) accounts for cruise motor efficiency.
+            P_GT_shaft_kW, P_EM_shaft_kW, fuel_rate_kg_s, battery_power_W = _hybrid_split(
+                float(P_cruise_shaft_kW), float(Hp), self._bsfc_per_s, self._inv_cr_eff_x1000)
 
             return {
                 'P_GT_kW': P_GT_shaft_kW,
@@ -258,12 +324,9 @@ class DualMotorDEPPowertrain:
         else:
             # Pure electric: All power from battery
 
-            # Electrical power required (accounting for motor efficiency)
-            cr_efficiency = self.cruise_motors.efficiency
-            P_elec_cruise_kW = P_cruise_shaft_kW / cr_efficiency
-
-            # Battery power draw (in Watts for consistency with mission sim)
-            battery_power_W = P_elec_cruise_kW * 1000.0
+            # Battery power draw (in Watts for consistency with mission sim),
+            # accounting for motor efficiency
+            battery_power_W = P_cruise_shaft_kW * self._inv_cr_eff_x1000
 
             return {
                 'P_GT_kW': 0.0,  # No gas turbine in pure electric
@@ -272,6 +335,57 @@ class DualMotorDEPPowertrain:
                 'battery_power_W': battery_power_W,  # Battery draw for cruise motors
             }
 
+    def get_power_rates(self, P_required_kW: float, Hp: float) -> Tuple[float, float]:
+        """(fuel_rate_kg_s, battery_power_W) of get_power_split, without building the dict"""
+        if self.cruise_motors is None:
+            return 0.0, 0.0
+        if self.cruise_architecture == 'parallel_hybrid':
+            _, _, fuel_rate_kg_s, battery_power_W = _hybrid_split(
+                float(P_required_kW), float(Hp), self._bsfc_per_s, self._inv_cr_eff_x1000)
+            return fuel_rate_kg_s, battery_power_W
+        return 0.0, P_required_kW * self._inv_cr_eff_x1000
+
+    def get_power_split_vec(self, P_required_kW, Hp) -> Dict[str, np.ndarray]:
+        """
+        Vectorized get_power_split over a trajectory of operating points.
+
+        Args:
+            P_required_kW: Shaft power required, array (or float)
+            Hp: Hybridization ratio per point, array broadcastable against P_required_kW (or float)
+
+        Returns:
+            Dict with the same keys as get_power_split, each an array of the broadcast shape
+        """
+        P_required_kW, Hp, zeros = _split_arrays(P_required_kW, Hp)
+
+        if self.cruise_motors is None:
+            # Motors not sized yet
+            return {
+                'P_GT_kW': zeros,
+                'P_EM_kW': zeros.copy(),
+                'fuel_rate_kg_s': zeros.copy(),
+                'battery_power_W': zeros.copy(),
+            }
+
+        if self.cruise_architecture == 'parallel_hybrid':
+            P_EM_shaft_kW = P_required_kW * Hp
+            P_GT_shaft_kW = P_required_kW * (1 - Hp)
+            return {
+                'P_GT_kW': P_GT_shaft_kW,
+                'P_EM_kW': P_EM_shaft_kW,
+                'fuel_rate_kg_s': P_GT_shaft_kW * self._bsfc_per_s,
+                'battery_power_W': P_EM_shaft_kW * self._inv_cr_eff_x1000,
+            }
+
+        # Pure electric: all power from battery
+        P_EM_shaft_kW = P_required_kW + zeros
+        return {
+            'P_GT_kW': zeros,
+            'P_EM_kW': P_EM_shaft_kW,
+            'fuel_rate_kg_s': zeros.copy(),
+            'battery_power_W': P_EM_shaft_kW * self._inv_cr_eff_x1000,
+        }
+
     def size_battery(self, mission_energy_Wh: float):
         """
         Size battery based on total mission energy requirement
@@ -283,8 +397,7 @@ class DualMotorDEPPowertrain:
         energy_with_reserve = mission_energy_Wh / self.battery_DOD
 
         # Battery weight
-        energy_kg = energy_with_reserve / self.battery_specific_energy_Wh_kg
-        self.m_battery_lb = energy_kg * 2.20462
+        self.m_battery_lb = energy_with_reserve * (KG_TO_LB / self.battery_specific_energy_Wh_kg)
 
     def get_total_propulsion_weight(self) -> float:
         """Get total weight of propulsion system"""
@@ -305,12 +418,12 @@ class DualMotorDEPPowertrain:
             'total': self.get_total_propulsion_weight()
         }
 
-    def get_drag_increment(self, flight_phase: str, S_wing_ft2: float) -> float:
+    def get_drag_increment(self, flight_phase: Union[Phase, str], S_wing_ft2: float) -> float:
         """
         Calculate drag increment from folded high-lift motors
 
         Args:
-            flight_phase: Current flight phase
+            flight_phase: Current flight phase (Phase or segment name)
             S_wing_ft2: Wing reference area
 
         Returns:
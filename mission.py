@@ -1,17 +1,48 @@
+import math
 from dataclasses import dataclass
-from atmosphere import atmosisa
-from typing import List, Dict, Tuple
+from atmosphere import isa_density, isa_density_vec
+from typing import List, Dict, Tuple, Union
 import numpy as np
-from config_loader import load_config
-
-# Load configuration
-config = load_config()
+from _jit import njit
+from units import KG_TO_LB
 
 # need to add rest of mission functions from aircraft.py to here
 
-@dataclass
+_SLUG_FT3_PER_KG_M3 = 1.0 / 515.379
+
+# Fused unit conversions for the segment kernels
+_KTS_TO_FPS = 1.688
+_FT_PER_NM = 6076.12
+_KW_PER_FTLB_S = 0.7457 / 550.0  # shaft kW per (lb·ft/s) of thrust power
+_INV_3600 = 1.0 / 3600.0  # h per s
+
+
+def _rho_slug(h_ft: float) -> float:
+    """ISA density (slug/ft³) from the shared atmosphere density table"""
+    return isa_density(h_ft * 0.3048) * _SLUG_FT3_PER_KG_M3
+
+
+def _rho_slug_vec(h_ft: np.ndarray) -> np.ndarray:
+    """_rho_slug over an array of altitudes (bit-identical per element)"""
+    return isa_density_vec(np.asarray(h_ft, dtype=float) * 0.3048) * _SLUG_FT3_PER_KG_M3
+
+# Standard mission segments, in flight order (profile arrays are indexed by position)
+SEGMENT_NAMES = ('takeoff', 'climb', 'cruise', 'descent', 'loiter', 'landing')
+# Default blown lift: active for low-speed segments, off for cruise
+DEFAULT_BLOWN_LIFT_PROFILE = np.array([True, True, False, False, False, True])
+
+# Mission profile record: one row per segment, fields stored as contiguous columns
+SEGMENT_DTYPE = np.dtype([
+    ('name', 'U8'),
+    ('alt_start', 'f8'),   # ft
+    ('alt_end', 'f8'),     # ft
+    ('Hp', 'f8'),          # Hybridization ratio for this segment
+    ('blown_lift', '?'),   # Whether blown lift from DEP high-lift motors is active
+])
+
+@dataclass(slots=True)
 class MissionSegment:
-    """Mission segment definition"""
+    """Mission segment definition (legacy object view of one SEGMENT_DTYPE row)"""
     name: str
     altitude_start_ft: float
     altitude_end_ft: float
@@ -24,6 +55,85 @@ class MissionSegment:
     battery_Wh: float = 0.0
     distance_nm: float = 0.0
 
+    @classmethod
+    def from_record(cls, record) -> 'MissionSegment':
+        """Wrap one row of a SEGMENT_DTYPE array"""
+        return cls(str(record['name']), float(record['alt_start']), float(record['alt_end']),
+                   float(record['Hp']), bool(record['blown_lift']))
+
+
+def segments_to_array(segments: List[MissionSegment]) -> np.ndarray:
+    """Pack a list of MissionSegment objects into a SEGMENT_DTYPE array"""
+    return np.array([(s.name, s.altitude_start_ft, s.altitude_end_ft, s.Hp, s.blown_lift_active)
+                     for s in segments], dtype=SEGMENT_DTYPE)
+
+
+class SegmentBatch:
+    """
+    Mission profile as separate contiguous columns, for simulate_mission_batch.
+
+    Hp has shape (n_designs, n_segments) so each design in a sweep can fly its own
+    hybridization profile; a single shared profile is stored as one row and broadcasts.
+    """
+    __slots__ = ('names', 'alt0', 'alt1', 'Hp', 'blown')
+
+    def __init__(self, names, alt0, alt1, Hp, blown):
+        self.names = tuple(str(name) for name in names)
+        self.alt0 = np.ascontiguousarray(alt0, dtype=float)      # ft
+        self.alt1 = np.ascontiguousarray(alt1, dtype=float)      # ft
+        self.Hp = np.ascontiguousarray(np.atleast_2d(Hp), dtype=float)
+        self.blown = np.ascontiguousarray(blown, dtype=bool)
+
+    @classmethod
+    def from_array(cls, segments: np.ndarray, Hp: np.ndarray = None) -> 'SegmentBatch':
+        """Split a SEGMENT_DTYPE array into columns (Hp optionally overridden per design)"""
+        return cls(segments['name'].tolist(), segments['alt_start'], segments['alt_end'],
+                   segments['Hp'] if Hp is None else Hp, segments['blown_lift'])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _segment_rho(self, h_ft: float) -> float:
+    """Density (slug/ft³) at h_ft, memoized per aircraft (mission altitudes rarely change)"""
+    rho_slug_ft3 = self._atm_cache.get(h_ft)
+    if rho_slug_ft3 is None:
+        rho_slug_ft3 = self._atm_cache[h_ft] = float(_rho_slug(h_ft))
+    return rho_slug_ft3
+
+
+def _prefill_mission_rho(self, cruise_alts_ft: List[float]):
+    """
+    Fill _atm_cache with every density the create_mission profile reads, for each cruise
+    altitude, in one array call (cruise, descent mid-point, 450 ft loiter/landing; takeoff
+    and climb use sea-level constants).
+    """
+    h_ft = [450.0]
+    for h_cruise in cruise_alts_ft:
+        h_ft += [float(h_cruise), (h_cruise + 450) / 2]
+    missing = [h for h in dict.fromkeys(h_ft) if h not in self._atm_cache]
+    if missing:
+        self._atm_cache.update(zip(missing, _rho_slug_vec(np.array(missing)).tolist()))
+
+
+def _cruise_constants(self, alt_ft: float) -> Tuple[float, float, float, float]:
+    """
+    Weight-independent cruise quantities at alt_ft, memoized per aircraft.
+
+    Returns:
+        (q_psf, V_fps, time_sec, kW_per_ftlb_s): dynamic pressure, cruise speed, cruise
+        time for the design range and shaft kW per lb·ft/s of thrust power
+    """
+    key = (alt_ft, self.cruise_speed_kts, self.range_nm, self.tech.prop_efficiency)
+    constants = self._cruise_cache.get(key)
+    if constants is None:
+        V_fps = self.cruise_speed_kts * _KTS_TO_FPS
+        q_psf = 0.5 * _segment_rho(self, alt_ft) * V_fps**2
+        constants = self._cruise_cache[key] = (
+            q_psf, V_fps, self.range_nm * _FT_PER_NM / V_fps,
+            _KW_PER_FTLB_S / self.tech.prop_efficiency)
+    return constants
+
 
 def get_highlift_motor_power(self, blown_lift_active: bool) -> float:
     """
@@ -38,110 +148,88 @@ def get_highlift_motor_power(self, blown_lift_active: bool) -> float:
     if not blown_lift_active or not self.dep_enabled:
         return 0.0
 
-    # Total high-lift motor power = num_motors × power_per_motor
+    # Total high-lift motor power = num_motors × power_per_motor, folded once per aircraft
     # From config: 12 motors × 10.5 kW = 126 kW
-    P_highlift_kW = self.dep_num_motors * config.get('dep_system', 'motor_power_kW')
+    return self._dep_power_total_kW
+
 
-    return P_highlift_kW
+def _profile_to_array(profile: Dict, default=0.0, dtype=float) -> np.ndarray:
+    """Per-segment profile dict -> array ordered by SEGMENT_NAMES (missing segments get default)"""
+    return np.array([profile.get(name, default) for name in SEGMENT_NAMES], dtype=dtype)
 
 
-def create_mission(self, hybridization_profile: Dict[str, float],
-                   blown_lift_profile: Dict[str, bool] = None) -> List[MissionSegment]:
+def create_mission(self, hybridization_profile: Union[Dict[str, float], np.ndarray],
+                   blown_lift_profile: Union[Dict[str, bool], np.ndarray] = None) -> np.ndarray:
     """
     Create mission profile with segment-specific hybridization and blown lift control
 
     Args:
-        hybridization_profile: Dict mapping segment names to hybridization ratios (0.0-1.0)
-        blown_lift_profile: Dict mapping segment names to blown lift active status (True/False)
+        hybridization_profile: Dict mapping segment names to hybridization ratios (0.0-1.0),
+                               or an array of ratios ordered by SEGMENT_NAMES
+        blown_lift_profile: Dict mapping segment names to blown lift active status (True/False),
+                           or a bool array ordered by SEGMENT_NAMES
                            If None, defaults to True for takeoff/landing, False for cruise
+
+    Returns:
+        SEGMENT_DTYPE array with one row per segment, in SEGMENT_NAMES order
     """
+    if isinstance(hybridization_profile, dict):
+        hybridization_profile = _profile_to_array(hybridization_profile)
     if blown_lift_profile is None:
         # Default: blown lift active for low-speed segments, off for cruise
-        blown_lift_profile = {
-            'takeoff': True,
-            'climb': True,
-            'cruise': False,
-            'descent': False,
-            'loiter': False,
-            'landing': True,
-        }
-
-    segments = [
-        MissionSegment('takeoff', 0, 35,
-                      hybridization_profile.get('takeoff', 0.0),
-                      blown_lift_profile.get('takeoff', False)),
-        MissionSegment('climb', 35, self.cruise_alt_ft,
-                      hybridization_profile.get('climb', 0.0),
-                      blown_lift_profile.get('climb', False)),
-        MissionSegment('cruise', self.cruise_alt_ft, self.cruise_alt_ft,
-                      hybridization_profile.get('cruise', 0.0),
-                      blown_lift_profile.get('cruise', False)),
-        MissionSegment('descent', self.cruise_alt_ft, 450,
-                      hybridization_profile.get('descent', 0.0),
-                      blown_lift_profile.get('descent', False)),
-        MissionSegment('loiter', 450, 450,
-                      hybridization_profile.get('loiter', 0.0),
-                      blown_lift_profile.get('loiter', False)),
-        MissionSegment('landing', 450, 0,
-                      hybridization_profile.get('landing', 0.0),
-                      blown_lift_profile.get('landing', False)),
-    ]
+        blown_lift_profile = DEFAULT_BLOWN_LIFT_PROFILE
+    elif isinstance(blown_lift_profile, dict):
+        blown_lift_profile = _profile_to_array(blown_lift_profile, default=False, dtype=bool)
+
+    h_cruise = self.cruise_alt_ft
+    segments = np.zeros(len(SEGMENT_NAMES), dtype=SEGMENT_DTYPE)
+    segments['name'] = SEGMENT_NAMES
+    segments['alt_start'] = (0, 35, h_cruise, h_cruise, 450, 450)
+    segments['alt_end'] = (35, h_cruise, h_cruise, 450, 450, 0)
+    segments['Hp'] = hybridization_profile
+    segments['blown_lift'] = blown_lift_profile
 
     return segments
 
-# ======================= Simulation helpers ======================= #
-def simulate_cruise_segment(self, segment: MissionSegment, W_lb: float, S_ft2: float) -> Tuple:
-    """Cruise segment simulation"""
-    # Atmospheric conditions
-    h_m = segment.altitude_start_ft * 0.3048
-    _, _, rho_kg_m3, _ = atmosisa(h_m)
-    rho_slug_ft3 = rho_kg_m3 / 515.379
-
-    # Cruise speed
-    V_fps = self.cruise_speed_kts * 1.688
-
-    # Apply blown lift augmentation if active
-    lift_aug_factor = self.get_lift_augmentation_factor(segment.blown_lift_active)
+def create_mission_soa(self, hybridization_profile: Union[Dict[str, float], np.ndarray],
+                       blown_lift_profile: Union[Dict[str, bool], np.ndarray] = None) -> SegmentBatch:
+    """
+    create_mission for batched sweeps, returned as a SegmentBatch.
 
-    # L/D calculation
-    CL_base = W_lb / (0.5 * rho_slug_ft3 * V_fps**2 * S_ft2)
-    CL = CL_base * lift_aug_factor
-    # Note: CD calculation uses base CL since induced drag is based on actual circulation
-    CD = self.CD0 + self.K1 * CL_base**2
-    D_lb = 0.5 * rho_slug_ft3 * V_fps**2 * S_ft2 * CD
+    Args:
+        hybridization_profile: As for create_mission, or an (n_designs, n_segments) array
+                               of per-design ratios ordered by SEGMENT_NAMES
+        blown_lift_profile: As for create_mission (shared by all designs)
+    """
+    if not isinstance(hybridization_profile, dict):
+        Hp = np.asarray(hybridization_profile, dtype=float)
+        if Hp.ndim == 2:
+            return SegmentBatch.from_array(create_mission(self, Hp[0], blown_lift_profile), Hp=Hp)
+    return SegmentBatch.from_array(create_mission(self, hybridization_profile, blown_lift_profile))
+
+# ======================= Segment kernels ======================= #
+# Aerodynamics and kinematics of each segment, scalars in / scalars out. The powertrain
+# power split and the consumption bookkeeping stay in the Python wrappers below, since
+# get_power_rates is a method on whichever powertrain class the aircraft uses.
+
+@njit(cache=True)
+def _cruise_core(q_psf, V_fps, W_lb, S_ft2, CD0, K1, kW_per_ftlb_s):
+    """Cruise -> P_shaft_kW (q_psf, V_fps, kW_per_ftlb_s from _cruise_constants)"""
+    # Drag, D = qS·CD0 + K1·W²/qS (CD = CD0 + K1·CL², CL = W/qS; induced drag uses the
+    # base CL since it is based on actual circulation)
+    qS = q_psf * S_ft2
+    D_lb = qS * CD0 + K1 * W_lb * W_lb / qS
 
     # Power required
-    P_shaft_HP = D_lb * V_fps / (550 * self.tech.prop_efficiency)
-    P_shaft_kW = P_shaft_HP * 0.7457
-
-    # Power split
-    power_split = self.powertrain.get_power_split(P_shaft_kW, segment.Hp)
-
-    # Cruise time
-    distance_ft = self.range_nm * 6076.12
-    time_sec = distance_ft / V_fps
-
-    # Add high-lift motor power if active (draws from battery)
-    P_highlift_kW = get_highlift_motor_power(self, segment.blown_lift_active)
-    P_highlift_W = P_highlift_kW * 1000.0
-
-    # Consumption (add high-lift motor energy to battery draw)
-    fuel_lb = power_split['fuel_rate_kg_s'] * time_sec * 2.20462
-    battery_Wh = (power_split['battery_power_W'] * time_sec) / 3600 + (P_highlift_W * time_sec) / 3600
-
-    segment.distance_nm = self.range_nm
-
-    return time_sec, fuel_lb, battery_Wh
+    return D_lb * V_fps * kW_per_ftlb_s
 
-def simulate_climb_segment(self, segment: MissionSegment, W_lb: float, S_ft2: float) -> Tuple:
-    """Climb segment simulation"""
+@njit(cache=True)
+def _climb_core(W_lb, S_ft2, CLmax_clean_effective, lift_aug_factor, CD0, K1, prop_efficiency,
+                alt_change_ft):
+    """Climb -> (time_sec, P_shaft_kW)"""
     # Average weight during climb (assume 2% fuel burn)
     W_avg = W_lb * 0.99
 
-    # Apply blown lift augmentation if active
-    lift_aug_factor = self.get_lift_augmentation_factor(segment.blown_lift_active)
-    CLmax_clean_effective = self.CLmax_clean * lift_aug_factor
-
     # Climb at 1.3 * V_stall for best angle
     rho_sl = 0.002377  # slug/ft³ at sea level
     V_stall_fps = np.sqrt(2 * W_avg / (rho_sl * S_ft2 * CLmax_clean_effective))
@@ -151,46 +239,22 @@ def simulate_climb_segment(self, segment: MissionSegment, W_lb: float, S_ft2: fl
     gamma = 0.05
     ROC_fps = V_climb_fps * gamma
 
-    # L/D in climb (apply augmentation to operating CL as well)
-    CL_climb_base = W_avg / (0.5 * rho_sl * V_climb_fps**2 * S_ft2)
-    CL_climb = CL_climb_base * lift_aug_factor
-    # Note: CD calculation uses base CL since induced drag is based on actual circulation
-    CD_climb = self.CD0 + self.K1 * CL_climb_base**2
+    # Drag on the base CL (induced drag is based on actual circulation)
+    qS = 0.5 * rho_sl * V_climb_fps * V_climb_fps * S_ft2
+    D_lb = qS * CD0 + K1 * W_avg * W_avg / qS
 
-    # Thrust required
-    T_lb = W_avg * (1/(CL_climb/CD_climb) + gamma)
-    P_shaft_HP = T_lb * V_climb_fps / (550 * self.tech.prop_efficiency)
-    P_shaft_kW = P_shaft_HP * 0.7457
-
-    # Power split
-    power_split = self.powertrain.get_power_split(P_shaft_kW, segment.Hp)
+    # Thrust required, W·(CD/CL + gamma) with the augmented operating CL = aug·W/qS
+    T_lb = D_lb / lift_aug_factor + W_avg * gamma
+    P_shaft_kW = T_lb * V_climb_fps * _KW_PER_FTLB_S / prop_efficiency
 
     # Climb time
-    alt_change_ft = segment.altitude_end_ft - segment.altitude_start_ft
-    time_sec = alt_change_ft / ROC_fps if ROC_fps > 0 else 600
-
-    # Add high-lift motor power if active (draws from battery)
-    P_highlift_kW = get_highlift_motor_power(self, segment.blown_lift_active)
-    P_highlift_W = P_highlift_kW * 1000.0
-
-    # Consumption (add high-lift motor energy to battery draw)
-    fuel_lb = power_split['fuel_rate_kg_s'] * time_sec * 2.20462
-    battery_Wh = (power_split['battery_power_W'] * time_sec) / 3600 + (P_highlift_W * time_sec) / 3600
-
-    return time_sec, fuel_lb, battery_Wh
-
-def simulate_descent_segment(self, segment: MissionSegment, W_lb: float, S_ft2: float) -> Tuple:
-    """Descent segment - physics-based calculation with idle power"""
-    # Atmospheric conditions at average altitude
-    h_avg_ft = (segment.altitude_start_ft + segment.altitude_end_ft) / 2
-    h_avg_m = h_avg_ft * 0.3048
-    _, _, rho_kg_m3, _ = atmosisa(h_avg_m)
-    rho_slug_ft3 = rho_kg_m3 / 515.379
-
-    # Descent speed (slightly below cruise speed for passenger comfort)
-    V_descent_kts = self.cruise_speed_kts * 0.9
-    V_fps = V_descent_kts * 1.688
+    time_sec = alt_change_ft / ROC_fps if ROC_fps > 0 else 600.0
+    return time_sec, P_shaft_kW
 
+@njit(cache=True)
+def _descent_core(rho_slug_ft3, V_fps, W_lb, S_ft2, CD0, K1, prop_efficiency, P_idle_kW,
+                  alt_change_ft):
+    """Descent -> (time_sec, P_shaft_kW); P_idle_kW is the flight-idle power floor"""
     # Descent rate (typical: 500-800 fpm for comfort)
     descent_rate_fpm = 600
     descent_rate_fps = descent_rate_fpm / 60
@@ -198,62 +262,33 @@ def simulate_descent_segment(self, segment: MissionSegment, W_lb: float, S_ft2:
     # Flight path angle
     gamma = np.arctan(descent_rate_fps / V_fps)
 
-    # Apply blown lift augmentation if active
-    lift_aug_factor = self.get_lift_augmentation_factor(segment.blown_lift_active)
-
-    # Lift coefficient (slightly less than weight, due to descent)
+    # Lift slightly less than weight, due to descent
     W_effective = W_lb * np.cos(gamma)
-    CL_base = W_effective / (0.5 * rho_slug_ft3 * V_fps**2 * S_ft2)
-    CL = CL_base * lift_aug_factor
-    # Note: CD calculation uses base CL since induced drag is based on actual circulation
-    CD = self.CD0 + self.K1 * CL_base**2
 
-    # Drag force
-    D_lb = 0.5 * rho_slug_ft3 * V_fps**2 * S_ft2 * CD
+    # Drag force (induced drag on the base CL = W_effective/qS)
+    qS = 0.5 * rho_slug_ft3 * V_fps * V_fps * S_ft2
+    D_lb = qS * CD0 + K1 * W_effective * W_effective / qS
 
     # Thrust required (reduced due to descent - gravity assists)
     T_required_lb = D_lb - W_lb * np.sin(gamma)
 
-    # If negative thrust (descending too fast), use flight idle power
-    if T_required_lb < 0:
-        # Flight idle: ~7% of rated power
-        P_shaft_kW = self.powertrain.P_GT_kW * 0.07
-    else:
-        # Power required
-        P_shaft_HP = T_required_lb * V_fps / (550 * self.tech.prop_efficiency)
-        P_shaft_kW = P_shaft_HP * 0.7457
-        # Minimum flight idle power
-        P_shaft_kW = max(P_shaft_kW, self.powertrain.P_GT_kW * 0.07)
-
-    # Power split
-    power_split = self.powertrain.get_power_split(P_shaft_kW, segment.Hp)
+    # Power required, never below flight idle (negative thrust -> descending
+    # too fast -> flight idle)
+    T_positive_lb = max(0.0, T_required_lb)
+    P_shaft_kW = max(T_positive_lb * V_fps * _KW_PER_FTLB_S / prop_efficiency, P_idle_kW)
 
     # Descent time
-    alt_change_ft = segment.altitude_start_ft - segment.altitude_end_ft
-    time_sec = (alt_change_ft / descent_rate_fps) if descent_rate_fps > 0 else 480
-
-    # Add high-lift motor power if active (draws from battery)
-    P_highlift_kW = get_highlift_motor_power(self, segment.blown_lift_active)
-    P_highlift_W = P_highlift_kW * 1000.0
-
-    # Consumption (add high-lift motor energy to battery draw)
-    fuel_lb = power_split['fuel_rate_kg_s'] * time_sec * 2.20462
-    battery_Wh = (power_split['battery_power_W'] * time_sec) / 3600 + (P_highlift_W * time_sec) / 3600
-
-    return time_sec, fuel_lb, battery_Wh
+    time_sec = (alt_change_ft / descent_rate_fps) if descent_rate_fps > 0 else 480.0
+    return time_sec, P_shaft_kW
 
-def simulate_takeoff_segment(self, segment: MissionSegment, W_lb: float, S_ft2: float) -> Tuple:
-    """Takeoff segment - ground roll + rotation + climb to 35 ft"""
+@njit(cache=True)
+def _takeoff_core(W_lb, S_ft2, CLmax_TO_effective):
+    """Takeoff -> time_sec (ground roll + climb to 35 ft)"""
     # Sea level conditions
     rho_sl = 0.002377  # slug/ft³
 
-    # Apply blown lift augmentation if active
-    lift_aug_factor = self.get_lift_augmentation_factor(segment.blown_lift_active)
-    CLmax_TO_effective = self.CLmax_TO * lift_aug_factor
-
     # Takeoff speed (1.1 * stall speed with flaps)
     V_stall_TO_fps = np.sqrt(2 * W_lb / (rho_sl * S_ft2 * CLmax_TO_effective))
-    V_liftoff_fps = 1.1 * V_stall_TO_fps
 
     # Ground roll time (assume constant acceleration to simplify)
     # Average thrust during ground roll ~ 80% of static thrust
@@ -264,157 +299,224 @@ def simulate_takeoff_segment(self, segment: MissionSegment, W_lb: float, S_ft2:
     V_climb_fps = 1.3 * V_stall_TO_fps
     climb_gradient = 0.08  # 8% gradient typical for takeoff
     ROC_fps = V_climb_fps * climb_gradient
-    t_climb_sec = 35 / ROC_fps if ROC_fps > 0 else 20
+    t_climb_sec = 35 / ROC_fps if ROC_fps > 0 else 20.0
 
     # Total time
-    time_sec = t_ground_sec + t_climb_sec
-
-    # Takeoff power (max continuous power, typically 95-100% rated)
-    P_takeoff_kW = self.powertrain.P_GT_kW * 0.95
-    if hasattr(self.powertrain, 'P_EM_kW') and self.powertrain.P_EM_kW > 0:
-        # Hybrid: can add electric power
-        P_takeoff_kW = self.powertrain.P_GT_kW + self.powertrain.P_EM_kW
-
-    # Power split
-    power_split = self.powertrain.get_power_split(P_takeoff_kW, segment.Hp)
-
-    # Add high-lift motor power if active (draws from battery)
-    P_highlift_kW = get_highlift_motor_power(self, segment.blown_lift_active)
-    P_highlift_W = P_highlift_kW * 1000.0
-
-    # Consumption (add high-lift motor energy to battery draw)
-    fuel_lb = power_split['fuel_rate_kg_s'] * time_sec * 2.20462
-    battery_Wh = (power_split['battery_power_W'] * time_sec) / 3600 + (P_highlift_W * time_sec) / 3600
-
-    return time_sec, fuel_lb, battery_Wh
-
-def simulate_loiter_segment(self, segment: MissionSegment, W_lb: float, S_ft2: float) -> Tuple:
-    """Loiter segment - level flight at best endurance speed"""
-    # Loiter altitude (pattern altitude, typically 450-1000 ft)
-    h_m = segment.altitude_start_ft * 0.3048
-    _, _, rho_kg_m3, _ = atmosisa(h_m)
-    rho_slug_ft3 = rho_kg_m3 / 515.379
-
-    # Apply blown lift augmentation if active
-    lift_aug_factor = self.get_lift_augmentation_factor(segment.blown_lift_active)
-    CLmax_clean_effective = self.CLmax_clean * lift_aug_factor
+    return t_ground_sec + t_climb_sec
 
+@njit(cache=True)
+def _loiter_core(rho_slug_ft3, W_lb, S_ft2, CLmax_clean_effective, CD0, K1, prop_efficiency):
+    """Loiter -> P_shaft_kW (level flight at best endurance speed)"""
     # Best endurance speed: minimum fuel flow = minimum (P_required)
     # For propeller aircraft: V_endurance ≈ V_stall * sqrt(3) * (1/sqrt(CD0/K1))
     # Simplified: fly at ~1.3 * V_stall for good L/D
     V_stall_fps = np.sqrt(2 * W_lb / (rho_slug_ft3 * S_ft2 * CLmax_clean_effective))
     V_loiter_fps = 1.3 * V_stall_fps
 
-    # Level flight power required
-    CL_base = W_lb / (0.5 * rho_slug_ft3 * V_loiter_fps**2 * S_ft2)
-    CL = CL_base * lift_aug_factor
-    # Note: CD calculation uses base CL since induced drag is based on actual circulation
-    CD = self.CD0 + self.K1 * CL_base**2
-    D_lb = 0.5 * rho_slug_ft3 * V_loiter_fps**2 * S_ft2 * CD
-
-    P_shaft_HP = D_lb * V_loiter_fps / (550 * self.tech.prop_efficiency)
-    P_shaft_kW = P_shaft_HP * 0.7457
-
-    # Power split
-    power_split = self.powertrain.get_power_split(P_shaft_kW, segment.Hp)
-
-    # Loiter time (typically 30 minutes for reserves - FAA requirement)
-    time_sec = 30 * 60  # 30 minutes
-
-    # Add high-lift motor power if active (draws from battery)
-    P_highlift_kW = get_highlift_motor_power(self, segment.blown_lift_active)
-    P_highlift_W = P_highlift_kW * 1000.0
-
-    # Consumption (add high-lift motor energy to battery draw)
-    fuel_lb = power_split['fuel_rate_kg_s'] * time_sec * 2.20462
-    battery_Wh = (power_split['battery_power_W'] * time_sec) / 3600 + (P_highlift_W * time_sec) / 3600
+    # Level flight power required (induced drag on the base CL = W/qS)
+    qS = 0.5 * rho_slug_ft3 * V_loiter_fps * V_loiter_fps * S_ft2
+    D_lb = qS * CD0 + K1 * W_lb * W_lb / qS
 
-    return time_sec, fuel_lb, battery_Wh
-
-def simulate_landing_segment(self, segment: MissionSegment, W_lb: float, S_ft2: float) -> Tuple:
-    """Landing segment - approach + flare + ground roll"""
-    # Pattern altitude conditions
-    h_m = segment.altitude_start_ft * 0.3048
-    _, _, rho_kg_m3, _ = atmosisa(h_m)
-    rho_slug_ft3 = rho_kg_m3 / 515.379
-
-    # Apply blown lift augmentation if active
-    lift_aug_factor = self.get_lift_augmentation_factor(segment.blown_lift_active)
-    CLmax_land_effective = self.CLmax_land * lift_aug_factor
+    return D_lb * V_loiter_fps * _KW_PER_FTLB_S / prop_efficiency
 
+@njit(cache=True)
+def _landing_core(rho_slug_ft3, W_lb, S_ft2, CLmax_land_effective, CD0, K1, prop_efficiency,
+                  alt_start_ft):
+    """Landing -> (time_sec, P_shaft_kW) (approach + flare + ground roll)"""
     # Approach speed (1.3 * stall speed with landing flaps)
     V_stall_land_fps = np.sqrt(2 * W_lb / (rho_slug_ft3 * S_ft2 * CLmax_land_effective))
     V_approach_fps = 1.3 * V_stall_land_fps
 
     # Approach phase (450 ft descent at 3° glideslope)
     gamma_approach = 3.0 * np.pi / 180  # 3° approach
-    descent_distance_ft = segment.altitude_start_ft / np.tan(gamma_approach)
+    descent_distance_ft = alt_start_ft / np.tan(gamma_approach)
     t_approach_sec = descent_distance_ft / V_approach_fps
 
-    # Power required for 3° approach (reduced thrust)
-    CL_base = W_lb / (0.5 * rho_slug_ft3 * V_approach_fps**2 * S_ft2)
-    CL = CL_base * lift_aug_factor
-    # Note: CD calculation uses base CL since induced drag is based on actual circulation
-    CD = self.CD0 + self.K1 * CL_base**2 + 0.02  # Extra drag from landing gear/flaps
-    D_lb = 0.5 * rho_slug_ft3 * V_approach_fps**2 * S_ft2 * CD
+    # Power required for 3° approach (reduced thrust); induced drag on the base CL = W/qS
+    qS = 0.5 * rho_slug_ft3 * V_approach_fps * V_approach_fps * S_ft2
+    D_lb = qS * (CD0 + 0.02) + K1 * W_lb * W_lb / qS  # +0.02: landing gear/flaps
     T_required_lb = D_lb - W_lb * np.sin(gamma_approach)
 
-    P_shaft_HP = max(0, T_required_lb * V_approach_fps / (550 * self.tech.prop_efficiency))
-    P_shaft_kW = P_shaft_HP * 0.7457
+    P_shaft_kW = max(0.0, T_required_lb * V_approach_fps * _KW_PER_FTLB_S / prop_efficiency)
 
     # Flare and ground roll (minimal power, reverse thrust not modeled)
     t_flare_rollout_sec = 30  # Typical: 20-40 seconds
 
     # Total time
-    time_sec = t_approach_sec + t_flare_rollout_sec
+    return t_approach_sec + t_flare_rollout_sec, P_shaft_kW
 
-    # Power split (average power during approach)
-    power_split = self.powertrain.get_power_split(P_shaft_kW, segment.Hp)
+# ======================= Simulation helpers ======================= #
+def _segment_consumption(self, P_shaft_kW: float, Hp: float, blown_lift: bool,
+                         time_sec: float) -> Tuple[float, float]:
+    """Fuel (lb) and battery energy (Wh) for a segment flown at P_shaft_kW for time_sec"""
+    # Power split
+    fuel_rate_kg_s, battery_power_W = self.powertrain.get_power_rates(P_shaft_kW, Hp)
 
-    # Add high-lift motor power if active (draws from battery)
-    P_highlift_kW = get_highlift_motor_power(self, segment.blown_lift_active)
-    P_highlift_W = P_highlift_kW * 1000.0
+    # Add high-lift motor power if active (draws from battery); same test as
+    # get_highlift_motor_power, inlined since this runs for every segment
+    if blown_lift and self.dep_enabled:
+        battery_power_W += self._dep_power_total_kW * 1000.0
 
     # Consumption (add high-lift motor energy to battery draw)
-    fuel_lb = power_split['fuel_rate_kg_s'] * time_sec * 2.20462
-    battery_Wh = (power_split['battery_power_W'] * time_sec) / 3600 + (P_highlift_W * time_sec) / 3600
+    fuel_lb = fuel_rate_kg_s * time_sec * KG_TO_LB
+    battery_Wh = battery_power_W * time_sec * _INV_3600
+    return fuel_lb, battery_Wh
+
+def simulate_cruise_segment(self, alt_start_ft: float, alt_end_ft: float, Hp: float, blown_lift: bool,
+                            W_lb: float, S_ft2: float) -> Tuple:
+    """Cruise segment simulation"""
+    # Atmosphere, speed and cruise time depend only on altitude and config
+    q_psf, V_fps, time_sec, kW_per_ftlb_s = _cruise_constants(self, alt_start_ft)
+
+    P_shaft_kW = _cruise_core(q_psf, V_fps, float(W_lb), float(S_ft2), self.CD0, self.K1,
+                              kW_per_ftlb_s)
+    fuel_lb, battery_Wh = _segment_consumption(self, P_shaft_kW, Hp, blown_lift, time_sec)
+    return time_sec, fuel_lb, battery_Wh
+
+def simulate_climb_segment(self, alt_start_ft: float, alt_end_ft: float, Hp: float, blown_lift: bool,
+                           W_lb: float, S_ft2: float) -> Tuple:
+    """Climb segment simulation"""
+    # Apply blown lift augmentation if active
+    lift_aug_factor = self.get_lift_augmentation_factor(blown_lift)
+    CLmax_clean_effective = self.CLmax_clean * lift_aug_factor
+
+    time_sec, P_shaft_kW = _climb_core(float(W_lb), float(S_ft2), CLmax_clean_effective,
+                                       lift_aug_factor, self.CD0, self.K1,
+                                       self.tech.prop_efficiency, alt_end_ft - alt_start_ft)
+    fuel_lb, battery_Wh = _segment_consumption(self, P_shaft_kW, Hp, blown_lift, time_sec)
+    return time_sec, fuel_lb, battery_Wh
+
+def simulate_descent_segment(self, alt_start_ft: float, alt_end_ft: float, Hp: float, blown_lift: bool,
+                             W_lb: float, S_ft2: float) -> Tuple:
+    """Descent segment - physics-based calculation with idle power"""
+    # Atmospheric conditions at average altitude
+    h_avg_ft = (alt_start_ft + alt_end_ft) / 2
+    rho_slug_ft3 = _segment_rho(self, h_avg_ft)
+
+    # Descent speed (slightly below cruise speed for passenger comfort)
+    V_descent_kts = self.cruise_speed_kts * 0.9
+    V_fps = V_descent_kts * _KTS_TO_FPS
+
+    # Flight idle: ~7% of rated power
+    P_idle_kW = self.powertrain.P_GT_kW * 0.07
+
+    time_sec, P_shaft_kW = _descent_core(rho_slug_ft3, V_fps, float(W_lb), float(S_ft2),
+                                         self.CD0, self.K1, self.tech.prop_efficiency,
+                                         float(P_idle_kW), alt_start_ft - alt_end_ft)
+    fuel_lb, battery_Wh = _segment_consumption(self, P_shaft_kW, Hp, blown_lift, time_sec)
+    return time_sec, fuel_lb, battery_Wh
+
+def simulate_takeoff_segment(self, alt_start_ft: float, alt_end_ft: float, Hp: float, blown_lift: bool,
+                             W_lb: float, S_ft2: float) -> Tuple:
+    """Takeoff segment - ground roll + rotation + climb to 35 ft"""
+    # Apply blown lift augmentation if active
+    lift_aug_factor = self.get_lift_augmentation_factor(blown_lift)
+    CLmax_TO_effective = self.CLmax_TO * lift_aug_factor
+
+    time_sec = _takeoff_core(float(W_lb), float(S_ft2), CLmax_TO_effective)
+
+    # Takeoff power (max continuous power, typically 95-100% rated)
+    powertrain = self.powertrain
+    P_GT_kW = powertrain.P_GT_kW
+    P_EM_kW = getattr(powertrain, 'P_EM_kW', 0.0)
+    P_takeoff_kW = P_GT_kW * 0.95
+    if P_EM_kW > 0:
+        # Hybrid: can add electric power
+        P_takeoff_kW = P_GT_kW + P_EM_kW
+
+    fuel_lb, battery_Wh = _segment_consumption(self, P_takeoff_kW, Hp, blown_lift, time_sec)
+    return time_sec, fuel_lb, battery_Wh
+
+def simulate_loiter_segment(self, alt_start_ft: float, alt_end_ft: float, Hp: float, blown_lift: bool,
+                            W_lb: float, S_ft2: float) -> Tuple:
+    """Loiter segment - level flight at best endurance speed"""
+    # Loiter altitude (pattern altitude, typically 450-1000 ft)
+    rho_slug_ft3 = _segment_rho(self, alt_start_ft)
+
+    # Apply blown lift augmentation if active
+    lift_aug_factor = self.get_lift_augmentation_factor(blown_lift)
+    CLmax_clean_effective = self.CLmax_clean * lift_aug_factor
+
+    P_shaft_kW = _loiter_core(rho_slug_ft3, float(W_lb), float(S_ft2), CLmax_clean_effective,
+                              self.CD0, self.K1, self.tech.prop_efficiency)
+
+    # Loiter time (typically 30 minutes for reserves - FAA requirement)
+    time_sec = 30 * 60  # 30 minutes
+
+    fuel_lb, battery_Wh = _segment_consumption(self, P_shaft_kW, Hp, blown_lift, time_sec)
+    return time_sec, fuel_lb, battery_Wh
+
+def simulate_landing_segment(self, alt_start_ft: float, alt_end_ft: float, Hp: float, blown_lift: bool,
+                             W_lb: float, S_ft2: float) -> Tuple:
+    """Landing segment - approach + flare + ground roll"""
+    # Pattern altitude conditions
+    rho_slug_ft3 = _segment_rho(self, alt_start_ft)
+
+    # Apply blown lift augmentation if active
+    lift_aug_factor = self.get_lift_augmentation_factor(blown_lift)
+    CLmax_land_effective = self.CLmax_land * lift_aug_factor
 
+    # Power required is the average during the approach
+    time_sec, P_shaft_kW = _landing_core(rho_slug_ft3, float(W_lb), float(S_ft2),
+                                         CLmax_land_effective, self.CD0, self.K1,
+                                         self.tech.prop_efficiency, float(alt_start_ft))
+    fuel_lb, battery_Wh = _segment_consumption(self, P_shaft_kW, Hp, blown_lift, time_sec)
     return time_sec, fuel_lb, battery_Wh
 
+# Segment name -> simulator, same (self, alt_start_ft, alt_end_ft, Hp, blown_lift, W_lb, S_ft2) signature
+_SIM_DISPATCH = {
+    'takeoff': simulate_takeoff_segment,
+    'climb': simulate_climb_segment,
+    'cruise': simulate_cruise_segment,
+    'descent': simulate_descent_segment,
+    'loiter': simulate_loiter_segment,
+    'landing': simulate_landing_segment,
+}
+
 # ======================= Public API ======================= #
-def simulate_mission(self, segments: List[MissionSegment], TOGW_lb: float,
+def simulate_mission(self, segments: Union[np.ndarray, List[MissionSegment]], TOGW_lb: float,
                         S_wing_ft2: float) -> Dict:
     """Time-stepping mission simulation (Method A approach)"""
+    if not isinstance(segments, np.ndarray):
+        # Legacy callers may still pass a list of MissionSegment objects
+        return _simulate_segment_list(self, segments, TOGW_lb, S_wing_ft2)
+
+    names = segments['name'].tolist()
+    if names == _STANDARD_NAMES:
+        return simulate_standard_mission(self, segments, TOGW_lb, S_wing_ft2)
+
     W_current_lb = TOGW_lb
     total_fuel_lb = 0.0
     total_battery_Wh = 0.0
     total_time_sec = 0.0
 
-    for segment in segments:
+    # Per-segment results as parallel arrays (for vectorized post-processing)
+    n_segments = len(segments)
+    time_sec_arr = np.empty(n_segments)
+    fuel_lb_arr = np.empty(n_segments)
+    battery_Wh_arr = np.empty(n_segments)
+
+    # Pull each field out once as a column; rows are then plain Python scalars
+    simulator_for = _SIM_DISPATCH.get
+    profile = zip(names, segments['alt_start'].tolist(),
+                  segments['alt_end'].tolist(), segments['Hp'].tolist(),
+                  segments['blown_lift'].tolist())
+
+    for i, (name, h_start, h_end, Hp, blown) in enumerate(profile):
         # Simulate based on segment type
-        if segment.name == 'cruise':
-            t, f, b = simulate_cruise_segment(self, segment, W_current_lb, S_wing_ft2)
-        elif segment.name == 'climb':
-            t, f, b = simulate_climb_segment(self, segment, W_current_lb, S_wing_ft2)
-        elif segment.name == 'descent':
-            t, f, b = simulate_descent_segment(self, segment, W_current_lb, S_wing_ft2)
-        elif segment.name == 'takeoff':
-            t, f, b = simulate_takeoff_segment(self, segment, W_current_lb, S_wing_ft2)
-        elif segment.name == 'loiter':
-            t, f, b = simulate_loiter_segment(self, segment, W_current_lb, S_wing_ft2)
-        elif segment.name == 'landing':
-            t, f, b = simulate_landing_segment(self, segment, W_current_lb, S_wing_ft2)
-        else:
+        simulate_segment = simulator_for(name)
+        if simulate_segment is None:
             # Fallback for unknown segment types
-            raise ValueError(f"Unknown segment type: {segment.name}")
+            raise ValueError(f"Unknown segment type: {name}")
+        t, f, b = simulate_segment(self, h_start, h_end, Hp, blown, W_current_lb, S_wing_ft2)
 
         # Update weight
         W_current_lb -= f
 
         # Store results
-        segment.time_sec = t
-        segment.fuel_lb = f
-        segment.battery_Wh = b
+        time_sec_arr[i] = t
+        fuel_lb_arr[i] = f
+        battery_Wh_arr[i] = b
 
         # Accumulate
         total_fuel_lb += f
@@ -425,5 +527,249 @@ def simulate_mission(self, segments: List[MissionSegment], TOGW_lb: float,
         'total_fuel_lb': total_fuel_lb,
         'total_battery_Wh': total_battery_Wh,
         'total_time_sec': total_time_sec,
-        'segments': segments
+        'segments': segments,
+        'time_sec_arr': time_sec_arr,
+        'fuel_lb_arr': fuel_lb_arr,
+        'battery_Wh_arr': battery_Wh_arr,
+        'name_arr': segments['name'],
+    }
+
+def _simulate_segment_list(self, segment_list: List[MissionSegment], TOGW_lb: float,
+                           S_wing_ft2: float) -> Dict:
+    """simulate_mission for a MissionSegment list: results are also written onto the objects"""
+    results = simulate_mission(self, segments_to_array(segment_list), TOGW_lb, S_wing_ft2)
+    for segment, t, f, b in zip(segment_list, results['time_sec_arr'].tolist(),
+                                results['fuel_lb_arr'].tolist(),
+                                results['battery_Wh_arr'].tolist()):
+        segment.time_sec = t
+        segment.fuel_lb = f
+        segment.battery_Wh = b
+        if segment.name == 'cruise':
+            segment.distance_nm = self.range_nm
+    results['segments'] = segment_list
+    return results
+
+_STANDARD_NAMES = list(SEGMENT_NAMES)
+
+def simulate_standard_mission(self, segments: np.ndarray, TOGW_lb: float,
+                              S_wing_ft2: float) -> Dict:
+    """
+    simulate_mission for the create_mission profile (SEGMENT_NAMES, in order), unrolled.
+
+    Same results as the generic loop, without the per-segment dispatch; simulate_mission
+    delegates here whenever the segment names match.
+    """
+    alt0 = segments['alt_start'].tolist()
+    alt1 = segments['alt_end'].tolist()
+    Hp = segments['Hp'].tolist()
+    blown = segments['blown_lift'].tolist()
+    S = S_wing_ft2
+
+    W = TOGW_lb
+    t0, f0, b0 = simulate_takeoff_segment(self, alt0[0], alt1[0], Hp[0], blown[0], W, S)
+    W -= f0
+    t1, f1, b1 = simulate_climb_segment(self, alt0[1], alt1[1], Hp[1], blown[1], W, S)
+    W -= f1
+    t2, f2, b2 = simulate_cruise_segment(self, alt0[2], alt1[2], Hp[2], blown[2], W, S)
+    W -= f2
+    t3, f3, b3 = simulate_descent_segment(self, alt0[3], alt1[3], Hp[3], blown[3], W, S)
+    W -= f3
+    t4, f4, b4 = simulate_loiter_segment(self, alt0[4], alt1[4], Hp[4], blown[4], W, S)
+    W -= f4
+    t5, f5, b5 = simulate_landing_segment(self, alt0[5], alt1[5], Hp[5], blown[5], W, S)
+
+    return {
+        'total_fuel_lb': f0 + f1 + f2 + f3 + f4 + f5,
+        'total_battery_Wh': b0 + b1 + b2 + b3 + b4 + b5,
+        'total_time_sec': t0 + t1 + t2 + t3 + t4 + t5,
+        'segments': segments,
+        'time_sec_arr': np.array((t0, t1, t2, t3, t4, t5), dtype=float),
+        'fuel_lb_arr': np.array((f0, f1, f2, f3, f4, f5), dtype=float),
+        'battery_Wh_arr': np.array((b0, b1, b2, b3, b4, b5), dtype=float),
+        'name_arr': segments['name'],
+    }
+
+# ======================= Batched design sweeps ======================= #
+# Array twins of the segment kernels: W_lb and S_ft2 are length-N arrays (one entry per
+# design), everything else is shared by the sweep. Same formulas as the scalar kernels.
+
+def _cruise_vec(q_psf, V_fps, W_lb, S_ft2, CD0, K1, kW_per_ftlb_s):
+    """Cruise -> P_shaft_kW array"""
+    qS = q_psf * S_ft2
+    D_lb = qS * CD0 + K1 * W_lb * W_lb / qS
+    return D_lb * V_fps * kW_per_ftlb_s
+
+def _climb_vec(W_lb, S_ft2, CLmax_clean_effective, lift_aug_factor, CD0, K1, prop_efficiency,
+               alt_change_ft):
+    """Climb -> (time_sec, P_shaft_kW) arrays"""
+    W_avg = W_lb * 0.99
+    rho_sl = 0.002377
+    V_climb_fps = 1.3 * np.sqrt(2 * W_avg / (rho_sl * S_ft2 * CLmax_clean_effective))
+    gamma = 0.05
+    ROC_fps = V_climb_fps * gamma
+    qS = 0.5 * rho_sl * V_climb_fps * V_climb_fps * S_ft2
+    D_lb = qS * CD0 + K1 * W_avg * W_avg / qS
+    T_lb = D_lb / lift_aug_factor + W_avg * gamma
+    P_shaft_kW = T_lb * V_climb_fps * _KW_PER_FTLB_S / prop_efficiency
+    with np.errstate(divide='ignore', invalid='ignore'):
+        time_sec = np.where(ROC_fps > 0, alt_change_ft / ROC_fps, 600.0)
+    return time_sec, P_shaft_kW
+
+def _descent_vec(rho_slug_ft3, V_fps, W_lb, S_ft2, CD0, K1, prop_efficiency, P_idle_kW,
+                 alt_change_ft):
+    """Descent -> (time_sec, P_shaft_kW) arrays"""
+    descent_rate_fps = 600 / 60
+    gamma = math.atan(descent_rate_fps / V_fps)
+    W_effective = W_lb * math.cos(gamma)
+    qS = 0.5 * rho_slug_ft3 * V_fps * V_fps * S_ft2
+    D_lb = qS * CD0 + K1 * W_effective * W_effective / qS
+    T_required_lb = D_lb - W_lb * math.sin(gamma)
+    # Power required, never below flight idle (negative thrust -> flight idle)
+    P_shaft_kW = np.maximum(np.maximum(0.0, T_required_lb) * V_fps * _KW_PER_FTLB_S / prop_efficiency,
+                            P_idle_kW)
+    time_sec = np.full(W_lb.shape, alt_change_ft / descent_rate_fps, dtype=W_lb.dtype)
+    return time_sec, P_shaft_kW
+
+def _takeoff_vec(W_lb, S_ft2, CLmax_TO_effective):
+    """Takeoff -> time_sec array"""
+    rho_sl = 0.002377
+    V_stall_TO_fps = np.sqrt(2 * W_lb / (rho_sl * S_ft2 * CLmax_TO_effective))
+    ROC_fps = 1.3 * V_stall_TO_fps * 0.08
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_climb_sec = np.where(ROC_fps > 0, 35 / ROC_fps, 20.0)
+    return 30 + t_climb_sec
+
+def _loiter_vec(rho_slug_ft3, W_lb, S_ft2, CLmax_clean_effective, CD0, K1, prop_efficiency):
+    """Loiter -> P_shaft_kW array"""
+    V_loiter_fps = 1.3 * np.sqrt(2 * W_lb / (rho_slug_ft3 * S_ft2 * CLmax_clean_effective))
+    qS = 0.5 * rho_slug_ft3 * V_loiter_fps * V_loiter_fps * S_ft2
+    D_lb = qS * CD0 + K1 * W_lb * W_lb / qS
+    return D_lb * V_loiter_fps * _KW_PER_FTLB_S / prop_efficiency
+
+def _landing_vec(rho_slug_ft3, W_lb, S_ft2, CLmax_land_effective, CD0, K1, prop_efficiency,
+                 alt_start_ft):
+    """Landing -> (time_sec, P_shaft_kW) arrays"""
+    V_approach_fps = 1.3 * np.sqrt(2 * W_lb / (rho_slug_ft3 * S_ft2 * CLmax_land_effective))
+    gamma_approach = 3.0 * np.pi / 180
+    t_approach_sec = alt_start_ft / math.tan(gamma_approach) / V_approach_fps
+    qS = 0.5 * rho_slug_ft3 * V_approach_fps * V_approach_fps * S_ft2
+    D_lb = qS * (CD0 + 0.02) + K1 * W_lb * W_lb / qS
+    T_required_lb = D_lb - W_lb * math.sin(gamma_approach)
+    P_shaft_kW = np.maximum(0.0, T_required_lb * V_approach_fps * _KW_PER_FTLB_S / prop_efficiency)
+    return t_approach_sec + 30, P_shaft_kW
+
+def _power_split_arrays(powertrain, P_shaft_kW: np.ndarray,
+                        Hp: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(fuel_rate_kg_s, battery_power_W) arrays, vectorized when the powertrain supports it"""
+    split_vec = getattr(powertrain, 'get_power_split_vec', None)
+    if split_vec is not None:
+        split = split_vec(P_shaft_kW, Hp)
+        return split['fuel_rate_kg_s'], split['battery_power_W']
+    Hp = np.broadcast_to(Hp, P_shaft_kW.shape)
+    rates = [powertrain.get_power_rates(P, h) for P, h in zip(P_shaft_kW.tolist(), Hp.tolist())]
+    return (np.array([r[0] for r in rates], dtype=P_shaft_kW.dtype),
+            np.array([r[1] for r in rates], dtype=P_shaft_kW.dtype))
+
+def simulate_mission_batch(self, segments: Union[SegmentBatch, np.ndarray, List[MissionSegment]],
+                           TOGW_lb: np.ndarray, S_wing_ft2: np.ndarray,
+                           dtype=np.float64) -> Dict:
+    """
+    simulate_mission over N designs at once, one array pass per segment.
+
+    All designs share the segment altitudes, the aircraft aerodynamics and the powertrain
+    as currently sized; TOGW, wing area and (with a SegmentBatch) Hp vary.
+
+    Args:
+        segments: Mission profile (SegmentBatch, SEGMENT_DTYPE array or list of MissionSegment)
+        TOGW_lb: Takeoff gross weight per design, array (or float)
+        S_wing_ft2: Wing area per design, array broadcastable against TOGW_lb (or float)
+        dtype: Working precision of the per-design arrays; np.float32 halves the memory
+            traffic of large sweeps (the model is only good to ~1% anyway). Totals are
+            always accumulated in float64.
+
+    Returns:
+        Dict with the simulate_mission keys; totals are length-N arrays, the
+        per-segment arrays have shape (N, n_segments) and 'segments' is a SegmentBatch
+    """
+    if not isinstance(segments, SegmentBatch):
+        if not isinstance(segments, np.ndarray):
+            segments = segments_to_array(segments)
+        segments = SegmentBatch.from_array(segments)
+
+    dtype = np.dtype(dtype)
+    W_lb, S_ft2 = np.broadcast_arrays(np.asarray(TOGW_lb, dtype=dtype),
+                                      np.asarray(S_wing_ft2, dtype=dtype))
+    W_current_lb = W_lb.astype(dtype).ravel()
+    S_ft2 = S_ft2.astype(dtype).ravel()
+    n_designs = W_current_lb.shape[0]
+    n_segments = len(segments)
+
+    time_sec_arr = np.empty((n_designs, n_segments), dtype=dtype)
+    fuel_lb_arr = np.empty((n_designs, n_segments), dtype=dtype)
+    battery_Wh_arr = np.empty((n_designs, n_segments), dtype=dtype)
+
+    # Scalars go in as Python floats so they don't promote float32 arrays
+    CD0, K1 = float(self.CD0), float(self.K1)
+    prop_efficiency = float(self.tech.prop_efficiency)
+    P_GT_kW = float(self.powertrain.P_GT_kW)
+    alt0, alt1, blown_arr = segments.alt0.tolist(), segments.alt1.tolist(), segments.blown.tolist()
+    Hp_arr = segments.Hp.astype(dtype, copy=False)
+
+    for i, name in enumerate(segments.names):
+        h_start, h_end, blown = alt0[i], alt1[i], blown_arr[i]
+        Hp = Hp_arr[:, i]
+        # Blown lift only enters through CLmax, so cruise and descent skip the lookup
+        if name == 'cruise':
+            q_psf, V_fps, time_sec, kW_per_ftlb_s = _cruise_constants(self, h_start)
+            P = _cruise_vec(q_psf, V_fps, W_current_lb, S_ft2, CD0, K1, kW_per_ftlb_s)
+            t = np.full(n_designs, time_sec, dtype=dtype)
+        elif name == 'climb':
+            lift_aug_factor = float(self.get_lift_augmentation_factor(blown))
+            t, P = _climb_vec(W_current_lb, S_ft2, self.CLmax_clean * lift_aug_factor,
+                              lift_aug_factor, CD0, K1, prop_efficiency, h_end - h_start)
+        elif name == 'descent':
+            t, P = _descent_vec(_segment_rho(self, (h_start + h_end) / 2),
+                                self.cruise_speed_kts * 0.9 * _KTS_TO_FPS,
+                                W_current_lb, S_ft2, CD0, K1, prop_efficiency,
+                                P_GT_kW * 0.07, h_start - h_end)
+        elif name == 'takeoff':
+            lift_aug_factor = float(self.get_lift_augmentation_factor(blown))
+            t = _takeoff_vec(W_current_lb, S_ft2, self.CLmax_TO * lift_aug_factor)
+            P_takeoff_kW = P_GT_kW * 0.95
+            if hasattr(self.powertrain, 'P_EM_kW') and self.powertrain.P_EM_kW > 0:
+                P_takeoff_kW = P_GT_kW + float(self.powertrain.P_EM_kW)
+            P = np.full(n_designs, P_takeoff_kW, dtype=dtype)
+        elif name == 'loiter':
+            lift_aug_factor = float(self.get_lift_augmentation_factor(blown))
+            P = _loiter_vec(_segment_rho(self, h_start), W_current_lb, S_ft2,
+                            self.CLmax_clean * lift_aug_factor, CD0, K1, prop_efficiency)
+            t = np.full(n_designs, 30 * 60.0, dtype=dtype)
+        elif name == 'landing':
+            lift_aug_factor = float(self.get_lift_augmentation_factor(blown))
+            t, P = _landing_vec(_segment_rho(self, h_start), W_current_lb, S_ft2,
+                                self.CLmax_land * lift_aug_factor, CD0, K1, prop_efficiency, h_start)
+        else:
+            raise ValueError(f"Unknown segment type: {name}")
+
+        fuel_rate_kg_s, battery_power_W = _power_split_arrays(self.powertrain, P, Hp)
+        P_highlift_W = float(get_highlift_motor_power(self, blown)) * 1000.0
+        f = fuel_rate_kg_s * t * KG_TO_LB
+        b = (battery_power_W + P_highlift_W) * t * _INV_3600
+
+        # Update weight
+        W_current_lb = W_current_lb - f
+
+        time_sec_arr[:, i] = t
+        fuel_lb_arr[:, i] = f
+        battery_Wh_arr[:, i] = b
+
+    return {
+        'total_fuel_lb': fuel_lb_arr.sum(axis=1, dtype=np.float64),
+        'total_battery_Wh': battery_Wh_arr.sum(axis=1, dtype=np.float64),
+        'total_time_sec': time_sec_arr.sum(axis=1, dtype=np.float64),
+        'segments': segments,
+        'time_sec_arr': time_sec_arr,
+        'fuel_lb_arr': fuel_lb_arr,
+        'battery_Wh_arr': battery_Wh_arr,
+        'name_arr': np.array(segments.names),
     }
@@ -1,13 +1,151 @@
-from dataclasses import dataclass
-from typing import Dict, Optional
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+import sys
+import weakref
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+from _jit import njit, prange
+from units import KG_TO_LB
 
 # NOTE: config_loader is not imported here; TechnologySpec is created via from_config in main file.
 
-@dataclass
+# from_config results: config object -> (config.version, spec). Weakly keyed, so an entry
+# goes away with its config, and a newer version replaces the stale one.
+_TECH_CACHE: 'weakref.WeakKeyDictionary[Any, Tuple[int, TechnologySpec]]' = weakref.WeakKeyDictionary()
+
+
+def clear_tech_cache():
+    """Drop all memoized TechnologySpec.from_config results."""
+    _TECH_CACHE.clear()
+
+
+class Architecture(IntEnum):
+    """Architecture tags for _power_split and sweep_power_splits"""
+    CONVENTIONAL = 0
+    PARALLEL = 1
+    SERIAL = 2
+    FULLY_ELECTRIC = 3
+
+
+# Plain-int tags for the split kernels (Numba folds module-level ints as constants)
+_CONVENTIONAL, _PARALLEL, _SERIAL, _FULLY_ELECTRIC = (int(arch) for arch in Architecture)
+
+# Input types the size_components memo applies to (np.float64 is a float subclass)
+_SCALAR_TYPES = (int, float)
+
+
+@njit(cache=True)
+def _power_split(arch, P_required_kW, Hp, P_GEN_kW, bsfc_per_s, inv_EM_eff, inv_EM_eff_x1000,
+                 inv_GEN_eff):
+    """
+    Single-shaft power split for any Architecture
+    -> (P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W).
+    The tech constants are TechnologySpec._split_consts; P_GEN_kW is used by SERIAL only.
+    """
+    if arch == _SERIAL:
+        P_electric_kW = P_required_kW * inv_EM_eff
+        # Generator up to its rating, battery supplies the rest
+        P_generator_kW = P_electric_kW if P_electric_kW < P_GEN_kW else P_GEN_kW
+        P_battery_kW = P_electric_kW - P_generator_kW
+        if P_battery_kW < 0.0:
+            P_battery_kW = 0.0
+        P_GT_kW = P_generator_kW * inv_GEN_eff
+        return P_GT_kW, P_required_kW, P_GT_kW * bsfc_per_s, P_battery_kW * 1000
+    if arch == _PARALLEL:
+        P_GT_kW = P_required_kW * (1 - Hp)
+        P_EM_kW = P_required_kW * Hp
+    elif arch == _CONVENTIONAL:
+        P_GT_kW = P_required_kW
+        P_EM_kW = 0.0
+    else:
+        P_GT_kW = 0.0
+        P_EM_kW = P_required_kW
+    return P_GT_kW, P_EM_kW, P_GT_kW * bsfc_per_s, P_EM_kW * inv_EM_eff_x1000
+
+
+def _power_split_vec(arch, P_required_kW, Hp, P_GEN_kW, bsfc_per_s, inv_EM_eff,
+                     inv_EM_eff_x1000, inv_GEN_eff):
+    """_power_split over arrays: same arithmetic and results per element, dtype of P kept"""
+    if arch == _SERIAL:
+        P_electric_kW = P_required_kW * inv_EM_eff
+        P_generator_kW = np.minimum(P_electric_kW, P_GEN_kW)
+        P_battery_kW = np.maximum(0.0, P_electric_kW - P_generator_kW)
+        P_GT_kW = P_generator_kW * inv_GEN_eff
+        return P_GT_kW, P_required_kW, P_GT_kW * bsfc_per_s, P_battery_kW * 1000
+    if arch == _PARALLEL:
+        P_GT_kW = P_required_kW * (1 - Hp)
+        P_EM_kW = P_required_kW * Hp
+    elif arch == _CONVENTIONAL:
+        P_GT_kW = P_required_kW
+        P_EM_kW = np.zeros_like(P_required_kW)
+    else:
+        P_GT_kW = np.zeros_like(P_required_kW)
+        P_EM_kW = P_required_kW
+    return P_GT_kW, P_EM_kW, P_GT_kW * bsfc_per_s, P_EM_kW * inv_EM_eff_x1000
+
+
+@njit(cache=True)
+def _multi_engine_split(P_per_engine_kW, Hp, num_operating_engines, bsfc_per_s, inv_EM_eff_x1000):
+    """Per-engine parallel split -> (P_GT_per_engine_kW, P_EM_per_engine_kW, P_GT_total_kW,
+    P_EM_total_kW, fuel_rate_kg_s, battery_power_W)"""
+    P_GT_per_engine_kW = P_per_engine_kW * (1 - Hp)
+    P_EM_per_engine_kW = P_per_engine_kW * Hp
+    P_GT_total_kW = P_GT_per_engine_kW * num_operating_engines
+    P_EM_total_kW = P_EM_per_engine_kW * num_operating_engines
+    return (P_GT_per_engine_kW, P_EM_per_engine_kW, P_GT_total_kW, P_EM_total_kW,
+            P_GT_total_kW * bsfc_per_s, P_EM_total_kW * inv_EM_eff_x1000)
+
+
+# The same kernels as plain Python, for get_power_rates on the per-segment mission path
+# (where calling into compiled code costs more than the few multiplies it saves) and, for
+# the multi-engine split, directly on arrays
+_power_split_py = getattr(_power_split, 'py_func', _power_split)
+_multi_engine_split_py = getattr(_multi_engine_split, 'py_func', _multi_engine_split)
+
+
+@njit(parallel=True, cache=True)
+def _size_multi_engine_grid(P_shaft_kW, Hp, num_engines, lb_per_kW_GT, lb_per_kW_EM):
+    """MultiEnginePowertrain.size_components masses over the P_shaft_kW x Hp grid"""
+    N, M = P_shaft_kW.size, Hp.size
+    m_GT_lb = np.empty((N, M))
+    m_EM_lb = np.empty((N, M))
+    for i in prange(N):
+        P_per_engine_kW = P_shaft_kW[i] / num_engines
+        for j in range(M):
+            # Same operation order as the scalar sizing, so results match it exactly
+            m_GT_lb[i, j] = (P_per_engine_kW * (1 - Hp[j])) * lb_per_kW_GT * num_engines
+            m_EM_lb[i, j] = (P_per_engine_kW * Hp[j]) * lb_per_kW_EM * num_engines
+    return m_GT_lb, m_EM_lb
+
+
+def _split_arrays(P_required_kW, Hp) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(P_required_kW, Hp, zeros) as arrays of their broadcast shape for get_power_split_vec"""
+    # float32 inputs stay float32 (batched sweeps); everything else is float64
+    dtype = np.result_type(np.asarray(P_required_kW).dtype, np.float32)
+    P_required_kW, Hp = np.broadcast_arrays(np.asarray(P_required_kW, dtype=dtype),
+                                            np.asarray(Hp, dtype=dtype))
+    return P_required_kW, Hp, np.zeros(P_required_kW.shape, dtype=dtype)
+
+
+# Column order of the component-state rows (component_state / size_components_batch)
+COMPONENT_FIELDS = ('m_GT_lb', 'm_EM_lb', 'm_GEN_lb', 'm_battery_lb', 'm_fuel_lb',
+                    'P_GT_kW', 'P_EM_kW', 'P_GEN_kW')
+_M_GT, _M_EM, _M_GEN, _M_BAT, _M_FUEL, _P_GT, _P_EM, _P_GEN = range(len(COMPONENT_FIELDS))
+
+
+def _reciprocal(value: Optional[float]) -> Optional[float]:
+    """1/value, or None for a missing or zero spec (unused by that architecture)"""
+    return 1.0 / value if value else None
+
+
+@dataclass(slots=True, frozen=True)
 class TechnologySpec:
     """
     Component technology specifications.
     Values are provided via a config-like object with .get(section, key, subkey).
+    Immutable once created (frozen), so instances can be shared and hashed.
     """
     GT_specific_power_kW_kg: float = None
     GT_efficiency: float = None
@@ -21,10 +159,46 @@ class TechnologySpec:
     battery_SOC_margin: float = None
     battery_DOD: float = None
     prop_efficiency: float = None
+    # Derived once in __post_init__ so the power split multiplies instead of divides
+    _bsfc_per_s: float = field(init=False, repr=False, compare=False)       # kg/s per kW
+    _inv_EM_eff: float = field(init=False, repr=False, compare=False)
+    _inv_EM_eff_x1000: float = field(init=False, repr=False, compare=False)  # W per shaft kW
+    _inv_GEN_eff: float = field(init=False, repr=False, compare=False)
+    _lb_per_kW_GT: float = field(init=False, repr=False, compare=False)     # component lb per kW
+    _lb_per_kW_EM: float = field(init=False, repr=False, compare=False)
+    _lb_per_kW_GEN: float = field(init=False, repr=False, compare=False)
+    # (bsfc_per_s, inv_EM_eff, inv_EM_eff_x1000, inv_GEN_eff) for _power_split, 0.0 if unset
+    _split_consts: Tuple[float, float, float, float] = field(init=False, repr=False,
+                                                             compare=False)
+
+    def __post_init__(self):
+        inv_EM_eff = _reciprocal(self.EM_efficiency)
+        bsfc = self.GT_BSFC_kg_kWh
+        object.__setattr__(self, '_bsfc_per_s', None if bsfc is None else bsfc / 3600)
+        object.__setattr__(self, '_inv_EM_eff', inv_EM_eff)
+        object.__setattr__(self, '_inv_EM_eff_x1000', None if inv_EM_eff is None else 1000 * inv_EM_eff)
+        object.__setattr__(self, '_inv_GEN_eff', _reciprocal(self.GEN_efficiency))
+        for name, specific_power in (('_lb_per_kW_GT', self.GT_specific_power_kW_kg),
+                                     ('_lb_per_kW_EM', self.EM_specific_power_kW_kg),
+                                     ('_lb_per_kW_GEN', self.GEN_specific_power_kW_kg)):
+            inv = _reciprocal(specific_power)
+            object.__setattr__(self, name, None if inv is None else KG_TO_LB * inv)
+        object.__setattr__(self, '_split_consts', tuple(
+            float(value or 0.0) for value in (self._bsfc_per_s, self._inv_EM_eff,
+                                              self._inv_EM_eff_x1000, self._inv_GEN_eff)))
 
     @classmethod
     def from_config(cls, cfg):
-        return cls(
+        """Build (or reuse) the spec for a config; memoized per config instance and version."""
+        version = getattr(cfg, 'version', 0)
+        try:
+            cached = _TECH_CACHE.get(cfg)
+            cacheable = True
+        except TypeError:  # config object cannot be weakly referenced: build uncached
+            cached, cacheable = None, False
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        spec = cls(
             GT_specific_power_kW_kg=cfg.get('hybrid_system', 'gas_turbine', 'specific_power_kW_kg'),
             GT_efficiency=cfg.get('hybrid_system', 'gas_turbine', 'efficiency'),
             GT_BSFC_kg_kWh=cfg.get('hybrid_system', 'gas_turbine', 'BSFC_kg_kWh'),
@@ -38,9 +212,25 @@ class TechnologySpec:
             battery_DOD=cfg.get('hybrid_system', 'battery', 'depth_of_discharge_percent') / 100,
             prop_efficiency=cfg.get('propulsion', 'propeller_efficiency'),
         )
+        if cacheable:
+            _TECH_CACHE[cfg] = (version, spec)
+        return spec
+
+    def asdict(self) -> Dict[str, Optional[float]]:
+        """The configured specs as a plain dict (for config logging); derived fields omitted"""
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
+
 
-class PowertrainBase:
+# Init field names, computed once rather than walking dataclasses.fields() per asdict()
+TechnologySpec._FIELD_NAMES = tuple(f.name for f in fields(TechnologySpec) if f.init)
+
+class PowertrainBase(ABC):
     """Base class for all powertrain architectures"""
+    __slots__ = ('name', 'tech', 'm_GT_lb', 'm_EM_lb', 'm_GEN_lb', 'm_battery_lb', 'm_fuel_lb',
+                 'P_GT_kW', 'P_EM_kW', 'P_GEN_kW', '_sized_for')
+    # Architecture tag (int value) passed to _power_split (single-shaft architectures only)
+    ARCH: Optional[int] = None
+
     def __init__(self, name: str, tech: TechnologySpec):
         self.name = name
         self.tech = tech
@@ -54,63 +244,179 @@ class PowertrainBase:
         self.P_GT_kW = 0.0
         self.P_EM_kW = 0.0
         self.P_GEN_kW = 0.0
+        # (P_shaft_kW, Hp, tech) of the last completed scalar size_components call
+        self._sized_for: Optional[Tuple[float, float, TechnologySpec]] = None
 
+    @abstractmethod
     def size_components(self, P_shaft_kW: float, Hp: float):
-        raise NotImplementedError
+        """Size component powers and masses for the design shaft power and Hp"""
+
+    def _is_sized_for(self, P_shaft_kW: float, Hp: float) -> bool:
+        """
+        True if the last completed size_components call had exactly these (scalar) inputs
+        and this tech. Array inputs are never memoized. Otherwise the memo is cleared until
+        _record_sized_for runs, so a sizing that raises part-way is never taken as done.
+        """
+        last = self._sized_for
+        if (last is not None and isinstance(P_shaft_kW, _SCALAR_TYPES)
+                and isinstance(Hp, _SCALAR_TYPES) and last[2] is self.tech
+                and last[0] == P_shaft_kW and last[1] == Hp):
+            return True
+        self._sized_for = None
+        return False
+
+    def _record_sized_for(self, P_shaft_kW: float, Hp: float):
+        """Remember the inputs of a size_components call once its sizing body has finished"""
+        if isinstance(P_shaft_kW, _SCALAR_TYPES) and isinstance(Hp, _SCALAR_TYPES):
+            self._sized_for = (P_shaft_kW, Hp, self.tech)
+        else:
+            self._sized_for = None
 
+    @abstractmethod
     def get_power_split(self, P_required_kW: float, Hp: float) -> Dict:
-        raise NotImplementedError
+        """
+        Power distribution at one operating point, for reporting.
+
+        Returns:
+            Dict with P_GT_kW, P_EM_kW, fuel_rate_kg_s and battery_power_W (plus any
+            architecture-specific entries). Loops that only need the consumption rates
+            should call get_power_rates, which returns a plain tuple.
+        """
+
+    # Single-shaft architectures implement get_power_split / get_power_rates /
+    # get_power_split_vec with these, so the split arithmetic lives only in _power_split
+    # (and its array form _power_split_vec)
+    def _split_dict(self, P_required_kW: float, Hp: float) -> Dict:
+        """get_power_split dict computed by the compiled _power_split kernel for self.ARCH"""
+        P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W = _power_split(
+            self.ARCH, float(P_required_kW), float(Hp), float(self.P_GEN_kW),
+            *self.tech._split_consts)
+        return {
+            'P_GT_kW': P_GT_kW,
+            'P_EM_kW': P_EM_kW,
+            'fuel_rate_kg_s': fuel_rate_kg_s,
+            'battery_power_W': battery_power_W,
+        }
+
+    def _split_rates(self, P_required_kW: float, Hp: float) -> Tuple[float, float]:
+        """(fuel_rate_kg_s, battery_power_W) of _power_split, run as plain Python"""
+        return _power_split_py(self.ARCH, P_required_kW, Hp, self.P_GEN_kW,
+                               *self.tech._split_consts)[2:]
+
+    def _split_vec_dict(self, P_required_kW, Hp) -> Dict[str, np.ndarray]:
+        """get_power_split_vec dict from _power_split_vec (float32 inputs stay float32)"""
+        P_required_kW, Hp, _ = _split_arrays(P_required_kW, Hp)
+        P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W = _power_split_vec(
+            self.ARCH, P_required_kW, Hp, float(self.P_GEN_kW), *self.tech._split_consts)
+        return {
+            'P_GT_kW': P_GT_kW,
+            'P_EM_kW': P_EM_kW,
+            'fuel_rate_kg_s': fuel_rate_kg_s,
+            'battery_power_W': battery_power_W,
+        }
+
+    def get_power_rates(self, P_required_kW: float, Hp: float) -> Tuple[float, float]:
+        """(fuel_rate_kg_s, battery_power_W) only; subclasses override to skip the dict"""
+        power_split = self.get_power_split(P_required_kW, Hp)
+        return power_split['fuel_rate_kg_s'], power_split['battery_power_W']
+
+    def get_fuel_rate(self, P_required_kW: float, Hp: float) -> float:
+        """fuel_rate_kg_s only, for callers that integrate fuel burn alone"""
+        return self.get_power_rates(P_required_kW, Hp)[0]
+
+    def get_battery_power_W(self, P_required_kW: float, Hp: float) -> float:
+        """battery_power_W only, for callers that integrate battery energy alone"""
+        return self.get_power_rates(P_required_kW, Hp)[1]
 
     def get_total_propulsion_weight(self) -> float:
         """Total propulsion system weight (excluding fuel/battery)."""
         return self.m_GT_lb + self.m_EM_lb + self.m_GEN_lb
 
+    def component_state(self) -> np.ndarray:
+        """Component masses and powers as one row, in COMPONENT_FIELDS order"""
+        return np.array([getattr(self, name) for name in COMPONENT_FIELDS], dtype=float)
+
+    @classmethod
+    def size_components_batch(cls, tech: TechnologySpec, P_shaft_kW, Hp,
+                              **kwargs) -> np.ndarray:
+        """
+        size_components over N sizing points at once.
+
+        size_components is plain arithmetic on its inputs, so it runs once on a scratch
+        instance with array P_shaft_kW and Hp; each row equals the scalar sizing.
+
+        Args:
+            tech: Technology spec shared by all points
+            P_shaft_kW, Hp: Sizing points, arrays broadcast together (or floats)
+            **kwargs: Extra constructor arguments (e.g. num_engines)
+
+        Returns:
+            (N, len(COMPONENT_FIELDS)) array, columns in COMPONENT_FIELDS order
+        """
+        P_shaft_kW, Hp = np.broadcast_arrays(np.asarray(P_shaft_kW, dtype=float),
+                                             np.asarray(Hp, dtype=float))
+        scratch = cls(tech, **kwargs)
+        scratch.size_components(P_shaft_kW.ravel(), Hp.ravel())
+        state = np.empty((P_shaft_kW.size, len(COMPONENT_FIELDS)))
+        for j, name in enumerate(COMPONENT_FIELDS):
+            state[:, j] = getattr(scratch, name)
+        return state
+
 class ConventionalPowertrain(PowertrainBase):
     """Conventional fuel-only powertrain"""
+    __slots__ = ()
+    ARCH = _CONVENTIONAL
+
     def __init__(self, tech: TechnologySpec):
         super().__init__("Conventional", tech)
 
     def size_components(self, P_shaft_kW: float, Hp: float = 0.0):
+        if self._is_sized_for(P_shaft_kW, Hp):
+            return
         self.P_GT_kW = P_shaft_kW
-        self.m_GT_lb = (P_shaft_kW / self.tech.GT_specific_power_kW_kg) * 2.20462
+        self.m_GT_lb = P_shaft_kW * self.tech._lb_per_kW_GT
         self.m_EM_lb = 0.0
         self.m_GEN_lb = 0.0
+        self._record_sized_for(P_shaft_kW, Hp)
 
     def get_power_split(self, P_required_kW: float, Hp: float = 0.0) -> Dict:
-        fuel_rate_kg_s = (P_required_kW * self.tech.GT_BSFC_kg_kWh) / 3600
-        return {
-            'P_GT_kW': P_required_kW,
-            'P_EM_kW': 0.0,
-            'fuel_rate_kg_s': fuel_rate_kg_s,
-            'battery_power_W': 0.0,
-        }
+        return self._split_dict(P_required_kW, Hp)
+
+    def get_power_rates(self, P_required_kW: float, Hp: float = 0.0) -> Tuple[float, float]:
+        return self._split_rates(P_required_kW, Hp)
+
+    def get_power_split_vec(self, P_required_kW, Hp=0.0) -> Dict[str, np.ndarray]:
+        return self._split_vec_dict(P_required_kW, Hp)
 
 class ParallelHybridPowertrain(PowertrainBase):
     """
     Parallel Hybrid Architecture: GT and EM both connect to propeller shaft.
     Hp = P_EM / (P_EM + P_GT)
     """
+    __slots__ = ()
+    ARCH = _PARALLEL
+
     def __init__(self, tech: TechnologySpec):
         super().__init__("Parallel Hybrid", tech)
 
     def size_components(self, P_shaft_kW: float, Hp: float):
+        if self._is_sized_for(P_shaft_kW, Hp):
+            return
         self.P_EM_kW = P_shaft_kW * Hp
         self.P_GT_kW = P_shaft_kW * (1 - Hp)
-        self.m_EM_lb = (self.P_EM_kW / self.tech.EM_specific_power_kW_kg) * 2.20462
-        self.m_GT_lb = (self.P_GT_kW / self.tech.GT_specific_power_kW_kg) * 2.20462
+        self.m_EM_lb = self.P_EM_kW * self.tech._lb_per_kW_EM
+        self.m_GT_lb = self.P_GT_kW * self.tech._lb_per_kW_GT
         self.m_GEN_lb = 0.0
+        self._record_sized_for(P_shaft_kW, Hp)
 
     def get_power_split(self, P_required_kW: float, Hp: float) -> Dict:
-        P_GT_kW = P_required_kW * (1 - Hp)
-        P_EM_kW = P_required_kW * Hp
-        fuel_rate_kg_s = (P_GT_kW * self.tech.GT_BSFC_kg_kWh) / 3600
-        battery_power_W = (P_EM_kW * 1000) / self.tech.EM_efficiency
-        return {
-            'P_GT_kW': P_GT_kW,
-            'P_EM_kW': P_EM_kW,
-            'fuel_rate_kg_s': fuel_rate_kg_s,
-            'battery_power_W': battery_power_W,
-        }
+        return self._split_dict(P_required_kW, Hp)
+
+    def get_power_rates(self, P_required_kW: float, Hp: float) -> Tuple[float, float]:
+        return self._split_rates(P_required_kW, Hp)
+
+    def get_power_split_vec(self, P_required_kW, Hp) -> Dict[str, np.ndarray]:
+        return self._split_vec_dict(P_required_kW, Hp)
 
 class SerialHybridPowertrain(PowertrainBase):
     """
@@ -126,6 +432,9 @@ class SerialHybridPowertrain(PowertrainBase):
       - During cruise (Hp=0.0): Gen provides 500 kW, Battery provides 0 kW
       - During takeoff (Hp=0.5): Gen provides 500 kW, Battery adds 250 kW
     """
+    __slots__ = ()
+    ARCH = _SERIAL
+
     def __init__(self, tech: TechnologySpec):
         super().__init__("Serial Hybrid", tech)
 
@@ -137,22 +446,26 @@ class SerialHybridPowertrain(PowertrainBase):
         Motor is sized for cruise + peak battery assist.
         Hp parameter controls battery boost during high-power phases.
         """
+        if self._is_sized_for(P_shaft_kW, Hp):
+            return
+        tech = self.tech
         # Motor sized for cruise + battery boost during peaks
         self.P_EM_kW = P_shaft_kW * (1 + Hp)  # Can handle cruise + battery boost
 
         # Electric power required for cruise (through motor efficiency)
-        P_electric_cruise_kW = P_shaft_kW / self.tech.EM_efficiency
+        P_electric_cruise_kW = P_shaft_kW * tech._inv_EM_eff
 
         # Generator sized for 100% of cruise requirement (NOT reduced by Hp!)
         self.P_GEN_kW = P_electric_cruise_kW
 
         # GT sized to drive generator
-        self.P_GT_kW = self.P_GEN_kW / self.tech.GEN_efficiency
+        self.P_GT_kW = self.P_GEN_kW * tech._inv_GEN_eff
 
         # Component weights
-        self.m_EM_lb = (self.P_EM_kW / self.tech.EM_specific_power_kW_kg) * 2.20462
-        self.m_GEN_lb = (self.P_GEN_kW / self.tech.GEN_specific_power_kW_kg) * 2.20462
-        self.m_GT_lb = (self.P_GT_kW / self.tech.GT_specific_power_kW_kg) * 2.20462
+        self.m_EM_lb = self.P_EM_kW * tech._lb_per_kW_EM
+        self.m_GEN_lb = self.P_GEN_kW * tech._lb_per_kW_GEN
+        self.m_GT_lb = self.P_GT_kW * tech._lb_per_kW_GT
+        self._record_sized_for(P_shaft_kW, Hp)
 
     def get_power_split(self, P_required_kW: float, Hp: float) -> Dict:
         """
@@ -161,47 +474,48 @@ class SerialHybridPowertrain(PowertrainBase):
         Generator provides what it can (up to its rating).
         Battery supplements during high-power phases when demand exceeds generator capacity.
         """
-        P_EM_kW = P_required_kW
-        P_electric_kW = P_EM_kW / self.tech.EM_efficiency
+        # Generator provides power up to its rating (throttles down if less power needed),
+        # the battery supplements when demand exceeds generator capacity, and the GT
+        # powers the generator at the required level
+        return self._split_dict(P_required_kW, Hp)
 
-        # Generator provides power up to its rating (throttles down if less power needed)
-        P_generator_kW = min(P_electric_kW, self.P_GEN_kW)
+    def get_power_rates(self, P_required_kW: float, Hp: float) -> Tuple[float, float]:
+        """get_power_split's fuel rate and battery draw, without building the dict"""
+        return self._split_rates(P_required_kW, Hp)
 
-        # Battery supplements when demand exceeds generator capacity
-        P_battery_kW = max(0, P_electric_kW - P_generator_kW)
-
-        # GT powers the generator at the required level
-        P_GT_kW = P_generator_kW / self.tech.GEN_efficiency
-
-        fuel_rate_kg_s = (P_GT_kW * self.tech.GT_BSFC_kg_kWh) / 3600
-        battery_power_W = P_battery_kW * 1000
-
-        return {
-            'P_GT_kW': P_GT_kW,
-            'P_EM_kW': P_EM_kW,
-            'fuel_rate_kg_s': fuel_rate_kg_s,
-            'battery_power_W': battery_power_W,
-        }
+    def get_power_split_vec(self, P_required_kW, Hp) -> Dict[str, np.ndarray]:
+        """get_power_split over arrays of operating points (the generator cap is elementwise)"""
+        return self._split_vec_dict(P_required_kW, Hp)
 
 class FullyElectricPowertrain(PowertrainBase):
     """Fully electric - battery only."""
+    __slots__ = ()
+    ARCH = _FULLY_ELECTRIC
+
     def __init__(self, tech: TechnologySpec):
         super().__init__("Fully Electric", tech)
 
     def size_components(self, P_shaft_kW: float, Hp: float = 1.0):
+        if self._is_sized_for(P_shaft_kW, Hp):
+            return
         self.P_EM_kW = P_shaft_kW
-        self.m_EM_lb = (P_shaft_kW / self.tech.EM_specific_power_kW_kg) * 2.20462
+        self.m_EM_lb = P_shaft_kW * self.tech._lb_per_kW_EM
         self.m_GT_lb = 0.0
         self.m_GEN_lb = 0.0
+        self._record_sized_for(P_shaft_kW, Hp)
 
     def get_power_split(self, P_required_kW: float, Hp: float = 1.0) -> Dict:
-        battery_power_W = (P_required_kW * 1000) / self.tech.EM_efficiency
-        return {
-            'P_GT_kW': 0.0,
-            'P_EM_kW': P_required_kW,
-            'fuel_rate_kg_s': 0.0,
-            'battery_power_W': battery_power_W,
-        }
+        return self._split_dict(P_required_kW, Hp)
+
+    def get_power_rates(self, P_required_kW: float, Hp: float = 1.0) -> Tuple[float, float]:
+        return self._split_rates(P_required_kW, Hp)
+
+    def get_power_split_vec(self, P_required_kW, Hp=1.0) -> Dict[str, np.ndarray]:
+        return self._split_vec_dict(P_required_kW, Hp)
+
+# Interned display names for the usual engine counts; avoids an f-string per instance
+_MULTI_NAMES = {n: sys.intern(f"Multi-Engine ({n} engines)") for n in range(1, 9)}
+
 
 class MultiEnginePowertrain(PowertrainBase):
     """
@@ -227,8 +541,12 @@ class MultiEnginePowertrain(PowertrainBase):
       - Operating engine must provide full required power
       - Battery can boost to compensate for lost engine
     """
+    __slots__ = ('num_engines', 'P_GT_per_engine_kW', 'P_EM_per_engine_kW',
+                 'm_GT_per_engine_lb', 'm_EM_per_engine_lb')
+
     def __init__(self, tech: TechnologySpec, num_engines: int = 2):
-        super().__init__(f"Multi-Engine ({num_engines} engines)", tech)
+        name = _MULTI_NAMES.get(num_engines) or f"Multi-Engine ({num_engines} engines)"
+        super().__init__(name, tech)
         self.num_engines = num_engines
         # Per-engine powers (each engine has GT + EM)
         self.P_GT_per_engine_kW = 0.0
@@ -251,6 +569,8 @@ class MultiEnginePowertrain(PowertrainBase):
         - Each engine has: GT (1-Hp fraction) + EM (Hp fraction)
         - OEI capability: Single engine can provide full power with battery boost
         """
+        if self._is_sized_for(P_shaft_kW, Hp):
+            return
         # Power per engine (symmetric distribution)
         P_per_engine_kW = P_shaft_kW / self.num_engines
 
@@ -263,13 +583,14 @@ class MultiEnginePowertrain(PowertrainBase):
         self.P_EM_kW = self.P_EM_per_engine_kW * self.num_engines
 
         # Component masses per engine
-        self.m_GT_per_engine_lb = (self.P_GT_per_engine_kW / self.tech.GT_specific_power_kW_kg) * 2.20462
-        self.m_EM_per_engine_lb = (self.P_EM_per_engine_kW / self.tech.EM_specific_power_kW_kg) * 2.20462
+        self.m_GT_per_engine_lb = self.P_GT_per_engine_kW * self.tech._lb_per_kW_GT
+        self.m_EM_per_engine_lb = self.P_EM_per_engine_kW * self.tech._lb_per_kW_EM
 
         # Total masses (all engines)
         self.m_GT_lb = self.m_GT_per_engine_lb * self.num_engines
         self.m_EM_lb = self.m_EM_per_engine_lb * self.num_engines
         self.m_GEN_lb = 0.0  # No generator in parallel architecture
+        self._record_sized_for(P_shaft_kW, Hp)
 
     def get_power_split(self, P_required_kW: float, Hp: float, oei_mode: bool = False) -> Dict:
         """
@@ -298,22 +619,55 @@ class MultiEnginePowertrain(PowertrainBase):
         else:
             # All engines operating
             num_operating_engines = self.num_engines
-            P_per_engine_kW = P_required_kW / self.num_engines
-
-        # Power split per engine (parallel hybrid)
-        P_GT_per_engine_kW = P_per_engine_kW * (1 - Hp)
-        P_EM_per_engine_kW = P_per_engine_kW * Hp
+            P_per_engine_kW = P_required_kW / num_operating_engines
+        tech = self.tech
 
-        # Total powers
-        P_GT_total_kW = P_GT_per_engine_kW * num_operating_engines
-        P_EM_total_kW = P_EM_per_engine_kW * num_operating_engines
+        # Power split per engine (parallel hybrid), totals over the operating engines,
+        # their fuel flow and battery draw (accounting for motor efficiency)
+        (P_GT_per_engine_kW, P_EM_per_engine_kW, P_GT_total_kW, P_EM_total_kW,
+         fuel_rate_kg_s, battery_power_W) = _multi_engine_split(
+            float(P_per_engine_kW), float(Hp), num_operating_engines, tech._bsfc_per_s,
+            tech._inv_EM_eff_x1000)
 
-        # Fuel consumption (all operating GTs)
-        fuel_rate_kg_s = (P_GT_total_kW * self.tech.GT_BSFC_kg_kWh) / 3600
-
-        # Battery power (all operating EMs, accounting for motor efficiency)
-        battery_power_W = (P_EM_total_kW * 1000) / self.tech.EM_efficiency
+        return {
+            'P_GT_kW': P_GT_total_kW,
+            'P_EM_kW': P_EM_total_kW,
+            'fuel_rate_kg_s': fuel_rate_kg_s,
+            'battery_power_W': battery_power_W,
+            'num_operating_engines': num_operating_engines,
+            'P_per_engine_kW': P_per_engine_kW,
+            'P_GT_per_engine_kW': P_GT_per_engine_kW,
+            'P_EM_per_engine_kW': P_EM_per_engine_kW,
+        }
 
+    def get_power_rates(self, P_required_kW: float, Hp: float,
+                        oei_mode: bool = False) -> Tuple[float, float]:
+        """get_power_split's fuel rate and battery draw, without building the dict"""
+        if oei_mode:
+            num_operating_engines = 1
+            P_per_engine_kW = P_required_kW
+        else:
+            num_operating_engines = self.num_engines
+            P_per_engine_kW = P_required_kW / num_operating_engines
+        tech = self.tech
+        return _multi_engine_split_py(P_per_engine_kW, Hp, num_operating_engines,
+                                      tech._bsfc_per_s, tech._inv_EM_eff_x1000)[4:]
+
+    def get_power_split_vec(self, P_required_kW, Hp,
+                            oei_mode: bool = False) -> Dict[str, np.ndarray]:
+        """get_power_split over arrays of operating points (one oei_mode for all of them)"""
+        P_required_kW, Hp, _ = _split_arrays(P_required_kW, Hp)
+        if oei_mode:
+            num_operating_engines = 1
+            P_per_engine_kW = P_required_kW
+        else:
+            num_operating_engines = self.num_engines
+            P_per_engine_kW = P_required_kW / num_operating_engines
+        tech = self.tech
+        (P_GT_per_engine_kW, P_EM_per_engine_kW, P_GT_total_kW, P_EM_total_kW,
+         fuel_rate_kg_s, battery_power_W) = _multi_engine_split_py(
+            P_per_engine_kW, Hp, num_operating_engines,
+            tech._bsfc_per_s, tech._inv_EM_eff_x1000)
         return {
             'P_GT_kW': P_GT_total_kW,
             'P_EM_kW': P_EM_total_kW,
@@ -324,3 +678,94 @@ class MultiEnginePowertrain(PowertrainBase):
             'P_GT_per_engine_kW': P_GT_per_engine_kW,
             'P_EM_per_engine_kW': P_EM_per_engine_kW,
         }
+
+# Architecture name -> class, keyed as in HybridElectricAircraft.set_powertrain.
+# DualMotorDEPPowertrain lives in its own module (which imports this one) and is
+# dispatched by the aircraft.
+POWERTRAIN_REGISTRY: Dict[str, type] = {
+    'conventional': ConventionalPowertrain,
+    'parallel': ParallelHybridPowertrain,
+    'serial': SerialHybridPowertrain,
+    'electric': FullyElectricPowertrain,
+    'multi_engine': MultiEnginePowertrain,
+}
+
+# Class -> unbound get_power_split, for loops over mixed architectures:
+# SPLIT_KERNELS[type(pt)](pt, P, Hp)
+SPLIT_KERNELS = {cls: cls.get_power_split for cls in POWERTRAIN_REGISTRY.values()}
+
+
+def make_powertrain(name: str, tech: TechnologySpec, **kwargs) -> PowertrainBase:
+    """
+    Build a powertrain by architecture name.
+
+    Args:
+        name: Key of POWERTRAIN_REGISTRY (case-insensitive)
+        tech: Technology spec
+        **kwargs: Extra constructor arguments (e.g. num_engines for 'multi_engine')
+
+    Returns:
+        New, unsized powertrain instance
+    """
+    cls = POWERTRAIN_REGISTRY.get(name.lower())
+    if cls is None:
+        raise ValueError(f"Unknown architecture: {name}")
+    return cls(tech, **kwargs)
+
+
+def sweep_power_splits(arch_ids, P_required_kW, Hp, tech: TechnologySpec,
+                       P_GEN_kW=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Power split over a mixed-architecture grid, one array pass per architecture present.
+
+    Args:
+        arch_ids: Architecture tag per point (Architecture values)
+        P_required_kW: Shaft power required per point
+        Hp: Hybridization ratio per point (parallel only)
+        tech: Technology spec shared by the whole grid
+        P_GEN_kW: Generator rating per point (serial only)
+
+    Returns:
+        (P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W) arrays of the broadcast shape,
+        elementwise equal to the matching class's get_power_split_vec
+    """
+    shape = np.broadcast_shapes(np.shape(arch_ids), np.shape(P_required_kW), np.shape(Hp),
+                                np.shape(P_GEN_kW))
+    P_required_kW, Hp, zeros = _split_arrays(np.broadcast_to(P_required_kW, shape), Hp)
+    arch_ids = np.broadcast_to(np.asarray(arch_ids), shape)
+    P_GEN_kW = np.broadcast_to(np.asarray(P_GEN_kW, dtype=zeros.dtype), shape)
+    unknown = ~np.isin(arch_ids, list(Architecture))
+    if unknown.any():
+        raise ValueError(f"Unknown architecture id(s): {np.unique(arch_ids[unknown]).tolist()}")
+
+    P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W = (zeros.copy() for _ in range(4))
+
+    for arch in np.unique(arch_ids):
+        mask = arch_ids == arch
+        split = _power_split_vec(int(arch), P_required_kW[mask], Hp[mask], P_GEN_kW[mask],
+                                 *tech._split_consts)
+        P_GT_kW[mask], P_EM_kW[mask], fuel_rate_kg_s[mask], battery_power_W[mask] = split
+
+    return P_GT_kW, P_EM_kW, fuel_rate_kg_s, battery_power_W
+
+
+def size_multi_engine_grid(P_shaft_kW, Hp, tech: TechnologySpec,
+                           num_engines: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Multi-engine component masses over a full (P_shaft_kW x Hp) design grid.
+
+    Runs as one compiled, multi-threaded kernel when Numba is available (a plain
+    Python loop otherwise); use it for dense sweeps instead of sizing point by point.
+
+    Args:
+        P_shaft_kW: 1-D array of total design shaft powers (N)
+        Hp: 1-D array of hybridization ratios (M)
+        tech: Technology spec
+        num_engines: Number of engines
+
+    Returns:
+        (m_GT_lb, m_EM_lb), each (N, M), equal to MultiEnginePowertrain.size_components
+    """
+    return _size_multi_engine_grid(np.ascontiguousarray(P_shaft_kW, dtype=np.float64).ravel(),
+                                   np.ascontiguousarray(Hp, dtype=np.float64).ravel(),
+                                   num_engines, tech._lb_per_kW_GT, tech._lb_per_kW_EM)
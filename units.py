@@ -0,0 +1,17 @@
+"""
+Unit conversion and physical constants shared across the sizing modules.
+"""
+
+from typing import Final
+
+# Mass / force
+LB_TO_KG: Final = 0.453592
+KG_TO_LB: Final = 2.20462
+LB_TO_N: Final = 4.44822
+
+# Distance
+NM_TO_M: Final = 1852.0
+
+# Fuel energy: Jet-A lower heating value 43 MJ/kg = 43000/3.6 Wh/kg
+JET_A_SPECIFIC_ENERGY_WH_PER_KG: Final = 43000 / 3.6
+FUEL_ENERGY_WH_PER_LB: Final = LB_TO_KG * JET_A_SPECIFIC_ENERGY_WH_PER_KG